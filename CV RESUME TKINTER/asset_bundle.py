@@ -0,0 +1,256 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import tkinter as tk
+
+MAGIC = b"CVASSETS1\n"
+INDEX_LENGTH = struct.Struct("<Q")
+ALIGN = mmap.ALLOCATIONGRANULARITY
+ENV_VAR = "CV_RESUME_BUNDLE"
+DEFAULT_BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets.bundle")
+# Display scales packed by default (96 dpi and a typical HiDPI screen)
+DEFAULT_SCALES = (1.0, 2.0)
+
+
+def _align(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+# --- Memory-mapped Asset Bundle ---
+# One file built ahead of time by `python asset_bundle.py build`: a JSON index
+# followed by page-aligned pixel data. Display-size entries are binary PPM, so
+# Tk reads them straight into a PhotoImage (no PNG decode, no PIL); pyramid
+# levels are raw pixels that PIL wraps in place with frombuffer(). Every source
+# is recorded with its mtime and size, and an edited source stops matching, so
+# the app falls back to decoding it. With a resolver attached, the stamps come
+# from its last scan() instead of a stat() per lookup.
+class AssetBundle:
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.base_dir = os.path.dirname(self.path)
+        with open(self.path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = len(MAGIC) + INDEX_LENGTH.size
+        if self.mm[:len(MAGIC)] != MAGIC:
+            raise ValueError("%s: not an asset bundle" % path)
+        (index_length,) = INDEX_LENGTH.unpack_from(self.mm, len(MAGIC))
+        self.index = json.loads(self.mm[header:header + index_length])
+        self.data_start = _align(header + index_length)
+        self.lock = threading.Lock()
+        self.resolver = None        # AssetResolver whose scanned stamps are trusted
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    # CV_RESUME_BUNDLE=<path> picks another bundle, CV_RESUME_BUNDLE=0 disables it
+    @classmethod
+    def open(cls, path=None):
+        path = path or os.environ.get(ENV_VAR) or DEFAULT_BUNDLE_PATH
+        if path == "0" or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    # Sources are stored relative to the bundle, so bundle and assets can move together
+    def source_key(self, source_path):
+        return os.path.relpath(os.path.abspath(source_path), self.base_dir).replace(os.sep, "/")
+
+    @staticmethod
+    def entry_key(kind, source_key, size):
+        return "%s:%s:%dx%d" % (kind, source_key, size[0], size[1])
+
+    def _stamp(self, source_path):
+        known = self.resolver.files.get(os.path.abspath(source_path)) if self.resolver is not None else None
+        if known is None:
+            return _stamp(source_path)
+        size, mtime_ns = known
+        return [mtime_ns, size]
+
+    def _source(self, source_path):
+        source = self.index["sources"].get(self.source_key(source_path))
+        if source is None:
+            return None
+        if self._stamp(source_path) != source["stamp"]:
+            with self.lock:
+                self.stale += 1
+            return None
+        return source
+
+    def _count(self, found):
+        with self.lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def entry(self, kind, source_path, size):
+        entry = None
+        if self._source(source_path) is not None:
+            entry = self.index["entries"].get(self.entry_key(kind, self.source_key(source_path), size))
+        self._count(entry is not None)
+        return entry
+
+    # --- Main thread: PhotoImage straight from the mapped PPM bytes ---
+    # Pass the entry() already looked up to skip a second lookup (and its stats)
+    def photo(self, master, kind, source_path, size, entry=None):
+        if entry is None:
+            entry = self.entry(kind, source_path, size)
+        if entry is None:
+            return None
+        start = self.data_start + entry["offset"]
+        return tk.PhotoImage(master=master, data=self.mm[start:start + entry["length"]], format="ppm")
+
+    def source_size(self, source_path):
+        source = self._source(source_path)
+        return tuple(source["size"]) if source is not None else None
+
+    # Pyramid levels as PIL images backed by the mapping itself (read-only, no copy)
+    def levels(self, source_path):
+        source = self._source(source_path)
+        if source is None or not source["levels"]:
+            return None
+        from PIL import Image
+        view = memoryview(self.mm)
+        levels = []
+        for level in source["levels"]:
+            start = self.data_start + level["offset"]
+            levels.append(Image.frombuffer(level["mode"], tuple(level["size"]),
+                                           view[start:start + level["length"]], "raw", level["mode"], 0, 1))
+        return levels
+
+    def stats(self):
+        with self.lock:
+            return {
+                "path": self.path,
+                "bytes": len(self.mm),
+                "entries": len(self.index["entries"]),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_lookups": self.stale,
+            }
+
+
+# --- Build step ---
+# Packs the resume's photo at every given display scale and its experience
+# images at every width step the app can choose at scale 1, plus the default
+# box at the other scales. Any other size is resampled from the bundled
+# pyramid levels (up to MAX_BOX), which still skips the PNG decode.
+def build_bundle(output=DEFAULT_BUNDLE_PATH, resume_path=None, scales=DEFAULT_SCALES):
+    from asset_resolver import AssetResolver
+    from image_pyramid import (IMAGE_SIZE_STEP, MAX_BOX, MAX_EXPERIENCE_WIDTH, MIN_EXPERIENCE_WIDTH,
+                               ImagePyramid)
+    from resume_data import DEFAULT_RESUME_PATH, load_resume
+
+    resume = load_resume(resume_path)
+    assets = AssetResolver.for_resume(resume_path or DEFAULT_RESUME_PATH)
+    pyramid = ImagePyramid()
+    base_dir = os.path.dirname(os.path.abspath(output))
+    blobs = []
+    offset = 0
+    index = {"version": 1, "sources": {}, "entries": {}}
+
+    def add_blob(data):
+        nonlocal offset
+        blobs.append((offset, data))
+        start = offset
+        offset = _align(offset + len(data))
+        return start
+
+    def add_source(source_path):
+        source_key = os.path.relpath(os.path.abspath(source_path), base_dir).replace(os.sep, "/")
+        if source_key not in index["sources"]:
+            levels = []
+            for level in pyramid.levels(source_path):
+                if level.width <= MAX_BOX[0] and level.height <= MAX_BOX[1]:
+                    data = level.tobytes()
+                    levels.append({"offset": add_blob(data), "length": len(data), "mode": level.mode,
+                                   "size": list(level.size)})
+            index["sources"][source_key] = {"stamp": _stamp(source_path), "size": list(pyramid.source_size(source_path)),
+                                            "levels": levels}
+        return source_key
+
+    def add_entry(kind, source_path, image):
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        data = b"P6\n%d %d\n255\n" % image.size + image.tobytes()
+        key = AssetBundle.entry_key(kind, add_source(source_path), image.size)
+        index["entries"][key] = {"offset": add_blob(data), "length": len(data)}
+
+    photo_path = assets.resolve(resume["profile"]["photo"])
+    if photo_path is not None:
+        for scale in scales:
+            side = int(round(100 * scale))
+            add_entry("photo", photo_path, pyramid.resize(photo_path, (side, side)))
+
+    sources = [assets.resolve(name) for name in resume["experience"]["images"]]
+    widths = set(range(MIN_EXPERIENCE_WIDTH, MAX_EXPERIENCE_WIDTH + 1, IMAGE_SIZE_STEP))
+    # The default box used before the canvas width is known
+    widths.update(int(400 * scale) for scale in scales)
+    for source_path in dict.fromkeys(source for source in sources if source):
+        for width in sorted(widths):
+            height = width * 3 // 4
+            add_entry("letterbox", source_path, pyramid.letterbox(source_path, width, height))
+
+    index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    data_start = _align(len(MAGIC) + INDEX_LENGTH.size + len(index_data))
+    tmp_path = "%s.%d.tmp" % (output, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + INDEX_LENGTH.pack(len(index_data)) + index_data)
+        for blob_offset, data in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(data)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, output)
+    return index
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Build or inspect the pre-resized asset bundle.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="pack the resume's images at every display size")
+    build.add_argument("resume", nargs="?", help="resume JSON file (default: resume.json)")
+    build.add_argument("-o", "--output", default=DEFAULT_BUNDLE_PATH)
+    build.add_argument("--scales", default=",".join("%g" % s for s in DEFAULT_SCALES),
+                       help="comma-separated display scales (default: %(default)s)")
+    info = sub.add_parser("info", help="list a bundle's sources and entries")
+    info.add_argument("path", nargs="?", default=DEFAULT_BUNDLE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        scales = tuple(float(scale) for scale in args.scales.split(","))
+        index = build_bundle(args.output, args.resume, scales)
+        print("%s: %d sources, %d entries, %.1f MB in %.1f s"
+              % (args.output, len(index["sources"]), len(index["entries"]),
+                 os.path.getsize(args.output) / 1e6, time.perf_counter() - start))
+        return 0
+
+    bundle = AssetBundle.open(args.path)
+    if bundle is None:
+        print("%s: no readable bundle" % args.path, file=sys.stderr)
+        return 1
+    for source_key, source in sorted(bundle.index["sources"].items()):
+        fresh = _stamp(os.path.join(bundle.base_dir, source_key)) == source["stamp"]
+        print("%s %dx%d, %d levels%s" % (source_key, source["size"][0], source["size"][1],
+                                         len(source["levels"]), "" if fresh else " (stale)"))
+    print("%d entries, %.1f MB" % (len(bundle.index["entries"]), len(bundle.mm) / 1e6))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
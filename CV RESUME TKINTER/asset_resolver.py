@@ -0,0 +1,171 @@
+import json
+import os
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(APP_DIR, "assets.json")
+
+
+# --- Logical asset names used by a resume (photo first, then experience images) ---
+def resume_assets(resume):
+    names = [resume["profile"]["photo"]] + list(resume["experience"]["images"])
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def load_manifest(path=DEFAULT_MANIFEST_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print("Ignoring asset manifest %s: %s" % (path, e), file=sys.stderr)
+        return {}
+
+
+# --- Asset Resolver ---
+# Maps the logical names used in the resume to files. The manifest (assets.json)
+# lists, per name, candidate files in order of preference (e.g. a user-supplied
+# replacement before the stock image); names it does not list stand for
+# themselves. Candidates are looked up in the resume's directory, then in the
+# manifest's search paths, which are anchored to this package rather than the
+# working directory. One scandir() pass over those directories at startup
+# records every file with its size and mtime, so resolving is a dict lookup
+# instead of a chain of exists() probes; scan() again to pick up new files.
+class AssetResolver:
+    # Relative manifest search paths are taken from base_dir (the manifest's directory)
+    def __init__(self, manifest=None, search_paths=(), base_dir=APP_DIR):
+        self.manifest = manifest or {}
+        paths = [os.path.abspath(path) for path in search_paths]
+        paths += [os.path.join(base_dir, path) for path in self.manifest.get("search_paths", ["."])]
+        self.search_paths = list(dict.fromkeys(os.path.normpath(path) for path in paths))
+        self.files = {}             # absolute path -> (size, mtime_ns)
+        self.scanned = set()        # directories covered by the last scan()
+        self.scan_ms = 0.0
+        self.scan()
+
+    @classmethod
+    def for_resume(cls, resume_path=None, manifest_path=DEFAULT_MANIFEST_PATH):
+        search_paths = [os.path.dirname(os.path.abspath(resume_path))] if resume_path else []
+        return cls(load_manifest(manifest_path), search_paths, os.path.dirname(os.path.abspath(manifest_path)))
+
+    def candidates(self, name):
+        return self.manifest.get("assets", {}).get(name, [name])
+
+    # Every path a name could resolve to, most preferred first
+    def candidate_paths(self, name):
+        paths = []
+        for candidate in self.candidates(name):
+            if os.path.isabs(candidate):
+                paths.append(os.path.normpath(candidate))
+            else:
+                paths.extend(os.path.normpath(os.path.join(directory, candidate))
+                             for directory in self.search_paths)
+        return list(dict.fromkeys(paths))
+
+    # --- The batched stat pass: one scandir per directory any candidate can live in ---
+    def scan(self):
+        start = time.perf_counter()
+        names = set(self.manifest.get("assets", {}))
+        for candidates in self.manifest.get("assets", {}).values():
+            names.update(candidates)
+        directories = set(self.search_paths)
+        for name in names:
+            directories.update(os.path.dirname(path) for path in self.candidate_paths(name))
+        files = {}
+        for directory in directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            st = entry.stat()
+                            files[os.path.join(directory, entry.name)] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue
+        self.files = files
+        self.scanned = directories
+        self.scan_ms = (time.perf_counter() - start) * 1000
+        return files
+
+    # Path of the first candidate that exists (None when there is none)
+    def resolve(self, name):
+        for path in self.candidate_paths(name):
+            if path in self.files:
+                return path
+            if os.path.dirname(path) not in self.scanned and os.path.isfile(path):
+                # Outside the scanned directories (e.g. an absolute path set in the resume)
+                st = os.stat(path)
+                self.files[path] = (st.st_size, st.st_mtime_ns)
+                return path
+        return None
+
+    # --- Preflight: missing and oversized assets ---
+    def preflight(self, names, check_dimensions=True):
+        max_bytes = self.manifest.get("max_file_bytes")
+        max_dimension = self.manifest.get("max_dimension")
+        report = {"search_paths": self.search_paths, "scan_ms": round(self.scan_ms, 3),
+                  "resolved": {}, "missing": [], "oversized": []}
+        for name in names:
+            path = self.resolve(name)
+            if path is None:
+                report["missing"].append({"name": name, "candidates": self.candidate_paths(name)})
+                continue
+            report["resolved"][name] = path
+            size = self.files[path][0]
+            problems = []
+            if max_bytes and size > max_bytes:
+                problems.append("%d bytes > %d" % (size, max_bytes))
+            if check_dimensions and max_dimension:
+                try:
+                    from PIL import Image
+                    with Image.open(path) as image:
+                        width, height = image.size
+                except (ImportError, OSError):
+                    width = height = 0
+                if max(width, height) > max_dimension:
+                    problems.append("%dx%d > %d px" % (width, height, max_dimension))
+            if problems:
+                report["oversized"].append({"name": name, "path": path, "problems": problems})
+        return report
+
+    # Startup check without decoding anything: only missing files are reported
+    def warn_missing(self, names):
+        for entry in self.preflight(names, check_dimensions=False)["missing"]:
+            print("Missing asset %s (looked for %s)" % (entry["name"], ", ".join(entry["candidates"])),
+                  file=sys.stderr)
+
+
+def main(argv=None):
+    import argparse
+    from resume_data import ResumeDataError, load_resume
+
+    parser = argparse.ArgumentParser(description="Report missing or oversized resume assets.")
+    parser.add_argument("resume", nargs="?", help="resume JSON file (default: resume.json)")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    try:
+        resume = load_resume(args.resume)
+    except (ResumeDataError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    resolver = AssetResolver.for_resume(args.resume, args.manifest)
+    report = resolver.preflight(resume_assets(resume))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("Searched %s (%d files, %.2f ms)" % (", ".join(report["search_paths"]), len(resolver.files),
+                                                 report["scan_ms"]))
+        for name, path in report["resolved"].items():
+            print("ok       %s -> %s" % (name, path))
+        for entry in report["oversized"]:
+            print("OVERSIZE %s (%s)" % (entry["name"], "; ".join(entry["problems"])))
+        for entry in report["missing"]:
+            print("MISSING  %s (looked for %s)" % (entry["name"], ", ".join(entry["candidates"])))
+    return 1 if report["missing"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
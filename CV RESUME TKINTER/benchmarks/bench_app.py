@@ -0,0 +1,284 @@
+# --- ResumeApp benchmark suite ---
+# python benchmarks/bench_app.py [-o bench_results.json] [--save-baseline]
+# Runs under $DISPLAY or a private Xvfb, writes every metric to a JSON file and
+# exits non-zero when a metric regresses past the threshold against baseline.json.
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25        # 25% slower than the baseline counts as a regression
+SETTLE_TIMEOUT_S = 10.0
+
+
+# --- Virtual X server ---
+# Reuses $DISPLAY when there is one, otherwise starts Xvfb on the first free
+# display number and stops it again on exit.
+def start_xvfb(screen="1280x1024x24"):
+    if os.environ.get("DISPLAY"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        sys.exit("No $DISPLAY and Xvfb is not installed (apt install xvfb).")
+    for number in range(90, 140):
+        if os.path.exists("/tmp/.X%d-lock" % number):
+            continue
+        process = subprocess.Popen([xvfb, ":%d" % number, "-screen", "0", screen, "-nolisten", "tcp"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if os.path.exists("/tmp/.X11-unix/X%d" % number):
+                os.environ["DISPLAY"] = ":%d" % number
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+        process.kill()
+    sys.exit("Could not start Xvfb.")
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "n": len(samples),
+        "min": round(samples[0], 3),
+        "median": round(statistics.median(samples), 3),
+        "mean": round(statistics.fmean(samples), 3),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "max": round(samples[-1], 3),
+    }
+
+
+# --- One app instance: construct, show the first frame, wait for background work ---
+def construct_app(**app_options):
+    import tkinter as tk
+    from main import ResumeApp
+
+    start = time.perf_counter()
+    root = tk.Tk()
+    root.geometry("1000x800+0+0")
+    app = ResumeApp(root, **app_options)
+    root.update()
+    construct_ms = (time.perf_counter() - start) * 1000
+
+    # Settled: every image decode has landed and every tab has been prebuilt
+    deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+    while (app.image_loader.pending or len(app.tab_frames) < len(app.tab_builders)) \
+            and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.001)
+    root.update()
+    settled_ms = (time.perf_counter() - start) * 1000
+    return root, app, construct_ms, settled_ms
+
+
+def destroy_app(root, app):
+    app.image_loader.shutdown()
+    root.destroy()
+
+
+# --- Cold start: fresh interpreter and empty caches, one child process per sample ---
+def child_cold_start():
+    import_start = time.perf_counter()
+    import main  # noqa: F401
+    import_ms = (time.perf_counter() - import_start) * 1000
+    root, app, construct_ms, settled_ms = construct_app()
+    destroy_app(root, app)
+    print(json.dumps({"import_ms": import_ms, "construct_ms": construct_ms, "settled_ms": settled_ms}))
+
+
+def bench_cold(repeat):
+    samples = {"import_ms": [], "construct_ms": [], "settled_ms": []}
+    for _ in range(repeat):
+        cache_dir = tempfile.mkdtemp(prefix="cv_resume_bench_")
+        try:
+            env = dict(os.environ, CV_RESUME_CACHE_DIR=cache_dir)
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child-cold-start"],
+                                    cwd=APP_DIR, env=env, check=True, capture_output=True, text=True).stdout
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        result = json.loads(output.strip().splitlines()[-1])
+        for name in samples:
+            samples[name].append(result[name])
+    return {"cold_" + name: summarize(values) for name, values in samples.items()}
+
+
+# --- Warm start: same process, thumbnail and snapshot caches already populated ---
+def bench_warm(repeat):
+    destroy_app(*construct_app()[:2])     # populate the caches
+    construct, settled = [], []
+    for _ in range(repeat):
+        root, app, construct_ms, settled_ms = construct_app()
+        destroy_app(root, app)
+        construct.append(construct_ms)
+        settled.append(settled_ms)
+    return {"warm_construct_ms": summarize(construct), "warm_settled_ms": summarize(settled)}
+
+
+# --- show_tab latency per tab (tabs already built, switching only) ---
+def bench_show_tab(root, app, repeat):
+    results = {}
+    tab_names = list(app.tab_builders)
+    for tab_name in tab_names:
+        other = tab_names[0] if tab_name != tab_names[0] else tab_names[1]
+        samples = []
+        for _ in range(repeat):
+            app.show_tab(other)
+            root.update()
+            start = time.perf_counter()
+            app.show_tab(tab_name)
+            root.update_idletasks()
+            samples.append((time.perf_counter() - start) * 1000)
+        results["show_tab_%s_ms" % tab_name.lower()] = summarize(samples)
+    return results
+
+
+# --- Canvas yview scroll throughput over the tallest tab ---
+def bench_scroll(root, app, steps):
+    tallest = max(app.tab_frames, key=lambda name: app.tab_frames[name].winfo_reqheight())
+    app.show_tab(tallest)
+    root.update()
+    samples = []
+    start = time.perf_counter()
+    for step in range(steps):
+        fraction = (step % 100) / 100
+        step_start = time.perf_counter()
+        app.canvas.yview_moveto(fraction if (step // 100) % 2 == 0 else 1 - fraction)
+        root.update_idletasks()
+        samples.append((time.perf_counter() - step_start) * 1000)
+    elapsed = time.perf_counter() - start
+    app.canvas.yview_moveto(0)
+    return {
+        "scroll_step_ms": summarize(samples),
+        "scroll_steps_per_s": {"value": round(steps / elapsed, 1), "better": "higher", "tab": tallest},
+    }
+
+
+# --- Resize sweep: drive the Configure handlers directly, as a window drag would ---
+def bench_resize(root, app, repeat):
+    widths = list(range(400, 1401, 20))
+    samples = []
+    for _ in range(repeat):
+        for width in widths + widths[::-1]:
+            start = time.perf_counter()
+            app.on_canvas_configure(SimpleNamespace(width=width, height=800))
+            app.on_info_frame_resize(SimpleNamespace(width=width - 160, height=200))
+            root.update_idletasks()
+            samples.append((time.perf_counter() - start) * 1000)
+    return {"resize_step_ms": summarize(samples)}
+
+
+# --- Baseline comparison ---
+# Timing metrics compare their median (lower is better); throughput metrics
+# compare "value" (higher is better). A baseline entry may carry its own
+# "threshold" to loosen or tighten a noisy metric.
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, base in baseline.get("metrics", {}).items():
+        current = results["metrics"].get(name)
+        if current is None:
+            continue
+        limit = base.get("threshold", threshold)
+        if base.get("better") == "higher":
+            old, new = base["value"], current["value"]
+            regressed = new < old * (1 - limit)
+        else:
+            old, new = base["median"], current["median"]
+            regressed = new > old * (1 + limit)
+        change = (new - old) / old if old else 0.0
+        results["comparison"][name] = {"baseline": old, "current": new, "change": round(change, 4),
+                                       "threshold": limit, "regressed": regressed}
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def run(args):
+    os.chdir(APP_DIR)
+    sys.path.insert(0, APP_DIR)
+    xvfb = start_xvfb()
+    try:
+        metrics = {}
+        metrics.update(bench_cold(args.cold_repeat))
+        metrics.update(bench_warm(args.repeat))
+        root, app, _, _ = construct_app()
+        try:
+            metrics.update(bench_show_tab(root, app, args.repeat))
+            metrics.update(bench_scroll(root, app, args.scroll_steps))
+            metrics.update(bench_resize(root, app, max(1, args.repeat // 5)))
+            tk_version = root.tk.call("info", "patchlevel")
+        finally:
+            destroy_app(root, app)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "tk_version": tk_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "display": "xvfb" if xvfb is not None else "existing",
+        "metrics": metrics,
+        "comparison": {},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ResumeApp under a real or virtual X server.")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="results JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default 0.25)")
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    parser.add_argument("--cold-repeat", type=int, default=5)
+    parser.add_argument("--scroll-steps", type=int, default=1000)
+    parser.add_argument("--child-cold-start", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child_cold_start:
+        sys.path.insert(0, APP_DIR)
+        child_cold_start()
+        return 0
+
+    output = os.path.abspath(args.output)
+    args.baseline = os.path.abspath(args.baseline)
+    results = run(args)
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    results["regressions"] = regressions
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    for name, metric in results["metrics"].items():
+        value = metric.get("median", metric.get("value"))
+        note = ""
+        if name in results["comparison"]:
+            note = " (%+.1f%% vs baseline%s)" % (results["comparison"][name]["change"] * 100,
+                                                 ", REGRESSED" if name in regressions else "")
+        print("%-28s %10.3f%s" % (name, value, note))
+    if regressions:
+        print("%d metric(s) regressed beyond the threshold: %s" % (len(regressions), ", ".join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# --- Startup import-time report ---
+# python benchmarks/import_budget.py [--runs 5] [--budget import_budget.json] [-o report.json]
+# Imports main in fresh interpreters under -X importtime, reports the median
+# self and cumulative time of every module, and exits non-zero when the total,
+# a budgeted module, or a module that must stay deferred breaks the budget.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+ENTRY_MODULE = "main"
+
+
+# "import time: self [us] | cumulative | imported package" -> [(name, depth, self_us, cumulative_us)]
+def parse_importtime(stderr):
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return modules
+
+
+def measure_once(module=ENTRY_MODULE):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                            cwd=APP_DIR, capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+# Median per module over `runs` fresh interpreters (after one run that warms the bytecode cache)
+def measure(runs=5, module=ENTRY_MODULE):
+    measure_once(module)
+    samples = {}
+    depths = {}
+    for _ in range(runs):
+        for name, depth, self_us, cumulative_us in measure_once(module):
+            samples.setdefault(name, []).append((self_us, cumulative_us))
+            depths.setdefault(name, depth)
+    modules = {}
+    for name, values in samples.items():
+        modules[name] = {
+            "depth": depths[name],
+            "self_ms": round(statistics.median(v[0] for v in values) / 1000, 3),
+            "cumulative_ms": round(statistics.median(v[1] for v in values) / 1000, 3),
+        }
+    return modules
+
+
+def check_budget(modules, budget, module=ENTRY_MODULE):
+    failures = []
+    total = modules.get(module, {}).get("cumulative_ms", 0.0)
+    if total > budget.get("total_ms", float("inf")):
+        failures.append("%s: %.1f ms total, budget %.1f ms" % (module, total, budget["total_ms"]))
+    for name, limit in budget.get("modules", {}).items():
+        if name in modules and modules[name]["cumulative_ms"] > limit:
+            failures.append("%s: %.1f ms, budget %.1f ms" % (name, modules[name]["cumulative_ms"], limit))
+    for name in budget.get("deferred", []):
+        if name in modules:
+            failures.append("%s: imported at startup, should load on first use" % name)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure startup import time against a budget.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", default=DEFAULT_BUDGET)
+    parser.add_argument("--top", type=int, default=15, help="modules to list, by cumulative time")
+    parser.add_argument("-o", "--output", help="write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    modules = measure(args.runs)
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+    failures = check_budget(modules, budget)
+
+    total = modules.get(ENTRY_MODULE, {}).get("cumulative_ms", 0.0)
+    print("import %s: %.1f ms (budget %s ms, median of %d runs)"
+          % (ENTRY_MODULE, total, budget.get("total_ms", "-"), args.runs))
+    print("%10s %10s  module" % ("self ms", "cumul ms"))
+    ranked = sorted(modules.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+    for name, stats in ranked[:args.top]:
+        print("%10.2f %10.2f  %s%s" % (stats["self_ms"], stats["cumulative_ms"], "  " * stats["depth"], name))
+    for failure in failures:
+        print("OVER BUDGET  " + failure)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"total_ms": total, "budget": budget, "failures": failures, "modules": modules}, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
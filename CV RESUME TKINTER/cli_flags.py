@@ -0,0 +1,30 @@
+import os
+import sys
+
+# Values that turn an opt-in feature off, or on with its default output file
+OFF_VALUES = ("", "0", "false", "no", "off")
+ON_VALUES = ("1", "true", "yes", "on")
+
+
+def _output(value, default):
+    if value.lower() in OFF_VALUES:
+        return None
+    if value.lower() in ON_VALUES:
+        return default
+    return value
+
+
+# --- Opt-in diagnostics: ENV_VAR=<path|1|0> or --flag[=<path>] ---
+# Returns the output path, or None when the feature stays off. The command line
+# wins over the environment; a bare --flag (or --flag=) keeps a path set in the
+# environment and otherwise uses `default`.
+def parse_output_flag(env_var, flag, default, argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    output_path = _output(os.environ.get(env_var, ""), default)
+    for arg in argv:
+        if arg == flag:
+            output_path = output_path or default
+        elif arg.startswith(flag + "="):
+            value = arg.split("=", 1)[1]
+            output_path = _output(value, default) if value else default
+    return output_path
@@ -0,0 +1,22 @@
+import importlib
+import sys
+import threading
+
+# Heavy modules kept off the startup path: each is imported where it is first
+# used (the image workers, the link opener), and preload() warms them on a
+# daemon thread once the first frame is on screen.
+HEAVY_MODULES = ("PIL.Image", "PIL.ImageTk", "webbrowser")
+
+
+def preload(names=HEAVY_MODULES):
+    def run():
+        for name in names:
+            if name not in sys.modules:
+                try:
+                    importlib.import_module(name)
+                except ImportError:
+                    pass
+
+    thread = threading.Thread(target=run, name="preload-imports", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,173 @@
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+
+ENV_VAR = "CV_RESUME_WATCH"
+FLAG = "--watch"
+
+# inotify event bits (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")     # wd, mask, cookie, len
+
+
+def _load_inotify():
+    if not hasattr(os, "O_CLOEXEC"):
+        return None
+    # Imported here: ctypes.util pulls in subprocess, and --watch is opt-in
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+# Enabled by CV_RESUME_WATCH=1 or --watch; CV_RESUME_WATCH=poll forces the polling backend
+def watch_mode(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    mode = os.environ.get(ENV_VAR) or None
+    if FLAG in argv:
+        mode = mode or "1"
+    if mode in (None, "0"):
+        return None
+    return "polling" if mode == "poll" else "auto"
+
+
+# --- File Watcher ---
+# Watches a set of files from a background thread and reports which of them
+# changed. On Linux the files' directories are watched with inotify (through
+# ctypes, so editors that save by renaming a temp file over the original are
+# seen too); elsewhere, or when inotify is unavailable, every file is stat()ed
+# every `poll_interval` seconds. Bursts of events within `settle_ms` are merged
+# into one batch. Batches are queued as (paths, first_event_time) for the Tk
+# thread to drain with get_changes().
+class FileWatcher:
+    def __init__(self, paths=(), settle_ms=50, poll_interval=0.25, use_inotify=True):
+        self.settle_s = settle_ms / 1000
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.paths = set()
+        self.changes = queue.Queue()
+        self.running = False
+        self.thread = None
+        self.libc = _load_inotify() if use_inotify else None
+        self.fd = None
+        self.watches = {}           # directory -> watch descriptor
+        self.backend = "polling"
+        if self.libc is not None:
+            fd = self.libc.inotify_init1(os.O_CLOEXEC)
+            if fd >= 0:
+                self.fd = fd
+                self.backend = "inotify"
+        self.set_paths(paths)
+
+    def set_paths(self, paths):
+        paths = {os.path.abspath(path) for path in paths if path}
+        with self.lock:
+            self.paths = paths
+            self.stamps = {path: self._stamp(path) for path in paths}
+            if self.fd is not None:
+                for directory in {os.path.dirname(path) for path in paths} - set(self.watches):
+                    wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+                    if wd >= 0:
+                        self.watches[directory] = wd
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        target = self._run_inotify if self.fd is not None else self._run_polling
+        self.thread = threading.Thread(target=target, name="file-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+            self.thread = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    # Only paths whose mtime/size really moved are reported (drops touch-less ATTRIB noise)
+    def _changed(self, candidates):
+        changed = set()
+        with self.lock:
+            for path in candidates & self.paths:
+                stamp = self._stamp(path)
+                if stamp != self.stamps.get(path):
+                    self.stamps[path] = stamp
+                    changed.add(path)
+        return changed
+
+    def _emit(self, changed, detected_at):
+        if changed:
+            self.changes.put((changed, detected_at))
+
+    def _run_polling(self):
+        while self.running:
+            time.sleep(self.poll_interval)
+            with self.lock:
+                paths = set(self.paths)
+            self._emit(self._changed(paths), time.time())
+
+    def _read_events(self):
+        data = os.read(self.fd, 64 * 1024)
+        with self.lock:
+            directories = {wd: directory for directory, wd in self.watches.items()}
+        names = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in directories and name:
+                names.add(os.path.join(directories[wd], os.fsdecode(name)))
+        return names
+
+    def _run_inotify(self):
+        while self.running:
+            ready, _, _ = select.select([self.fd], [], [], 0.2)
+            if not ready:
+                continue
+            detected_at = time.time()
+            candidates = self._read_events()
+            # Let the rest of a save (truncate, write, close, rename) arrive first
+            deadline = time.monotonic() + self.settle_s
+            while self.running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([self.fd], [], [], remaining)[0]:
+                    break
+                candidates |= self._read_events()
+            self._emit(self._changed(candidates), detected_at)
+
+    # Drained by the Tk thread; returns [(paths, detected_at), ...]
+    def get_changes(self):
+        batches = []
+        while True:
+            try:
+                batches.append(self.changes.get_nowait())
+            except queue.Empty:
+                return batches
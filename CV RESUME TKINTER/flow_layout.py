@@ -0,0 +1,117 @@
+# --- Flow Layout ---
+# Places an arbitrary number of tag widgets left to right inside a frame and
+# wraps them onto new lines at the frame's current width. Tag sizes are read
+# from Tk once and cached; on resize every position is recomputed in Python
+# (cheap), but only tags whose position actually changed are re-placed, and
+# all of those moves go to Tcl as a single script.
+#
+# Works on Tcl path names, so it can manage widgets created by BulkBuilder.
+class FlowLayout:
+    def __init__(self, master, frame_path, tag_paths=(), padx=5, pady=5):
+        self.master = master
+        self.tk = master.tk
+        self.frame_path = str(frame_path)
+        self.paths = []
+        self.padx = padx
+        self.pady = pady
+        self.sizes = {}         # path -> (reqwidth, reqheight)
+        self.positions = {}     # path -> (x, y)
+        self.hidden = set()     # paths that keep their place in the order but take no space
+        self.width = None
+        self.height = None
+        self.reflow_id = None
+        self.reflows = 0
+        self.moves = 0
+        self.configure_command = master.register(self._on_configure)
+        self.tk.call("bind", self.frame_path, "<Configure>", "+%s %%w" % self.configure_command)
+        self.add(tag_paths)
+
+    def add(self, paths):
+        self.paths.extend(str(path) for path in paths)
+        self.schedule_reflow()
+
+    def remove(self, path):
+        path = str(path)
+        self.paths.remove(path)
+        self.sizes.pop(path, None)
+        self.hidden.discard(path)
+        if self.positions.pop(path, None) is not None:
+            self.tk.call("place", "forget", path)
+        self.schedule_reflow()
+
+    def set_hidden(self, path, hidden):
+        path = str(path)
+        if hidden == (path in self.hidden):
+            return
+        if hidden:
+            self.hidden.add(path)
+        else:
+            self.hidden.discard(path)
+        self.schedule_reflow()
+
+    # Call after changing a tag's text or style so its size is measured again
+    def invalidate(self, path=None):
+        if path is None:
+            self.sizes.clear()
+        else:
+            self.sizes.pop(str(path), None)
+        self.schedule_reflow()
+
+    def _on_configure(self, width):
+        width = int(width)
+        if width != self.width:
+            self.width = width
+            self.schedule_reflow()
+
+    def schedule_reflow(self):
+        if self.reflow_id is None and self.width:
+            self.reflow_id = self.master.after_idle(self.reflow)
+
+    def reflow(self):
+        self.reflow_id = None
+        if not self.width or not int(self.tk.call("winfo", "exists", self.frame_path)):
+            return
+        self.reflows += 1
+        for path in self.paths:
+            if path not in self.sizes:
+                self.sizes[path] = (int(self.tk.call("winfo", "reqwidth", path)),
+                                    int(self.tk.call("winfo", "reqheight", path)))
+
+        script = []
+        x = y = line_height = 0
+        for path in self.paths:
+            if path in self.hidden:
+                if self.positions.pop(path, None) is not None:
+                    script.append("place forget %s" % path)
+                continue
+            width, height = self.sizes[path]
+            if x > 0 and x + width > self.width:
+                # Wrap onto the next line
+                x = 0
+                y += line_height + self.pady
+                line_height = 0
+            if self.positions.get(path) != (x, y):
+                self.positions[path] = (x, y)
+                script.append("place %s -x %d -y %d" % (path, x, y))
+            x += width + self.padx
+            line_height = max(line_height, height)
+
+        self.moves += len(script)
+        total_height = max(1, y + line_height)
+        if total_height != self.height:
+            self.height = total_height
+            script.append("%s configure -height %d" % (self.frame_path, total_height))
+        if script:
+            self.tk.eval("\n".join(script))
+
+    # The registered <Configure> command refers back to this layout: delete it with the frame
+    def dispose(self):
+        if self.reflow_id is not None:
+            self.master.after_cancel(self.reflow_id)
+            self.reflow_id = None
+        if self.configure_command is not None:
+            self.master.deletecommand(self.configure_command)
+            self.configure_command = None
+
+    def stats(self):
+        return {"tags": len(self.paths), "hidden": len(self.hidden), "reflows": self.reflows, "moves": self.moves}
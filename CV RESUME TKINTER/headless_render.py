@@ -0,0 +1,474 @@
+import argparse
+import functools
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image, ImageDraw, ImageFont
+
+from asset_resolver import AssetResolver
+from resume_data import ResumeDataError, load_resume
+from theme import (ALT_BG_COLOR, BG_COLOR, BORDER_COLOR, BUTTON_BG_LIGHT, BUTTON_FG_DARK, IMAGE_BG_COLOR,
+                   LIGHT_TEXT_COLOR, PRIMARY_COLOR, TAG_BG_LIGHT, TEXT_COLOR)
+
+PAGE_WIDTH = 1000
+MARGIN = 20
+CARD_PADDING = 20
+TAB_NAMES = ["Experience", "Projects", "Skills", "Education"]
+
+FONT_CANDIDATES = {
+    False: ["arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"],
+    True: ["arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"],
+}
+_font_cache = {}
+
+
+# --- Fonts: Tk point sizes are roughly 4/3 pixels at 96 dpi ---
+def get_font(points, bold=False, italic=False):
+    key = (points, bold, italic)
+    if key in _font_cache:
+        return _font_cache[key]
+    size = int(round(points * 4 / 3))
+    font = None
+    for name in FONT_CANDIDATES[bold]:
+        try:
+            font = ImageFont.truetype(name, size)
+            break
+        except OSError:
+            continue
+    if font is None:
+        try:
+            font = ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1 only ships a fixed-size bitmap font
+            font = ImageFont.load_default()
+    _font_cache[key] = font
+    return font
+
+
+def line_height(font):
+    ascent, descent = font.getmetrics()
+    return ascent + descent
+
+
+def wrap_text(text, font, width):
+    # Measure each word once and add up widths instead of re-measuring the growing line
+    space = font.getlength(" ")
+    lines = []
+    for paragraph in text.split("\n"):
+        line, line_width = [], 0
+        for word in paragraph.split():
+            word_width = font.getlength(word)
+            if line and line_width + space + word_width > width:
+                lines.append(" ".join(line))
+                line, line_width = [], 0
+            line_width += (space if line else 0) + word_width
+            line.append(word)
+        lines.append(" ".join(line))
+    return lines
+
+
+# --- Page Renderer ---
+# Draws the same sections ResumeApp builds, top to bottom, onto a tall canvas
+# that is cropped to the used height at the end. Every tab is rendered in turn
+# since a static image cannot switch tabs. Asset names are resolved the same
+# way as in the app (assets.json candidates, see asset_resolver.py).
+class ResumeRenderer:
+    def __init__(self, resume, assets=None, width=PAGE_WIDTH, background=BG_COLOR):
+        self.resume = resume
+        self.assets = assets or AssetResolver.for_resume()
+        self.width = width
+        self.background = background
+        self.image = Image.new("RGB", (width, 2000), background)
+        self.draw = ImageDraw.Draw(self.image)
+        self.y = 0
+
+    def ensure_height(self, needed):
+        if self.y + needed <= self.image.height:
+            return
+        grown = Image.new("RGB", (self.width, max(self.image.height * 2, self.y + needed)), self.background)
+        grown.paste(self.image, (0, 0))
+        self.image = grown
+        self.draw = ImageDraw.Draw(self.image)
+
+    # A name with no existing candidate raises like a missing file, so callers draw their fallback
+    def asset_path(self, name):
+        path = self.assets.resolve(name)
+        if path is None:
+            raise FileNotFoundError("no file for asset %r" % name)
+        return path
+
+    def text(self, x, text, font, fill=TEXT_COLOR, width=None):
+        lines = wrap_text(text, font, width) if width else [text]
+        step = line_height(font)
+        self.ensure_height(step * len(lines))
+        for line in lines:
+            self.draw.text((x, self.y), line, font=font, fill=fill)
+            self.y += step
+
+    def render(self):
+        self.render_top_bar()
+        self.render_header()
+        self.render_tab_bar()
+        for body in ["render_experience", "render_projects", "render_skills", "render_education"]:
+            self.section(body)
+        return self.image.crop((0, 0, self.width, self.y + MARGIN))
+
+    # Each tab body is drawn on a white scratch page, then pasted as a panel of the measured height
+    def section(self, body):
+        scratch = ResumeRenderer(self.resume, self.assets, self.width, background="white")
+        scratch.y = CARD_PADDING
+        getattr(scratch, body)()
+        height = scratch.y + CARD_PADDING
+        self.ensure_height(height + 10)
+        self.image.paste(scratch.image.crop((MARGIN, 0, self.width - MARGIN, height)), (MARGIN, self.y))
+        self.y += height + 10
+
+    def render_top_bar(self):
+        self.y += 10
+        title_font = get_font(14, bold=True)
+        self.text(MARGIN, "Curriculum Vitae", title_font)
+        self.y += 10
+
+    def render_header(self):
+        profile = self.resume["profile"]
+        top = self.y
+        self.ensure_height(400)
+        inner_x = MARGIN + CARD_PADDING
+        photo = None
+        try:
+            photo = load_asset(self.asset_path(profile["photo"]), 100, 100, letterboxed=False)
+        except OSError:
+            photo = Image.new("RGB", (100, 100), PRIMARY_COLOR)
+            ImageDraw.Draw(photo).text((20, 30), profile["initials"], fill="white", font=get_font(24, bold=True))
+        # Measure the text column first so the card can be drawn underneath
+        text_x = inner_x + 115
+        text_width = self.width - MARGIN - CARD_PADDING - text_x
+        summary_font = get_font(9)
+        summary_lines = wrap_text(profile["summary"], summary_font, text_width)
+        text_height = (line_height(get_font(15, bold=True)) + line_height(get_font(10)) + 5
+                       + line_height(summary_font) * len(summary_lines) + 10)
+        height = max(100, text_height) + CARD_PADDING * 2
+        self.draw.rectangle((MARGIN, top, self.width - MARGIN, top + height), fill="white", outline=BORDER_COLOR)
+        self.image.paste(photo, (inner_x, top + CARD_PADDING))
+        self.y = top + CARD_PADDING
+        self.text(text_x, profile["name"], get_font(15, bold=True))
+        self.text(text_x, profile["title"], get_font(10), fill=PRIMARY_COLOR)
+        self.y += 5
+        self.text(text_x, profile["summary"], summary_font, fill=LIGHT_TEXT_COLOR, width=text_width)
+        self.y = top + height + 10
+
+        # Link buttons, centred under the card
+        button_font = get_font(10, bold=True)
+        labels = [link["label"] for link in profile["links"]]
+        widths = [int(button_font.getlength(label)) + 20 for label in labels]
+        total = sum(widths) + 10 * (len(widths) - 1)
+        x = (self.width - total) // 2
+        height = line_height(button_font) + 20
+        self.ensure_height(height + 15)
+        for link, label, w in zip(profile["links"], labels, widths):
+            secondary = link.get("style") == "Secondary.TButton"
+            self.draw.rectangle((x, self.y, x + w, self.y + height),
+                                fill=TAG_BG_LIGHT if secondary else PRIMARY_COLOR)
+            self.draw.text((x + 10, self.y + 10), label, font=button_font,
+                           fill=PRIMARY_COLOR if secondary else "white")
+            x += w + 10
+        self.y += height + 15
+
+    def render_tab_bar(self):
+        font = get_font(10)
+        height = line_height(font) + 20
+        self.ensure_height(height + 10)
+        self.draw.rectangle((MARGIN, self.y, self.width - MARGIN, self.y + height), fill="white")
+        slot = (self.width - 2 * MARGIN - 40) / len(TAB_NAMES)
+        for index, name in enumerate(TAB_NAMES):
+            x0 = MARGIN + 20 + index * slot
+            active = index == 0
+            if active:
+                self.draw.rectangle((x0 + 2, self.y + 5, x0 + slot - 2, self.y + height - 5), fill=PRIMARY_COLOR)
+            tab_font = get_font(10, bold=active)
+            text_x = x0 + (slot - tab_font.getlength(name)) / 2
+            self.draw.text((text_x, self.y + 10), name, font=tab_font, fill="white" if active else TEXT_COLOR)
+        self.y += height + 10
+
+    # --- Tab bodies (drawn relative to the white panel) ---
+    def render_experience(self):
+        experience = self.resume["experience"]
+        x = MARGIN + CARD_PADDING
+        self.text(x, experience["heading"], get_font(10), fill=PRIMARY_COLOR)
+        self.y += 5
+        images = experience["images"]
+        if not images:
+            return
+        slot = (self.width - 2 * (MARGIN + CARD_PADDING)) // len(images)
+        box_w = min(400, slot - 30)
+        box_h = box_w * 3 // 4
+        self.ensure_height(box_h + 40)
+        for index, name in enumerate(images):
+            x0 = x + index * slot + 5
+            self.draw.rectangle((x0, self.y, x0 + box_w + 20, self.y + box_h + 20), fill=IMAGE_BG_COLOR, outline=BORDER_COLOR)
+            try:
+                image = load_asset(self.asset_path(name), box_w, box_h)
+            except OSError:
+                image = Image.new("RGB", (box_w, box_h), "lightgray")
+            self.image.paste(image, (x0 + 10, self.y + 10))
+        self.y += box_h + 30
+
+    def render_projects(self):
+        x = MARGIN + CARD_PADDING
+        width = self.width - 2 * x - 40
+        self.text(x, "My Featured Projects", get_font(14, bold=True))
+        projects = self.resume["projects"]
+        for index, project in enumerate(projects):
+            self.y += 15
+            self.text(x + 20, project["title"], get_font(11, bold=True))
+            self.y += 2
+            self.text(x + 20, project["tech_used"], get_font(9, italic=True), fill=PRIMARY_COLOR)
+            self.y += 8
+            self.text(x + 20, project["description"], get_font(9), width=min(width, 550))
+            self.y += 10
+            self.pill(x + 20, "<> View Repository", BUTTON_BG_LIGHT, BUTTON_FG_DARK)
+            if index < len(projects) - 1:
+                self.y += 15
+                self.ensure_height(2)
+                self.draw.line((x + 20, self.y, self.width - x - 20, self.y), fill=BORDER_COLOR)
+
+    def pill(self, x, label, fill, text_fill):
+        font = get_font(9)
+        height = line_height(font) + 10
+        self.ensure_height(height)
+        self.draw.rectangle((x, self.y, x + font.getlength(label) + 10, self.y + height), fill=fill)
+        self.draw.text((x + 5, self.y + 5), label, font=font, fill=text_fill)
+        self.y += height
+
+    def tags(self, x, tags, right):
+        # Wrap tags to the available width, like the app's tag rows
+        font = get_font(9)
+        height = line_height(font) + 8
+        cursor = x
+        self.ensure_height(height)
+        for tag in tags:
+            w = font.getlength(tag) + 16
+            if cursor + w > right and cursor > x:
+                cursor = x
+                self.y += height + 5
+                self.ensure_height(height)
+            self.draw.rectangle((cursor, self.y, cursor + w, self.y + height), fill=TAG_BG_LIGHT, outline=BORDER_COLOR)
+            self.draw.text((cursor + 8, self.y + 4), tag, font=font, fill=TEXT_COLOR)
+            cursor += w + 5
+        self.y += height + 10
+
+    def render_skills(self):
+        x = MARGIN + CARD_PADDING
+        right = self.width - x
+        for index, section in enumerate(self.resume["skills"]):
+            if index > 0:
+                self.y += 10
+                self.draw.line((x, self.y, right, self.y), fill=BORDER_COLOR)
+                self.y += 10
+            self.text(x, section["title"], get_font(14, bold=True))
+            for group in section["groups"]:
+                self.y += 5
+                if group.get("label"):
+                    self.text(x, group["label"], get_font(10), fill=LIGHT_TEXT_COLOR)
+                    self.y += 5
+                self.tags(x, group["tags"], right)
+
+    def render_education(self):
+        education = self.resume["education"]
+        x = MARGIN + CARD_PADDING
+        right = self.width - x
+        title_font = get_font(14, bold=True)
+        gpa_font = get_font(9, bold=True)
+        gpa_w = gpa_font.getlength(education["gpa"]) + 10
+        self.ensure_height(line_height(title_font))
+        self.draw.rectangle((right - gpa_w, self.y, right, self.y + line_height(gpa_font) + 6), fill=PRIMARY_COLOR)
+        self.draw.text((right - gpa_w + 5, self.y + 3), education["gpa"], font=gpa_font, fill="white")
+        self.text(x, education["degree"], title_font, width=right - x - gpa_w - 10)
+        self.y += 5
+        self.text(x, education["school"], get_font(9))
+        self.text(x, education["detail"], get_font(9), fill=LIGHT_TEXT_COLOR)
+        self.y += 15
+        self.text(x, "Key Coursework:", title_font)
+        self.y += 5
+        self.tags(x, education["coursework"], right)
+
+        self.y += 5
+        self.draw.line((x, self.y, right, self.y), fill=BORDER_COLOR)
+        self.y += 15
+        self.text(x, "Extra-Curricular Activities", title_font)
+        self.y += 10
+
+        # --- Activities table (alternating row colours) ---
+        header_font = get_font(9, bold=True)
+        body_font = get_font(9)
+        columns = [x + 10, x + 10 + 150, x + 10 + 150 + (right - x - 170) // 2]
+        for col, label in zip(columns, ["Inclusive Dates:", "Name of Organization:", "Position:"]):
+            self.ensure_height(line_height(header_font) + 10)
+            self.draw.text((col, self.y + 5), label, font=header_font, fill=TEXT_COLOR)
+        self.y += line_height(header_font) + 10
+        self.draw.line((x + 5, self.y, right - 5, self.y), fill=BORDER_COLOR)
+        row_height = line_height(body_font) + 16
+        for index, activity in enumerate(education["activities"]):
+            self.ensure_height(row_height + 1)
+            if index % 2:
+                self.draw.rectangle((x + 5, self.y + 1, right - 5, self.y + row_height), fill=ALT_BG_COLOR)
+            for col, key in zip(columns, ["dates", "organization", "position"]):
+                self.draw.text((col, self.y + 8), activity[key], font=body_font, fill=TEXT_COLOR)
+            self.y += row_height
+            self.draw.line((x + 5, self.y, right - 5, self.y), fill=BORDER_COLOR)
+        self.y += 20
+
+        self.draw.line((x, self.y, right, self.y), fill=BORDER_COLOR)
+        self.y += 15
+        self.text(x, "Academic Achievements", title_font)
+        for index, achievement in enumerate(education["achievements"]):
+            self.y += 10 if index else 5
+            self.text(x, achievement["school"], get_font(10), fill=LIGHT_TEXT_COLOR)
+            for item in achievement["items"]:
+                self.text(x + 10, "• " + item, body_font)
+
+
+# --- Decoded assets are shared by every profile a worker renders ---
+@functools.lru_cache(maxsize=64)
+def _load_asset(path, mtime_ns, width, height, letterboxed):
+    original = Image.open(path)
+    original.draft("RGB", (width, height))
+    original = original.convert("RGB")
+    if not letterboxed:
+        return original.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    ratio = min(width / original.width, height / original.height)
+    size = (max(1, int(original.width * ratio)), max(1, int(original.height * ratio)))
+    # reducing_gap lets Pillow shrink with a cheap box reduce before the LANCZOS pass
+    resized = original.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    final_image = Image.new("RGB", (width, height), IMAGE_BG_COLOR)
+    final_image.paste(resized, ((width - size[0]) // 2, (height - size[1]) // 2))
+    return final_image
+
+
+def load_asset(path, width, height, letterboxed=True):
+    return _load_asset(path, os.stat(path).st_mtime_ns, width, height, letterboxed)
+
+
+# --- Output file names: the profile's stem, plus a short path hash where stems collide ---
+def output_names(profile_paths):
+    stems = {}
+    for path in profile_paths:
+        stems.setdefault(os.path.splitext(os.path.basename(path))[0], set()).add(os.path.abspath(path))
+    names = {}
+    for path in profile_paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if len(stems[stem]) > 1:
+            # e.g. alice/resume.json and bob/resume.json -> resume-1a2b3c4d.png, resume-5e6f7a8b.png
+            stem += "-" + hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:8]
+        names[path] = stem + ".png"
+    return names
+
+
+# --- One resolver per profile directory and worker (a scan stats every file in it) ---
+@functools.lru_cache(maxsize=64)
+def _directory_assets(directory):
+    # for_resume() only looks at the profile's directory
+    return AssetResolver.for_resume(os.path.join(directory, "resume.json"))
+
+
+def assets_for_profile(profile_path):
+    return _directory_assets(os.path.dirname(os.path.realpath(profile_path)))
+
+
+# --- One profile (runs inside a worker process) ---
+def render_profile(profile_path, output_dir, output_name=None):
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    result = {"profile": profile_path, "output": None, "error": None}
+    try:
+        resume = load_resume(profile_path)
+        image = ResumeRenderer(resume, assets=assets_for_profile(profile_path)).render()
+        output_name = output_name or os.path.splitext(os.path.basename(profile_path))[0] + ".png"
+        output = os.path.join(output_dir, output_name)
+        # Fast zlib level: batch throughput matters more than a few KB per file
+        image.save(output, compress_level=1)
+        result["output"] = output
+        result["size"] = list(image.size)
+    except (OSError, ResumeDataError, KeyError, ValueError) as e:
+        result["error"] = "%s: %s" % (type(e).__name__, e)
+    result["wall_ms"] = round((time.perf_counter() - start_wall) * 1000, 3)
+    result["cpu_ms"] = round((time.process_time() - start_cpu) * 1000, 3)
+    return result
+
+
+# --- Batch across a process pool ---
+def render_batch(profile_paths, output_dir, workers=None, on_result=None):
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    results = []
+    # The same file listed twice (e.g. by overlapping globs) is rendered once
+    profile_paths = list({os.path.abspath(path): path for path in profile_paths}.values())
+    names = output_names(profile_paths)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_profile, path, output_dir, names[path]): path for path in profile_paths}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # A crashed worker still gets a row in the report
+                result = {"profile": futures[future], "output": None,
+                          "error": "%s: %s" % (type(e).__name__, e), "wall_ms": None, "cpu_ms": None}
+            results.append(result)
+            if on_result:
+                on_result(result)
+    results.sort(key=lambda r: r["profile"])
+    timings = [r["wall_ms"] for r in results if r["error"] is None]
+    return {
+        "profiles": len(results),
+        "rendered": len(timings),
+        "failed": len(results) - len(timings),
+        "total_s": round(time.perf_counter() - start, 3),
+        "mean_ms": round(sum(timings) / len(timings), 3) if timings else None,
+        "max_ms": max(timings) if timings else None,
+        "results": results,
+    }
+
+
+def expand_profiles(patterns):
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(glob.glob(os.path.join(pattern, "*.json"))))
+        else:
+            paths.extend(sorted(glob.glob(pattern)) or [pattern])
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render resume profiles to PNG without a display.")
+    parser.add_argument("profiles", nargs="+", help="profile JSON files, globs or directories")
+    parser.add_argument("-o", "--output-dir", default="rendered")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--report", help="write the per-profile timing/failure report to this JSON file")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        if args.quiet:
+            return
+        if result["error"]:
+            print("FAIL %s: %s" % (result["profile"], result["error"]))
+        else:
+            print("ok   %s -> %s (%.1f ms)" % (result["profile"], result["output"], result["wall_ms"]))
+
+    report = render_batch(expand_profiles(args.profiles), args.output_dir, args.workers, progress)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print("Rendered %d/%d profiles in %.2f s (%d failed)"
+          % (report["rendered"], report["profiles"], report["total_s"], report["failed"]))
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
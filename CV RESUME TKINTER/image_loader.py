@@ -0,0 +1,113 @@
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+# --- Handle for one pending decode (cancel() drops the result) ---
+class ImageRequest:
+    def __init__(self, on_ready, owner, on_failed=None):
+        self.on_ready = on_ready
+        self.on_failed = on_failed
+        self.owner = owner
+        self.future = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+# --- Background Image Loader ---
+# Decoding and resizing run in a worker pool and only produce PIL images.
+# Tk is not thread-safe, so finished images are handed back through a queue
+# that the main thread drains with `after`, where the PhotoImage is created.
+class BackgroundImageLoader:
+    POLL_MS = 15
+
+    def __init__(self, master, max_workers=2):
+        self.master = master
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-loader")
+        self.results = queue.Queue()
+        self.pending = set()
+        self.owners = {}            # owner path -> its pending requests
+        self.poll_id = None
+        self.closed = False
+
+    # build() runs on a worker and returns a PIL image (or None to keep the placeholder);
+    # on_failed() is called instead of on_ready when it raised or returned None
+    def submit(self, build, on_ready, owner=None, on_failed=None):
+        request = ImageRequest(on_ready, owner, on_failed)
+        if self.closed:
+            request.cancelled = True
+            return request
+        if owner is not None:
+            # Destroying the widget that would show the image cancels its decodes; bound once per owner
+            requests = self.owners.get(str(owner))
+            if requests is None:
+                requests = self.owners[str(owner)] = set()
+                owner.bind("<Destroy>", lambda e, w=owner: e.widget is w and self._on_destroy(w), add="+")
+            requests.add(request)
+        request.future = self.executor.submit(self._run, request, build)
+        self.pending.add(request)
+        self._schedule_poll()
+        return request
+
+    def _on_destroy(self, owner):
+        for request in self.owners.pop(str(owner), ()):
+            request.cancel()
+
+    def _done(self, request):
+        self.pending.discard(request)
+        requests = self.owners.get(str(request.owner)) if request.owner is not None else None
+        if requests is not None:
+            requests.discard(request)
+
+    def _run(self, request, build):
+        if request.cancelled:
+            return
+        try:
+            image = build()
+        except Exception as e:
+            # Keeps the placeholder, but say why (a corrupt or unsupported file, not a hang)
+            print("Image decode failed: %s: %s" % (type(e).__name__, e), file=sys.stderr)
+            image = None
+        self.results.put((request, image))
+
+    def _schedule_poll(self):
+        if self.poll_id is None and not self.closed:
+            self.poll_id = self.master.after(self.POLL_MS, self._poll)
+
+    # --- Main-thread swap: turn decoded images into PhotoImages ---
+    def _poll(self):
+        from PIL import ImageTk # Already loaded by the time results arrive (see deferred_imports.py)
+        self.poll_id = None
+        while True:
+            try:
+                request, image = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self._done(request)
+            if request.cancelled:
+                continue
+            if image is None:
+                if request.on_failed is not None:
+                    request.on_failed()
+                continue
+            request.on_ready(ImageTk.PhotoImage(image))
+        # Requests cancelled before they started never report back
+        for request in [r for r in self.pending if r.cancelled and r.future.done()]:
+            self._done(request)
+        if self.pending:
+            self._schedule_poll()
+
+    def shutdown(self):
+        self.closed = True
+        for request in list(self.pending):
+            request.cancel()
+        self.pending.clear()
+        self.owners.clear()
+        if self.poll_id is not None:
+            self.master.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.executor.shutdown(wait=False)
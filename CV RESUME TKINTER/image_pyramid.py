@@ -0,0 +1,116 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Largest box the app ever asks for; JPEG sources are draft-decoded down towards it
+MAX_BOX = (1600, 1600)
+MIN_LEVEL = 64
+# Experience images follow the window width in steps of this many pixels (4:3 boxes);
+# shared by ResumeApp and the asset bundle build, which packs every step
+IMAGE_SIZE_STEP = 40
+MIN_EXPERIENCE_WIDTH = 160
+MAX_EXPERIENCE_WIDTH = 800
+
+
+# --- Multi-resolution Image Pyramid ---
+# Each source is decoded once (JPEGs via draft() straight at a reduced DCT
+# scale) and halved with Image.reduce(2) into a short chain of levels. A
+# request for any size starts from the smallest level that still covers it,
+# so the final LANCZOS pass never works on more than twice the target pixels.
+# Pyramids are shared by the loader's worker threads and kept for the most
+# recently used sources only.
+#
+# With an AssetBundle, levels come straight out of the memory-mapped bundle
+# (no PNG decode). Bundles keep only levels up to MAX_BOX, so a request larger
+# than the biggest bundled level falls back to decoding the source.
+class ImagePyramid:
+    def __init__(self, max_sources=8, bundle=None):
+        self.max_sources = max_sources
+        self.bundle = bundle
+        self.pyramids = OrderedDict()       # (abspath, mtime_ns, decoded) -> [level0, level1, ...]
+        self.lock = threading.Lock()
+        self.builds = 0
+        self.resamples = 0
+
+    def _build(self, source_path):
+        from PIL import Image
+        image = Image.open(source_path)
+        # Cheap decode-time reduction; a no-op for formats without draft support
+        image.draft("RGB", MAX_BOX)
+        image.load()
+        # reduce() only handles plain pixel modes; palette ("P"), "LA", "1" etc. are converted first
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGBA" if "A" in image.mode or "transparency" in image.info else "RGB")
+        levels = [image]
+        while min(levels[-1].size) // 2 >= MIN_LEVEL:
+            levels.append(levels[-1].reduce(2))
+        return levels
+
+    def levels(self, source_path, decoded=False):
+        key = (os.path.abspath(source_path), os.stat(source_path).st_mtime_ns, decoded)
+        with self.lock:
+            levels = self.pyramids.get(key)
+            if levels is not None:
+                self.pyramids.move_to_end(key)
+                return levels
+        levels = None
+        if self.bundle is not None and not decoded:
+            levels = self.bundle.levels(source_path)
+        if levels is None:
+            levels = self._build(source_path)
+            with self.lock:
+                self.builds += 1
+        with self.lock:
+            self.pyramids[key] = levels
+            while len(self.pyramids) > self.max_sources:
+                self.pyramids.popitem(last=False)
+        return levels
+
+    def source_size(self, source_path):
+        size = self.bundle.source_size(source_path) if self.bundle is not None else None
+        return size or self.levels(source_path)[0].size
+
+    # Smallest level that is at least as large as size in both directions
+    def level_for(self, source_path, size):
+        levels = self.levels(source_path)
+        if (size[0] > levels[0].width or size[1] > levels[0].height) \
+                and levels[0].size != self.source_size(source_path):
+            # Bigger than every bundled level: go back to the full-size source
+            levels = self.levels(source_path, decoded=True)
+        for level in reversed(levels):
+            if level.width >= size[0] and level.height >= size[1]:
+                return level
+        return levels[0]
+
+    # resample defaults to LANCZOS
+    def resize(self, source_path, size, resample=None):
+        level = self.level_for(source_path, size)
+        with self.lock:
+            self.resamples += 1
+        if level.size == tuple(size):
+            return level.copy()
+        if resample is None:
+            from PIL import Image
+            resample = Image.Resampling.LANCZOS
+        return level.resize(size, resample)
+
+    # --- Fit into width x height, centred on a solid background ---
+    def letterbox(self, source_path, width, height, background='#f0f0f0'):
+        from PIL import Image
+        original_width, original_height = self.source_size(source_path)
+        ratio = min(width / original_width, height / original_height)
+        new_width = max(1, int(original_width * ratio))
+        new_height = max(1, int(original_height * ratio))
+
+        # Starts from the nearest pyramid level, so the LANCZOS pass stays small
+        resized_image = self.resize(source_path, (new_width, new_height))
+
+        final_image = Image.new('RGB', (width, height), color=background)
+        paste_x = (width - new_width) // 2
+        paste_y = (height - new_height) // 2
+        final_image.paste(resized_image, (paste_x, paste_y))
+        return final_image
+
+    def stats(self):
+        with self.lock:
+            return {"sources": len(self.pyramids), "builds": self.builds, "resamples": self.resamples}
@@ -0,0 +1,244 @@
+import zlib
+from collections import OrderedDict
+
+DEFAULT_BUDGET_BYTES = 8 * 1024 * 1024
+
+
+# --- Compressed copy of a decoded image, kept so a PhotoImage can be rebuilt ---
+class CompressedImage:
+    def __init__(self, image):
+        self.mode = image.mode
+        self.size = image.size
+        self.data = zlib.compress(image.tobytes(), 1)
+
+    def decompress(self):
+        from PIL import Image
+        return Image.frombytes(self.mode, self.size, zlib.decompress(self.data))
+
+
+# --- Budgeted PhotoImage Store ---
+# Every decoded image is kept zlib-compressed in memory; only the PhotoImages
+# (Tk keeps 4 bytes per pixel) count against the budget. When the budget is
+# exceeded, the least recently seen images whose label is hidden (unmapped tab)
+# or scrolled outside the canvas are swapped back to their placeholder and
+# dropped. Showing such a label again re-materializes it from the compressed
+# copy through the background loader (or, for load_ready() entries, by simply
+# building the PhotoImage again).
+#
+# A load's on_ready(photo) is one-shot and always called once: with the photo
+# when it is shown, or with None when the decode fails, the key is forgotten or
+# another load with its own callback replaces it.
+class ImageStore:
+    def __init__(self, master, image_loader, placeholder, canvas=None, max_bytes=DEFAULT_BUDGET_BYTES):
+        self.master = master
+        self.image_loader = image_loader
+        self.placeholder = placeholder      # placeholder(width, height) -> PhotoImage
+        self.canvas = canvas
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()        # key -> entry dict, least recently seen first
+        self.compressed = {}                # key -> CompressedImage (written by loader workers)
+        self.label_keys = {}                # label path -> key it currently shows
+        self.bound = set()                  # label paths with Map/Unmap/Destroy bindings
+        self.resident_bytes = 0
+        self.peak_bytes = 0
+        self.evictions = 0
+        self.rematerializations = 0
+        self.generation = 0                 # bumped per load; results of older loads are dropped
+        self.check_id = None
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @staticmethod
+    def photo_bytes(width, height):
+        return width * height * 4
+
+    # Decode with build() on a worker, remember a compressed copy and show it in label
+    def load(self, key, label, build, on_ready=None):
+        entry = self._entry(key, label)
+        self._set_on_ready(entry, on_ready)
+        entry["make_photo"] = None
+        self.compressed.pop(key, None)
+        generation = self._supersede(entry)
+        self._request(key, lambda: self._decode(key, generation, build), generation)
+
+    # Photos that need no decoding (e.g. from the asset bundle): make_photo() builds the
+    # PhotoImage on the main thread right away, and again whenever an evicted one is shown
+    def load_ready(self, key, label, make_photo, on_ready=None):
+        entry = self._entry(key, label)
+        self._set_on_ready(entry, on_ready)
+        entry["make_photo"] = make_photo
+        self.compressed.pop(key, None)
+        self._attach(key, make_photo(), self._supersede(entry))
+
+    def _entry(self, key, label):
+        entry = self.entries.get(key)
+        if entry is None or entry["label"] is not label:
+            if entry is not None and self.label_keys.get(str(entry["label"])) == key:
+                # The key moves to another label: the old one must no longer act for it
+                del self.label_keys[str(entry["label"])]
+            entry = {"label": label, "photo": None, "on_ready": None, "make_photo": None, "loading": False,
+                     "generation": 0, "request": None}
+            self.entries[key] = entry
+            # Bound once per label (tracked in self.bound); a label given a new key later reuses the bindings
+            if str(label) not in self.bound:
+                self.bound.add(str(label))
+                label.bind("<Map>", lambda e, w=label: self._on_map(self.label_keys.get(str(w))), add="+")
+                label.bind("<Unmap>", lambda e: self.schedule_check(), add="+")
+                label.bind("<Destroy>", lambda e, w=label: e.widget is w and self._on_destroy(w), add="+")
+            self.label_keys[str(label)] = key
+        return entry
+
+    # Forget the label's entry only if that entry still belongs to this label
+    def _on_destroy(self, label):
+        self.bound.discard(str(label))
+        key = self.label_keys.pop(str(label), None)
+        if key is not None and self.entries.get(key, {}).get("label") is label:
+            self.forget(key)
+
+    # Not called again on later re-materializations. A load without a callback that
+    # supersedes one in flight (e.g. a resize during a reload) keeps the pending one
+    @staticmethod
+    def _set_on_ready(entry, on_ready):
+        if on_ready is None:
+            return
+        previous, entry["on_ready"] = entry["on_ready"], on_ready
+        if previous is not None:
+            previous(None)
+
+    @staticmethod
+    def _finish(entry, photo):
+        on_ready, entry["on_ready"] = entry["on_ready"], None
+        if on_ready is not None:
+            on_ready(photo)
+
+    # A new load (e.g. at another width) replaces the one in flight: cancel it and
+    # give the entry a new generation so a result that still arrives is ignored
+    def _supersede(self, entry):
+        if entry["request"] is not None:
+            entry["request"].cancel()
+            entry["request"] = None
+        self.generation += 1
+        entry["generation"] = self.generation
+        return self.generation
+
+    def _current(self, key, generation):
+        entry = self.entries.get(key)
+        return entry if entry is not None and entry["generation"] == generation else None
+
+    def _decode(self, key, generation, build):
+        image = build()
+        if image is not None and self._current(key, generation) is not None:
+            self.compressed[key] = CompressedImage(image)
+        return image
+
+    def _request(self, key, build, generation):
+        entry = self.entries[key]
+        entry["loading"] = True
+        entry["request"] = self.image_loader.submit(
+            build, lambda photo, k=key, g=generation: self._attach(k, photo, g), owner=entry["label"],
+            on_failed=lambda k=key, g=generation: self._failed(k, g))
+
+    # The label keeps its placeholder (or previous image); a later load may still succeed
+    def _failed(self, key, generation):
+        entry = self._current(key, generation)
+        if entry is None:
+            return
+        entry["loading"] = False
+        entry["request"] = None
+        self._finish(entry, None)
+
+    # --- Main thread: a PhotoImage is ready ---
+    def _attach(self, key, photo, generation):
+        entry = self._current(key, generation)
+        if entry is None or photo is None or not entry["label"].winfo_exists():
+            return
+        entry["request"] = None
+        entry["loading"] = False
+        self._drop(entry)
+        entry["photo"] = photo
+        self.resident_bytes += self.photo_bytes(photo.width(), photo.height())
+        self.peak_bytes = max(self.peak_bytes, self.resident_bytes)
+        entry["label"].configure(image=photo)
+        entry["label"].image = photo
+        self.entries.move_to_end(key)
+        self._finish(entry, photo)
+        self.schedule_check()
+
+    def _drop(self, entry):
+        photo = entry["photo"]
+        if photo is not None:
+            self.resident_bytes -= self.photo_bytes(photo.width(), photo.height())
+            entry["photo"] = None
+
+    def forget(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            if entry["request"] is not None:
+                entry["request"].cancel()
+            self._drop(entry)
+            self._finish(entry, None)
+            if self.label_keys.get(str(entry["label"])) == key:
+                del self.label_keys[str(entry["label"])]
+        self.compressed.pop(key, None)
+
+    # --- Visibility ---
+    def is_visible(self, label):
+        if not label.winfo_exists() or not label.winfo_viewable():
+            return False
+        if self.canvas is None:
+            return True
+        top = label.winfo_rooty()
+        canvas_top = self.canvas.winfo_rooty()
+        return top < canvas_top + self.canvas.winfo_height() and top + label.winfo_height() > canvas_top
+
+    def _on_map(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and entry["photo"] is not None:
+            self.entries.move_to_end(key)
+        self.schedule_check()
+
+    # Call after scrolling or tab switches; checks run once per idle pass
+    def schedule_check(self):
+        if self.check_id is None:
+            self.check_id = self.master.after_idle(self.check)
+
+    def check(self):
+        self.check_id = None
+        # Bring back evicted images that are on screen again
+        for key, entry in list(self.entries.items()):
+            if entry["photo"] is None and entry["make_photo"] is not None and self.is_visible(entry["label"]):
+                self.rematerializations += 1
+                self._attach(key, entry["make_photo"](), entry["generation"])
+            elif entry["photo"] is None and not entry["loading"] and key in self.compressed \
+                    and self.is_visible(entry["label"]):
+                self.rematerializations += 1
+                self._request(key, self.compressed[key].decompress, entry["generation"])
+            elif entry["photo"] is not None and self.is_visible(entry["label"]):
+                self.entries.move_to_end(key)
+        self.enforce_budget()
+
+    def enforce_budget(self):
+        for key, entry in list(self.entries.items()):
+            if self.resident_bytes <= self.max_bytes:
+                break
+            if entry["photo"] is None or self.is_visible(entry["label"]):
+                continue
+            width, height = entry["photo"].width(), entry["photo"].height()
+            self._drop(entry)
+            entry["label"].configure(image=self.placeholder(width, height))
+            entry["label"].image = None
+            self.evictions += 1
+
+    def stats(self):
+        resident = sum(1 for entry in self.entries.values() if entry["photo"] is not None)
+        return {
+            "budget_bytes": self.max_bytes,
+            "resident_bytes": self.resident_bytes,
+            "peak_bytes": self.peak_bytes,
+            "resident_images": resident,
+            "evicted_images": len(self.entries) - resident,
+            "compressed_bytes": sum(len(image.data) for image in list(self.compressed.values())),
+            "evictions": self.evictions,
+            "rematerializations": self.rematerializations,
+        }
@@ -0,0 +1,199 @@
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+from resume_data import ResumeDataError, load_resume
+
+USER_AGENT = "cv-resume-link-check/1.0"
+MAX_REDIRECTS = 5
+
+
+# --- Every URL the app can open, in on-screen order, without duplicates ---
+def resume_urls(resume):
+    profile = resume["profile"]
+    urls = [profile["cv_url"]] + [link["url"] for link in profile["links"]]
+    urls += [project["repo_link"] for project in resume["projects"]]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+# --- Keep-alive connections per (scheme, host, port), shared by the worker threads ---
+class ConnectionPool:
+    def __init__(self, timeout=5.0, max_idle_per_host=4):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.idle = {}              # (scheme, host, port) -> [connection, ...]
+        self.lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, scheme, host, port):
+        key = (scheme, host, port)
+        with self.lock:
+            connections = self.idle.get(key)
+            if connections:
+                self.reused += 1
+                return connections.pop()
+            self.created += 1
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout)
+
+    def release(self, scheme, host, port, connection):
+        with self.lock:
+            connections = self.idle.setdefault((scheme, host, port), [])
+            if len(connections) < self.max_idle_per_host:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+# --- Link Health Checker ---
+# Checks URLs concurrently (HEAD, falling back to GET for servers that reject
+# it), following redirects over pooled keep-alive connections. Results are
+# cached per URL for ttl seconds, so re-checking the same resume is free until
+# the entries expire.
+class LinkHealthChecker:
+    def __init__(self, max_workers=8, ttl=300.0, timeout=5.0):
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.pool = ConnectionPool(timeout=timeout)
+        self.cache = {}             # url -> (checked_at, result)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _request(self, method, url):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("unsupported URL")
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        for attempt in range(2):
+            connection = self.pool.acquire(scheme, parts.hostname, port)
+            try:
+                connection.request(method, path, headers={"User-Agent": USER_AGENT})
+                response = connection.getresponse()
+                response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A pooled connection the server already closed: retry once on a fresh one
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self.pool.release(scheme, parts.hostname, port, connection)
+            return response.status, response.getheader("Location")
+
+    def _check(self, url):
+        start = time.perf_counter()
+        result = {"url": url, "ok": False, "status": None, "final_url": url, "error": None}
+        try:
+            current = url
+            for _ in range(MAX_REDIRECTS + 1):
+                status, location = self._request("HEAD", current)
+                if status in (405, 501):
+                    status, location = self._request("GET", current)
+                if status in (301, 302, 303, 307, 308) and location:
+                    current = urljoin(current, location)
+                    continue
+                break
+            else:
+                raise ValueError("too many redirects")
+            result.update(status=status, final_url=current, ok=200 <= status < 400)
+        except Exception as e:
+            result["error"] = "%s: %s" % (type(e).__name__, e)
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return result
+
+    def cached(self, url):
+        with self.lock:
+            entry = self.cache.get(url)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+        return None
+
+    # url -> result dict, in the order given; fresh cache entries skip the network
+    def check(self, urls, force=False):
+        results = {}
+        missing = []
+        for url in dict.fromkeys(urls):
+            result = None if force else self.cached(url)
+            if result is not None:
+                results[url] = dict(result, cached=True)
+            else:
+                missing.append(url)
+        with self.lock:
+            self.hits += len(results)
+            self.misses += len(missing)
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing)),
+                                    thread_name_prefix="link-check") as executor:
+                for url, result in zip(missing, executor.map(self._check, missing)):
+                    with self.lock:
+                        self.cache[url] = (time.monotonic(), result)
+                    results[url] = dict(result, cached=False)
+        return {url: results[url] for url in dict.fromkeys(urls)}
+
+    def close(self):
+        self.pool.close()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "cached_urls": len(self.cache),
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "connections_created": self.pool.created,
+                "connections_reused": self.pool.reused,
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check every link in a resume file.")
+    parser.add_argument("resume", nargs="?", help="resume JSON file (default: resume.json)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+    try:
+        resume = load_resume(args.resume)
+    except (ResumeDataError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    checker = LinkHealthChecker(max_workers=args.workers, timeout=args.timeout)
+    try:
+        results = checker.check(resume_urls(resume))
+    finally:
+        checker.close()
+    if args.json:
+        print(json.dumps({"results": list(results.values()), "stats": checker.stats()}, indent=2))
+    else:
+        for result in results.values():
+            state = result["status"] if result["error"] is None else result["error"]
+            print("%-4s %8.1f ms  %s  (%s)" % ("ok" if result["ok"] else "FAIL", result["elapsed_ms"],
+                                              result["url"], state))
+    return 0 if all(result["ok"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
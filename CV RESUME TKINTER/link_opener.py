@@ -0,0 +1,79 @@
+import queue
+import threading
+import time
+
+
+# --- Background Link Opener ---
+# webbrowser.get() probes the system for every known browser (PATH lookups,
+# environment checks) and open_new() then spawns a process; both can take long
+# enough to freeze the window when run from a button callback. Here a single
+# daemon worker resolves the browser once, caches it, and opens queued URLs in
+# click order, so the callback only puts the URL on a queue.
+class LinkOpener:
+    def __init__(self, browser_name=None):
+        self.browser_name = browser_name
+        self.browser = None
+        self.resolve_ms = None
+        self.requests = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.failed = 0
+        self.open_times = []        # ms from click to the browser call returning
+
+    def open(self, url):
+        if url:
+            self._start()
+            self.requests.put((url, time.perf_counter()))
+
+    # Resolve the browser ahead of the first click (e.g. once the window is idle)
+    def warm(self):
+        self._start()
+        self.requests.put((None, None))
+
+    def _start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="link-opener", daemon=True)
+            self.thread.start()
+
+    # Call off the main thread; later calls return the cached controller
+    def resolve_browser(self):
+        # webbrowser itself is imported here, on the worker, rather than at startup
+        import webbrowser
+        if self.browser is None:
+            start = time.perf_counter()
+            try:
+                self.browser = webbrowser.get(self.browser_name)
+            except webbrowser.Error:
+                # No usable controller found: fall back to the module-level default each time
+                self.browser = webbrowser
+            self.resolve_ms = (time.perf_counter() - start) * 1000
+        return self.browser
+
+    def _run(self):
+        while True:
+            url, clicked_at = self.requests.get()
+            if url is None:
+                self.resolve_browser()
+                continue
+            try:
+                ok = self.resolve_browser().open_new(url)
+            except Exception:
+                ok = False
+            with self.lock:
+                if ok:
+                    self.opened += 1
+                else:
+                    self.failed += 1
+                self.open_times.append((time.perf_counter() - clicked_at) * 1000)
+
+    def stats(self):
+        with self.lock:
+            times = sorted(self.open_times)
+            return {
+                "opened": self.opened,
+                "failed": self.failed,
+                "browser_resolve_ms": round(self.resolve_ms, 3) if self.resolve_ms is not None else None,
+                "mean_open_ms": round(sum(times) / len(times), 3) if times else None,
+                "max_open_ms": round(times[-1], 3) if times else None,
+            }
@@ -1,225 +1,297 @@
+# Imported first so the startup profile's "imports" phase covers everything below
+import startup_profiler
 import tkinter as tk
 from tkinter import ttk
-import webbrowser
-from PIL import Image, ImageTk 
 import os 
-import random 
-
-# --- New Tooltip Class for Hover Effects ---
+import sys
+import time
+
+from asset_bundle import AssetBundle
+from asset_resolver import AssetResolver, resume_assets
+import deferred_imports
+from file_watcher import FileWatcher, watch_mode
+from flow_layout import FlowLayout
+from image_loader import BackgroundImageLoader
+import image_pyramid
+from image_pyramid import ImagePyramid
+from image_store import DEFAULT_BUDGET_BYTES, ImageStore
+from link_opener import LinkOpener
+import theme
+from resize_dispatcher import ResizeDispatcher
+from style_batcher import StyleBatcher
+from tcl_builder import BulkBuilder, WidgetSpec
+from tcl_script import command
+from resume_data import DEFAULT_RESUME_PATH, load_resume
+from search_index import SearchIndex
+from thumbnail_cache import ThumbnailCache
+from stall_monitor import StallMonitor
+from startup_profiler import StartupProfiler
+from virtual_list import VirtualList
+
+# --- Shared Tooltip Window ---
+# One borderless Toplevel per Tk root is created on first use and then only
+# withdrawn / re-shown, and a single pending timer serves every Tooltip: moving
+# from one widget to the next cancels the old timer instead of stacking them.
+class TooltipPool:
+    DELAY_MS = 500
+    _pools = {}
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget._root()
+        pool = cls._pools.get(root)
+        if pool is None:
+            pool = cls._pools[root] = cls(root)
+            # The pool goes with its root (a closed window must not keep it, or its Tcl interpreter, alive)
+            root.bind("<Destroy>", lambda e, r=root: e.widget is r and cls._pools.pop(r, None), add="+")
+        return pool
+
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+        self.label = None
+        self.owner = None
+        self.after_id = None
+        self.shown = 0
+
+    def _create_window(self):
+        self.window = tk.Toplevel(self.root)
+        self.window.withdraw()
+        self.window.wm_overrideredirect(True) # Remove window decorations
+        self.label = tk.Label(self.window, justify=tk.LEFT,
+                              background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                              font=("tahoma", "8", "normal"))
+        self.label.pack(ipadx=1)
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_destroy(self, event):
+        if event.widget is self.window:
+            self.window = self.label = None
+
+    def schedule(self, tooltip):
+        self.cancel()
+        self.owner = tooltip
+        self.after_id = self.root.after(self.DELAY_MS, self.show) # Show after 500ms
+
+    def cancel(self, tooltip=None):
+        if tooltip is not None and tooltip is not self.owner:
+            return
+        if self.after_id:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.hide()
+        self.owner = None
+
+    def show(self):
+        self.after_id = None
+        tooltip = self.owner
+        if tooltip is None or not tooltip.text or not tooltip.widget.winfo_exists():
+            return
+        if self.window is None:
+            self._create_window()
+        widget = tooltip.widget
+        # Below the widget's top-left corner, from its on-screen position
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + widget.winfo_height() + 5
+        self.label.configure(text=tooltip.text)
+        self.window.wm_geometry(f"+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+        self.shown += 1
+
+    def hide(self):
+        if self.window is not None:
+            self.window.withdraw()
+
+
+# --- Tooltip Class for Hover Effects ---
 class Tooltip:
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tip_window = None
-        self.id = None
+        self.pool = TooltipPool.for_widget(widget)
         self.widget.bind("<Enter>", self.enter)
         self.widget.bind("<Leave>", self.leave)
+        self.widget.bind("<Destroy>", self.leave, add="+")
 
     def enter(self, event=None):
-        self.schedule()
+        self.pool.schedule(self)
 
     def leave(self, event=None):
-        self.unschedule()
-        self.hidetip()
-
-    def schedule(self):
-        self.unschedule()
-        self.id = self.widget.after(500, self.showtip) # Show after 500ms
-
-    def unschedule(self):
-        id = self.id
-        self.id = None
-        if id:
-            self.widget.after_cancel(id)
-
-    def showtip(self, event=None):
-        if self.tip_window or not self.text:
-            return
-        
-        # Get widget position
-        x, y, cx, cy = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-        
-        # Create tooltip window
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True) # Remove window decorations
-        self.tip_window.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(self.tip_window, text=self.text, justify=tk.LEFT,
-                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                         font=("tahoma", "8", "normal"))
-        label.pack(ipadx=1)
-
-    def hidetip(self):
-        tw = self.tip_window
-        self.tip_window = None
-        if tw:
-            tw.destroy()
+        self.pool.cancel(self)
 
 
 class ResumeApp:
-    def __init__(self, master):
+    # Sections with more entries than this are rendered as virtualized lists
+    VIRTUALIZE_THRESHOLD = 40
+    # One frame at 60 Hz; tab switches slower than this are counted in tab_switch_stats()
+    FRAME_BUDGET_MS = 1000 / 60
+    # Experience images follow the window width in steps of this many pixels (4:3 boxes)
+    IMAGE_SIZE_STEP = image_pyramid.IMAGE_SIZE_STEP
+    MIN_EXPERIENCE_WIDTH = image_pyramid.MIN_EXPERIENCE_WIDTH
+    MAX_EXPERIENCE_WIDTH = image_pyramid.MAX_EXPERIENCE_WIDTH
+    # Search document kinds owned by each tab (dropped when a tab is rebuilt)
+    TAB_DOC_KINDS = {"Experience": (), "Projects": ("project",), "Skills": ("tag",), "Education": ("course", "activity")}
+    ACTIVITY_KEYS = ("dates", "organization", "position")
+    # How often the Tk thread drains the file watcher's queue in --watch mode
+    WATCH_POLL_MS = 30
+
+    def __init__(self, master, prebuild_tabs=True, resume_path=None, virtualize=None, profiler=None,
+                 image_budget_bytes=DEFAULT_BUDGET_BYTES, profile_paths=None):
         self.master = master
+        # Disabled unless a StartupProfiler with an output path is passed in
+        self.profiler = profiler or StartupProfiler()
+        self.prebuild_tabs = prebuild_tabs
+        self.virtualize = virtualize
+        self.virtual_lists = []
+        self.canvas_width = None
+        self.summary_wraplength = None
+        self.active_tab = None
+        self.scrollregion_id = None
+        self.tab_switch_times = []
+        with self.profiler.phase("load_resume"):
+            self.resume = load_resume(resume_path)
+        # Profiles that can be switched to in this window (loaded on first use, then kept)
+        self.resume_path = resume_path or DEFAULT_RESUME_PATH
+        self.profile_paths = list(profile_paths or [self.resume_path])
+        self.profiles = {self.resume_path: self.resume}
+        self.profile_switch_times = []
+        # Asset names in the resume -> files, from one directory scan (see asset_resolver.py)
+        with self.profiler.phase("asset_scan"):
+            self.assets = AssetResolver.for_resume(self.resume_path)
+        self.assets.warn_missing(resume_assets(self.resume))
+        self.file_watcher = None
+        self.watch_id = None
+        self.reload_times = []
         master.title("Curriculum Vitae")
         master.resizable(True, True) 
 
-        self.experience_images = {} 
+        # --- Search: the index is built from the data; widgets register as their tab is built ---
+        with self.profiler.phase("search_index"):
+            self.search_index = SearchIndex.from_resume(self.resume)
+        self.search_matches = None      # None: no active query
+        self.search_targets = {}        # doc id -> (kind, widget handles...)
+        self.virtual_sources = []       # (virtual list, doc kind, all items)
+        self.project_cards = []
+        self.matched_tags = set()
+        self.search_id = None
+        self.search_times = []
+
+        self.thumbnail_cache = ThumbnailCache()
+        self.image_loader = BackgroundImageLoader(master)
+        self.placeholder_images = {}
+        # Built by `python asset_bundle.py build`; without one every image is decoded as before
+        with self.profiler.phase("asset_bundle"):
+            self.asset_bundle = AssetBundle.open()
+        if self.asset_bundle is not None:
+            self.asset_bundle.resolver = self.assets
+        self.image_pyramid = ImagePyramid(bundle=self.asset_bundle)
+        self.experience_labels = {}
+        self.experience_box = None
+        # Decoded photos live here under a byte budget; hidden ones are evicted first
+        self.image_store = ImageStore(master, self.image_loader, self.placeholder_image,
+                                      max_bytes=image_budget_bytes)
+        self.bulk_builder = BulkBuilder(master)
+        self.flow_layouts = []
+        self.style_batcher = StyleBatcher(master)
+        self.link_opener = LinkOpener()
 
         # --- Styling & Colors (Deep Teal Theme) ---
-        s = ttk.Style()
-        s.theme_use('clam') 
+        # The whole theme is registered in one Tcl evaluation per interpreter (see theme.py)
+        with self.profiler.phase("theme_setup"):
+            self.theme_setup_ms = theme.apply_theme(master)
         
         # General colors
-        self.bg_color = "#f8f9fa"       
-        self.primary_color = "#008080"  # DEEP TEAL
-        self.text_color = "#000000"     # BLACK
-        self.light_text_color = "#444444" 
-        self.border_color = "#dddddd"   
-        self.tag_bg_light = "#e9ecef"   
-        self.button_bg_light = "#e0ffff" 
-        self.button_fg_dark = "#004040"  
-        self.alt_bg_color = "#f5f5f5"   # NEW: Light gray for subtle alternating rows
+        self.bg_color = theme.BG_COLOR
+        self.primary_color = theme.PRIMARY_COLOR
+        self.text_color = theme.TEXT_COLOR
+        self.light_text_color = theme.LIGHT_TEXT_COLOR
+        self.border_color = theme.BORDER_COLOR
+        self.tag_bg_light = theme.TAG_BG_LIGHT
+        self.button_bg_light = theme.BUTTON_BG_LIGHT
+        self.button_fg_dark = theme.BUTTON_FG_DARK
+        self.alt_bg_color = theme.ALT_BG_COLOR
 
         # --- List of Pastel Colors for Hover Effect ---
-        self.pastel_colors = [
-            "#FFC0CB",  # Pastel Pink
-            "#FFA07A",  # Light Salmon/Pastel Orange
-            "#F08080",  # Light Coral/Pastel Red
-            "#FFFACD",  # LemonChiffon/Pastel Yellow
-            "#90EE90",  # Light Green/Pastel Green
-            "#ADD8E6",  # Light Blue/Pastel Blue
-            "#DDA0DD",  # Plum/Pastel Purple
-        ]
+        self.pastel_colors = theme.PASTEL_COLORS
 
         master.configure(bg=self.bg_color)
-        s.configure('TFrame', background=self.bg_color)
-        s.configure('TLabel', background=self.bg_color, foreground=self.text_color)
-        
-        # --- Custom Font Styles ---
-        s.configure('Title.TLabel', font=('Arial', 14, 'bold'), foreground=self.text_color)
-        s.configure('Header.TLabel', font=('Arial', 15, 'bold'), foreground=self.text_color) 
-        s.configure('Subtitle.TLabel', font=('Arial', 10), foreground=self.primary_color)
-        s.configure('Body.TLabel', font=('Arial', 9), foreground=self.text_color)
-        s.configure('LightBody.TLabel', font=('Arial', 9), foreground=self.light_text_color)
-
-
-        s.configure('WhiteBackground.TFrame', background='white', relief='flat', borderwidth=0)
-        s.configure('WhiteBackground.TLabel', background='white', foreground=self.text_color)
-
-        # NEW: Card Style for the Profile Header (Subtle border for an elevated look)
-        s.configure('Card.TFrame', 
-                    background='white', 
-                    relief='solid', 
-                    borderwidth=1, 
-                    bordercolor=self.border_color # Note: This will not work on all themes/systems 
-                   ) 
-        s.layout('Card.TFrame', [
-            ('TFrame.border', {'sticky': 'nswe', 'children': [
-                ('TFrame.padding', {'sticky': 'nswe', 'children': [
-                    ('TFrame.label', {'sticky': 'nswe'})
-                ]})
-            ]})
-        ])
-
-
-        
-        # --- Project Card Styling (CLEAN LOOK) ---
-        s.configure('ProjectContainer.TFrame', background='white', borderwidth=0, relief='flat', padding=0) 
-        s.configure('Project.TFrame', background='white', borderwidth=0, relief='flat', padding=(0, 15)) 
-        s.configure('LastProject.TFrame', background='white', borderwidth=0, relief='flat', padding=(0, 15)) 
-
-        s.configure('Project.TLabel', background='white', foreground=self.text_color)
-        s.configure('TechUsed.TLabel', font=('Arial', 9, 'italic'), foreground=self.primary_color, background='white')
-        
-        # --- Skills Tag Styling (Default) ---
-        s.configure('Tag.TLabel', 
-                    background=self.tag_bg_light, 
-                    foreground=self.text_color, 
-                    font=('Arial', 9), 
-                    padding=(8, 4), 
-                    relief='solid', 
-                    borderwidth=1, 
-                    bordercolor=self.border_color 
-                   )
-        
-        # --- Skills Tag Styling (Generic Hover Style for consistent border) ---
-        s.configure('TagHover.TLabel', 
-                    foreground=self.text_color, 
-                    font=('Arial', 9), 
-                    padding=(8, 4), 
-                    relief='solid', 
-                    borderwidth=1, 
-                    bordercolor=self.primary_color 
-                   )
-
-        # Style for Experience Image Container 
-        s.configure('ExperienceImage.TFrame', background='#f0f0f0', borderwidth=1, relief='solid', padding=10) 
-        s.configure('ExperienceImage.TLabel', background='#f0f0f0') 
-        
-        # --- Table/Grid Styling for Activities (ALTERNATING ROW STYLES) ---
-        s.configure('ActivityHeader.TLabel', font=('Arial', 9, 'bold'), foreground='black', background='white')
-        s.configure('ActivityBody.TLabel', font=('Arial', 9), foreground='black', background='white')
-        s.configure('ActivityAltBody.TLabel', font=('Arial', 9), foreground='black', background=self.alt_bg_color) # NEW ALTERNATING STYLE
-
-
-        # --- Main Button Styling (IMPROVED RESPONSIVENESS) ---
-        s.configure('TButton', font=('Arial', 10, 'bold'), foreground='white', background=self.primary_color,
-                    padding=10, relief='flat', borderwidth=0)
-        s.map('TButton', 
-              background=[('active', '#006666'), ('pressed', '#004040')], 
-              foreground=[('pressed', 'white')]
-             ) 
-
-        # Secondary button (GitHub) 
-        s.configure('Secondary.TButton', font=('Arial', 10), foreground=self.primary_color, background=self.tag_bg_light,
-                    padding=10, relief='flat', borderwidth=0)
-        s.map('Secondary.TButton', 
-              background=[('active', self.border_color), ('pressed', '#c0c0c0')], 
-              foreground=[('pressed', self.primary_color)]
-             )
-
-
-        # Project button style
-        s.configure('Project.TButton', font=('Arial', 9), foreground=self.button_fg_dark, background=self.button_bg_light,
-                    relief='flat', borderwidth=0, padding=(5, 5))
-        s.map('Project.TButton', 
-              background=[('active', '#c0fafa'), ('pressed', '#a0e8e8')]
-             )
-
-
-        # --- Tab button styling (Ensuring consistency) ---
-        s.configure('Tab.TButton', background='white', foreground=self.text_color, font=('Arial', 10),
-                    relief='flat', padding=(10, 5))
-        s.map('Tab.TButton',
-              background=[('pressed', self.primary_color), ('active', self.border_color)],
-              foreground=[('pressed', 'white'), ('active', self.primary_color)], 
-              font=[('pressed', ('Arial', 10, 'bold')), ('active', ('Arial', 10, 'bold'))]
-             )
-        
-        # NEW: Active Tab Style for a stronger indicator
-        s.configure('ActiveTab.TButton', background=self.primary_color, foreground='white', font=('Arial', 10, 'bold'),
-                    relief='flat', padding=(10, 5))
-
-        self.create_widgets()
-
-
-    # --- Utility function to open links ---
+
+        with self.profiler.phase("create_widgets"):
+            self.create_widgets()
+        self.profiler.watch(master, ready=lambda: not self.image_loader.pending)
+        self.first_paint_done = False
+        master.bind("<Expose>", self.on_first_paint, add="+")
+
+    # --- After the first frame: warm the heavy modules and the browser, then build the other tabs ---
+    def on_first_paint(self, event):
+        if self.first_paint_done:
+            return
+        self.first_paint_done = True
+        deferred_imports.preload()
+        # Browser discovery happens once, on the link opener's thread, before the first click
+        self.link_opener.warm()
+        # Build the remaining tabs one per idle callback, only now that the first frame is up
+        if self.prebuild_tabs:
+            self.master.after_idle(self.prebuild_next_tab)
+
+
+    # --- Utility function to open links (the browser is started on a worker thread) ---
     def open_link(self, url):
-        webbrowser.open_new(url)
+        self.link_opener.open(url)
+
+    # --- Light-gray placeholder shown until the real image is decoded (plain Tk, no PIL needed) ---
+    def placeholder_image(self, width, height):
+        key = (width, height)
+        if key not in self.placeholder_images:
+            placeholder = tk.PhotoImage(master=self.master, width=width, height=height)
+            placeholder.put('lightgray', to=(0, 0, width, height))
+            self.placeholder_images[key] = placeholder
+        return self.placeholder_images[key]
+
+    # --- Display scaling: 1.0 at 96 dpi, 2.0 on a typical HiDPI screen ---
+    def display_scale(self):
+        return max(1.0, float(self.master.tk.call("tk", "scaling")) / (96 / 72))
+
+    # --- Experience image box for the current canvas width (default 400x300 until it is known) ---
+    def experience_image_box(self):
+        scale = self.display_scale()
+        if not self.canvas_width or self.canvas_width <= 1:
+            return int(400 * scale), int(300 * scale)
+        columns = max(1, len(self.resume["experience"]["images"]))
+        # Content padding (2 x 20) and per card: grid padx (2 x 5), card padding (2 x 10), border (2 x 1)
+        width = (self.canvas_width - 40) // columns - 32
+        width = width // self.IMAGE_SIZE_STEP * self.IMAGE_SIZE_STEP
+        width = int(min(max(width, self.MIN_EXPERIENCE_WIDTH), self.MAX_EXPERIENCE_WIDTH * scale))
+        return width, width * 3 // 4
+
+    # --- Load and Prepare Profile Photo (100x100 at 96 dpi) ---
+    def load_photo(self, target_label, on_ready=None):
+        side = int(round(100 * self.display_scale()))
+        size = (side, side)
+        photo_path = self.assets.resolve(self.resume["profile"]["photo"])
+        if photo_path is not None and self.load_bundled("photo", target_label, "photo", photo_path, size, on_ready):
+            return None
+        placeholder = self.placeholder_image(*size)
+        target_label.configure(image=placeholder)
 
-    # --- Load and Prepare Profile Photo (100x100) ---
-    def load_photo(self):
+        self.image_store.load("photo", target_label, lambda: self.decode_photo(size, photo_path), on_ready=on_ready)
+        return placeholder
+
+    # Worker-thread half of load_photo: returns a PIL image, never touches Tk
+    def decode_photo(self, size, photo_path):
+        from PIL import Image # PIL is imported by the workers, never on the startup path
         try:
-            # Assuming 'my_photo.png' is available in the run directory
-            original_image = Image.open("my_photo.png") 
-            size = (100, 100) 
-            resized_image = original_image.resize(size, Image.Resampling.LANCZOS)
-            self.photo_img = ImageTk.PhotoImage(resized_image)
-            return self.photo_img
+            # None when the asset resolver found no file for the resume's photo
+            if photo_path is None:
+                raise FileNotFoundError(self.resume["profile"]["photo"])
+            key = self.thumbnail_cache.make_key(photo_path, size, Image.Resampling.LANCZOS)
+            return self.thumbnail_cache.get_or_create(
+                key, lambda: self.image_pyramid.resize(photo_path, size)
+            )
         except FileNotFoundError:
             # Create a placeholder image if the file is not found
-            placeholder = Image.new('RGB', (100, 100), color=self.primary_color)
+            placeholder = Image.new('RGB', size, color=self.primary_color)
             from PIL import ImageDraw, ImageFont # Local import for placeholder
             d = ImageDraw.Draw(placeholder)
             try:
@@ -227,75 +299,142 @@ class ResumeApp:
                 font = ImageFont.truetype("arial.ttf", 40)
             except IOError:
                 font = ImageFont.load_default()
-            d.text((15, 20), "AP", fill="white", font=font)
-            self.photo_img = ImageTk.PhotoImage(placeholder)
-            return self.photo_img
-        except Exception:
-            return None
-            
-    # --- Load and Prepare Experience Images (INCREASED SIZE) ---
-    def load_experience_image(self, file_name, width=400, height=300): 
-        try:
-            # Check for placeholder image provided by user (image_6eb32c.png or image_6eba6e.png)
-            if file_name == "ecommerce_project.png" and os.path.exists("image_6eb32c.png"):
-                 original_image = Image.open("image_6eb32c.png") 
-            elif file_name == "flutter_project.png" and os.path.exists("image_6eba6e.png"):
-                 original_image = Image.open("image_6eba6e.png") 
-            elif not os.path.exists(file_name):
-                 return ImageTk.PhotoImage(Image.new('RGB', (width, height), color='lightgray'))
-            else:
-                 original_image = Image.open(file_name) 
-                 
-            original_width, original_height = original_image.size
-            ratio = min(width / original_width, height / original_height)
-            new_width = int(original_width * ratio)
-            new_height = int(original_image.size[1] * ratio) 
+            d.text((15, 20), self.resume["profile"]["initials"], fill="white", font=font)
+            return placeholder
             
-            resized_image = original_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            final_image = Image.new('RGB', (width, height), color='#f0f0f0') 
-            paste_x = (width - new_width) // 2
-            paste_y = (height - new_height) // 2
-            final_image.paste(resized_image, (paste_x, paste_y))
-
-            self.experience_images[file_name] = ImageTk.PhotoImage(final_image)
-            return self.experience_images[file_name]
-            
-        except Exception:
+    # --- Load and Prepare Experience Images (sized to the window, see experience_image_box) ---
+    def load_experience_image(self, file_name, target_label, width=None, height=None, on_ready=None):
+        if width is None:
+            width, height = self.experience_image_box()
+        key = "experience:" + file_name
+        self.experience_labels[file_name] = target_label
+        self.experience_box = (width, height)
+        # Re-loads at a new size keep showing the old image until the new one is ready
+        placeholder = None
+        if key not in self.image_store:
+            placeholder = self.placeholder_image(width, height)
+            target_label.configure(image=placeholder)
+
+        source_name = self.experience_source(file_name)
+        if source_name is None:
+            if on_ready is not None:
+                on_ready(None)
+            return placeholder
+        if self.load_bundled(key, target_label, "letterbox", source_name, (width, height), on_ready):
             return None
+
+        self.image_store.load(key, target_label,
+                              lambda: self.decode_experience_image(source_name, width, height),
+                              on_ready=on_ready)
+        return placeholder
+
+    # File actually decoded for an experience image (None when there is none, see assets.json)
+    def experience_source(self, file_name):
+        return self.assets.resolve(file_name)
+
+    # Worker-thread half of load_experience_image
+    def decode_experience_image(self, source_name, width, height):
+        from PIL import Image
+        # Warm starts read the letterboxed thumbnail straight from the disk cache
+        key = self.thumbnail_cache.make_key(source_name, (width, height), Image.Resampling.LANCZOS,
+                                            variant="letterbox#f0f0f0")
+        return self.thumbnail_cache.get_or_create(
+            key, lambda: self.letterbox_image(source_name, width, height)
+        )
             
+    # --- Resize to fit the box and centre it on a light gray canvas ---
+    def letterbox_image(self, source_name, width, height):
+        return self.image_pyramid.letterbox(source_name, width, height, background='#f0f0f0')
+
+    # --- Pre-resized pixels from the asset bundle: no decode, no worker round trip ---
+    def load_bundled(self, key, target_label, kind, source_name, size, on_ready=None):
+        entry = self.asset_bundle.entry(kind, source_name, size) if self.asset_bundle is not None else None
+        if entry is None:
+            return False
+        # One lookup per load; re-materializing an evicted image reuses the entry
+        self.image_store.load_ready(
+            key, target_label, lambda: self.asset_bundle.photo(self.master, kind, source_name, size, entry=entry),
+            on_ready=on_ready)
+        return True
+
     # --- New method to dynamically set the wraplength ---
     def on_info_frame_resize(self, event):
         new_wraplength = event.width - 10 
-        if new_wraplength > 1:
+        # Skip the relayout when the width has not actually changed
+        if new_wraplength > 1 and new_wraplength != self.summary_wraplength:
+             self.summary_wraplength = new_wraplength
              self.profile_summary_label.config(wraplength=new_wraplength)
 
     def on_canvas_configure(self, event):
         # Update the canvas window size to match the canvas width
         canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_frame, width=canvas_width)
+        if canvas_width != self.canvas_width:
+            self.canvas_width = canvas_width
+            self.canvas.itemconfig(self.canvas_frame, width=canvas_width)
+        self.refresh_virtual_lists()
+
+    # --- Once a resize has settled, re-resample the experience images for the new width ---
+    def on_canvas_settled(self, event):
+        box = self.experience_image_box()
+        if box == self.experience_box:
+            return
+        self.experience_box = box
+        for file_name, label in list(self.experience_labels.items()):
+            if label.winfo_exists():
+                self.load_experience_image(file_name, label, *box)
+
+    # --- Resize coalescing report (events seen vs. handler calls made) ---
+    def resize_stats(self):
+        return self.resize_dispatcher.stats()
+
+    # --- Scroll notifications: move the scrollbar, re-window virtual lists, re-check image visibility ---
+    def on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh_virtual_lists()
+        self.image_store.schedule_check()
+
+    def refresh_virtual_lists(self):
+        for virtual_list in self.virtual_lists:
+            virtual_list.schedule_refresh()
+
+    # --- Virtualized list mode (auto: only for long sections) ---
+    def should_virtualize(self, items):
+        if self.virtualize is None:
+            return len(items) > self.VIRTUALIZE_THRESHOLD
+        return self.virtualize
+
+    def add_virtual_list(self, parent, items, create_row, update_row, estimated_height):
+        virtual_list = VirtualList(parent, self.canvas, items, create_row, update_row,
+                                   estimated_height=estimated_height, style='WhiteBackground.TFrame')
+        self.virtual_lists.append(virtual_list)
+        return virtual_list
 
 
     def create_widgets(self):
+        profile = self.resume["profile"]
+
         # --- CV Download Link (UPDATED with the user's provided link) ---
-        self.cv_download_url = "https://github.com/misuuwu/Tkinter_Project1"
+        self.cv_download_url = profile["cv_url"]
         
         # --- SCROLLABLE SETUP START ---
         
         self.canvas = tk.Canvas(self.master, bg=self.bg_color, highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True)
+        self.image_store.canvas = self.canvas
 
-        scrollbar = ttk.Scrollbar(self.master, orient="vertical", command=self.canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self.master, orient="vertical", command=self.canvas.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
 
         self.main_content_frame = ttk.Frame(self.canvas, style='TFrame', width=400) 
         self.canvas_frame = self.canvas.create_window((0, 0), window=self.main_content_frame, anchor="nw")
 
-        self.main_content_frame.bind("<Configure>", lambda e: self.canvas.configure(
-            scrollregion=self.canvas.bbox("all")
-        ))
-        self.canvas.bind('<Configure>', self.on_canvas_configure) 
+        # Configure storms during a window drag are coalesced to one update per frame
+        self.resize_dispatcher = ResizeDispatcher(self.master)
+        self.resize_dispatcher.bind(self.main_content_frame, lambda e: self.schedule_scrollregion_update())
+        self.resize_dispatcher.bind(self.canvas, self.on_canvas_configure) 
+        # Debounced: runs once the window has stopped changing size
+        self.resize_dispatcher.bind(self.canvas, self.on_canvas_settled, trailing=True)
 
         # --- SCROLLABLE CONTENT START ---
         
@@ -320,6 +459,16 @@ class ResumeApp:
         download_button.pack(side='right')
         Tooltip(download_button, "Open the linked GitHub repository in a new window.")
 
+        # --- Profile Selector (only when several profiles were given) ---
+        if len(self.profile_paths) > 1:
+            self.profile_selector = ttk.Combobox(
+                title_button_frame, state='readonly', width=24,
+                values=[os.path.splitext(os.path.basename(path))[0] for path in self.profile_paths])
+            self.reset_profile_selector()
+            self.profile_selector.bind("<<ComboboxSelected>>",
+                                       lambda e: self.switch_profile(self.profile_paths[self.profile_selector.current()]))
+            self.profile_selector.pack(side='right', padx=(0, 10))
+
         # --- Profile Header Frame (The White Card - FIX: Removed invalid border options) ---
         header_frame = ttk.Frame(self.main_content_frame, padding=(20, 15), 
                                  style='Card.TFrame') # Use the new Card style
@@ -329,17 +478,12 @@ class ResumeApp:
         header_frame.grid_columnconfigure(1, weight=1) 
 
         # --- PHOTO INTEGRATION / FALLBACK ---
-        photo = self.load_photo()
-        if photo:
-            # Note: The image will still be on a white background from the style 'Card.TFrame'
-            photo_label = ttk.Label(header_frame, image=photo, background='white') 
-            photo_label.grid(row=0, column=0, rowspan=3, padx=(0, 15), sticky='n')
-            photo_label.image = photo 
-        else:
-            jd_label = ttk.Label(header_frame, text="AP", background=self.primary_color, foreground="white",
-                                 font=("Arial", 20, "bold"), anchor="center")
-            jd_label.grid(row=0, column=0, rowspan=3, padx=(0, 15), ipady=10, sticky='n')
-            jd_label.configure(width=1) 
+        # The label shows a placeholder now; the photo (or the "AP" fallback) is swapped in when decoded
+        # Note: The image will still be on a white background from the style 'Card.TFrame'
+        self.photo_label = ttk.Label(header_frame, background='white') 
+        self.photo_label.grid(row=0, column=0, rowspan=3, padx=(0, 15), sticky='n')
+        with self.profiler.phase("load_photo"):
+            self.load_photo(self.photo_label)
 
 
         # --- Info Frame (Text container) ---
@@ -348,66 +492,73 @@ class ResumeApp:
         info_frame.grid(row=0, column=1, rowspan=3, sticky='nsew')
         
         # Name 
-        ttk.Label(info_frame, text="Aiko Lindsay J. Pahuyo", style='Header.TLabel', background='white').pack(anchor='w')
+        self.profile_name_label = ttk.Label(info_frame, text=profile["name"], style='Header.TLabel', background='white')
+        self.profile_name_label.pack(anchor='w')
         
-        ttk.Label(info_frame, text="Technical Vocational Student", style='Subtitle.TLabel', background='white').pack(anchor='w')
+        self.profile_title_label = ttk.Label(info_frame, text=profile["title"], style='Subtitle.TLabel', background='white')
+        self.profile_title_label.pack(anchor='w')
 
         # --- Combined Bio and Objective ---
-        combined_text = """Passionate student developer seeking opportunities to apply foundational knowledge in full-stack development. Proficient in modern programming languages and collaborative development tools. I aim to explore different work environments to gain hands-on experience and learn new skills. By doing so, I hope to enhance my professional growth and shape my future career path. I want to help my team and company by taking on new challenges, learning new things, and working together with my colleagues to reach our goals."""
-        
         self.profile_summary_label = ttk.Label(
             info_frame, 
-            text=combined_text, 
+            text=profile["summary"], 
             style='LightBody.TLabel', 
             background='white', 
             justify='left'
         )
         self.profile_summary_label.pack(anchor='w', fill='x', pady=(5, 10))
+        self.search_targets[("summary",)] = ("summary", self.profile_summary_label)
 
-        info_frame.bind('<Configure>', self.on_info_frame_resize)
+        self.resize_dispatcher.bind(info_frame, self.on_info_frame_resize)
 
 
         # --- Connect buttons Frame (CENTERED) ---
         button_frame = ttk.Frame(self.main_content_frame, style='TFrame')
         button_frame.pack(pady=(0, 15), padx=20, fill='x') 
         
-        inner_button_frame = ttk.Frame(button_frame, style='TFrame')
-        inner_button_frame.pack(anchor='center') 
-
-        # 1. LinkedIn Button (Primary)
-        linkedin_button = ttk.Button(
-            inner_button_frame, 
-            text="Connect on LinkedIn", 
-            style='TButton',
-            command=lambda: self.open_link("https://www.linkedin.com/in/aiko-pahuyo-196191373/") 
-        )
-        linkedin_button.pack(side='left', padx=(0, 10)) 
-        Tooltip(linkedin_button, "View Aiko's professional network and experience.")
+        self.link_frame = ttk.Frame(button_frame, style='TFrame')
+        self.link_frame.pack(anchor='center') 
 
+        # One button per configured link (LinkedIn primary, GitHub secondary, ...)
+        self.link_buttons = []
+        for link in profile["links"]:
+            self.add_link_button(link)
 
-        # 2. GitHub Button (Secondary)
-        github_button = ttk.Button(
-            inner_button_frame, 
-            text="GitHub", 
-            style='Secondary.TButton',
-            command=lambda: self.open_link("https://github.com/misuuwu") 
-        )
-        github_button.pack(side='left') 
-        Tooltip(github_button, "Explore Aiko's code repositories and projects.")
 
+        # --- Search Bar (filters and highlights as you type) ---
+        search_frame = ttk.Frame(self.main_content_frame, padding=(20, 0), style='TFrame')
+        search_frame.pack(fill='x', pady=(0, 10), padx=20)
+        ttk.Label(search_frame, text="🔍 Search:", style='Body.TLabel').pack(side='left', padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self.on_search_changed)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        search_entry.pack(side='left')
+        search_entry.bind("<Escape>", lambda e: self.search_var.set(""))
+        self.search_status_label = ttk.Label(search_frame, style='LightBody.TLabel')
+        self.search_status_label.pack(side='left', padx=10)
 
         # --- Tab Navigation Frame ---
         tab_nav_frame = ttk.Frame(self.main_content_frame, padding=(20, 0), style='WhiteBackground.TFrame')
         tab_nav_frame.pack(fill='x', pady=(0, 10), padx=20) 
 
-        self.tab_buttons = []
-        tab_names = ["Experience", "Projects", "Skills", "Education"]
+        # --- Lazy Tab Registry ---
+        # Each builder runs the first time show_tab asks for its frame, so only
+        # the visible tab is paid for before the window appears.
+        self.tab_builders = {
+            "Experience": self.create_experience_tab,
+            "Projects": self.create_projects_tab,
+            "Skills": self.create_skills_tab,
+            "Education": self.create_education_tab,
+        }
+        self.tab_frames = {}
 
-        for tab_name in tab_names:
+        self.tab_buttons = {}
+
+        for tab_name in self.tab_builders:
             btn = ttk.Button(tab_nav_frame, text=tab_name, style='Tab.TButton',
                              command=lambda name=tab_name: self.show_tab(name))
             btn.pack(side='left', expand=True, fill='x', padx=2, pady=5)
-            self.tab_buttons.append(btn)
+            self.tab_buttons[tab_name] = btn
 
 
         # --- Content Area ---
@@ -415,51 +566,601 @@ class ResumeApp:
         self.content_container_frame = ttk.Frame(self.main_content_frame, style='TFrame')
         self.content_container_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20)) 
 
-        self.experience_frame = self.create_experience_tab(self.content_container_frame)
-        self.projects_frame = self.create_projects_tab(self.content_container_frame) 
-        self.skills_frame = self.create_skills_tab(self.content_container_frame)
-        self.education_frame = self.create_education_tab(self.content_container_frame)
+        with self.profiler.phase("first_show_tab"):
+            self.show_tab("Experience")
 
-        self.show_tab("Experience")
-        
         # --- SCROLLABLE SETUP END ---
         
 
+    # --- Link button; the URL is looked up when clicked, so switching profiles only patches text/style ---
+    def add_link_button(self, link):
+        index = len(self.link_buttons)
+        link_button = ttk.Button(
+            self.link_frame, 
+            text=link["label"], 
+            style=link.get("style", 'TButton'),
+            command=lambda: self.open_link(self.resume["profile"]["links"][index]["url"]) 
+        )
+        link_button.pack(side='left', padx=(0 if index == 0 else 10, 0)) 
+        # An empty tooltip text never shows, so every button can carry one
+        link_button.tooltip = Tooltip(link_button, link.get("tooltip", ""))
+        self.link_buttons.append(link_button)
+
+    # --- Build a tab on first use and cache its frame ---
+    def get_tab_frame(self, tab_name):
+        frame = self.tab_frames.get(tab_name)
+        if frame is None:
+            known_targets = set(self.search_targets)
+            known_sources = len(self.virtual_sources)
+            with self.profiler.phase("create_%s_tab" % tab_name.lower()):
+                frame = self.tab_builders[tab_name](self.content_container_frame)
+            if self.search_matches is not None:
+                # Widgets built while a query is active start out filtered
+                self.apply_search(set(self.search_targets) - known_targets,
+                                  {kind for _, kind, _ in self.virtual_sources[known_sources:]})
+            self.tab_frames[tab_name] = frame
+        return frame
+
+    # --- Idle-time prebuild (one tab per idle pass so input stays responsive) ---
+    def prebuild_next_tab(self):
+        for tab_name in self.tab_builders:
+            if tab_name not in self.tab_frames:
+                self.get_tab_frame(tab_name)
+                self.master.after_idle(self.prebuild_next_tab)
+                return
+
     def show_tab(self, tab_name):
-        # Hide all tab frames
-        for frame in [self.experience_frame, self.projects_frame, self.skills_frame, self.education_frame]:
-            frame.pack_forget()
-
-        # Show the selected tab frame
-        if tab_name == "Experience":
-            self.experience_frame.pack(fill='both', expand=True)
-        elif tab_name == "Projects":
-            self.projects_frame.pack(fill='both', expand=True)
-        elif tab_name == "Skills":
-            self.skills_frame.pack(fill='both', expand=True)
-        elif tab_name == "Education":
-            self.education_frame.pack(fill='both', expand=True)
-
-        # Update button styles (NEW: Use ActiveTab.TButton for a strong indicator)
-        for btn in self.tab_buttons:
-            if btn.cget('text') == tab_name:
-                btn.configure(style='ActiveTab.TButton')
-            else:
-                btn.configure(style='Tab.TButton')
-                
-        # Reconfigure scroll region after changing tab content
-        self.master.update_idletasks() 
+        if tab_name == self.active_tab:
+            return
+        start = time.perf_counter()
+        first_visit = tab_name not in self.tab_frames
+
+        # Only the outgoing and incoming frames/buttons are touched
+        if self.active_tab is not None:
+            self.tab_frames[self.active_tab].pack_forget()
+            self.tab_buttons[self.active_tab].configure(style='Tab.TButton')
+
+        # Show the selected tab frame (building it if this is the first visit)
+        self.get_tab_frame(tab_name).pack(fill='both', expand=True)
+        # NEW: Use ActiveTab.TButton for a strong indicator
+        self.tab_buttons[tab_name].configure(style='ActiveTab.TButton')
+        self.active_tab = tab_name
+
+        # Reconfigure scroll region once Tk has laid out the new content
+        self.schedule_scrollregion_update()
+        # The switch is finished when the idle redraw for it has run
+        self.master.after_idle(lambda: self.record_tab_switch(tab_name, start, first_visit))
+
+    # --- Deferred scrollregion refresh (many requests per idle pass collapse into one) ---
+    def schedule_scrollregion_update(self):
+        if self.scrollregion_id is None:
+            self.scrollregion_id = self.master.after_idle(self.update_scrollregion)
+
+    def update_scrollregion(self):
+        self.scrollregion_id = None
         self.canvas.config(scrollregion=self.canvas.bbox("all"))
 
+    # --- Tab-switch latency metric ---
+    def record_tab_switch(self, tab_name, start, first_visit):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.tab_switch_times.append((tab_name, elapsed_ms, first_visit))
+
+    def tab_switch_stats(self, include_first_visits=False):
+        times = [ms for _, ms, first in self.tab_switch_times if include_first_visits or not first]
+        return self._latency_stats(times, self.tab_switch_times[-1][1] if self.tab_switch_times else None)
+
+    # --- Shared latency summary for the *_stats() reports (times in ms, `last` the newest sample) ---
+    def _latency_stats(self, times, last):
+        times = sorted(times)
+        if not times:
+            return {"count": 0}
+        return {
+            "count": len(times),
+            "last_ms": round(last, 3),
+            "mean_ms": round(sum(times) / len(times), 3),
+            "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 3),
+            "max_ms": round(times[-1], 3),
+            "over_frame_budget": sum(1 for ms in times if ms > self.FRAME_BUDGET_MS),
+        }
+
+
+    # --- Profile Switching ---
+    # The new profile is diffed against the current one and the existing widgets
+    # are patched in place: changed text is reconfigured, cards, tags and rows are
+    # reused by position, and only surplus or missing ones are destroyed or built.
+    # Tabs not built yet simply build from the new data later; a built tab is
+    # rebuilt only when its shape changes (e.g. a list crosses the virtualization
+    # threshold or the skill sections are regrouped).
+    def load_profile(self, path):
+        resume = self.profiles.get(path)
+        if resume is None:
+            resume = self.profiles[path] = load_resume(path)
+        return resume
+
+    # The selector shows the profile on screen (after a failed switch too)
+    def reset_profile_selector(self):
+        self.profile_selector.current(self.profile_paths.index(self.resume_path)
+                                      if self.resume_path in self.profile_paths else 0)
+
+    def switch_profile(self, path):
+        start = time.perf_counter()
+        try:
+            new = self.load_profile(path)
+        except (ValueError, OSError) as e:
+            # Missing, half-saved or invalid: keep the current profile; a later pick tries the file again
+            print("Profile switch skipped: %s" % e, file=sys.stderr)
+            if len(self.profile_paths) > 1:
+                self.reset_profile_selector()
+            return
+        if new is self.resume:
+            return
+        self.apply_resume(new, path)
+        # Like tab switches, the switch is finished when the idle redraw for it has run
+        self.master.after_idle(lambda: self.profile_switch_times.append((time.perf_counter() - start) * 1000))
+
+    # Patch every built widget from the current resume to `new`
+    def apply_resume(self, new, path):
+        old = self.resume
+
+        # Patch against unfiltered widgets; the query is re-applied to the new content below
+        query = self.search_var.get()
+        if self.search_matches is not None:
+            self.search_var.set("")
+            if self.search_id is not None:
+                self.master.after_cancel(self.search_id)
+                self.search_id = None
+            self.run_search()
+
+        self.resume = new
+        self.resume_path = path
+        # Kept for the patchers: the same asset name can be a different file in the new profile
+        self.previous_assets = self.assets
+        self.assets = AssetResolver.for_resume(path)
+        if self.asset_bundle is not None:
+            self.asset_bundle.resolver = self.assets
+        self.assets.warn_missing(resume_assets(new))
+        self.search_index = SearchIndex.from_resume(new)
+        self.patch_header(old["profile"], new["profile"])
+        patchers = {
+            "Experience": self.patch_experience_tab,
+            "Projects": self.patch_projects_tab,
+            "Skills": self.patch_skills_tab,
+            "Education": self.patch_education_tab,
+        }
+        for tab_name, frame in list(self.tab_frames.items()):
+            if not patchers[tab_name](frame, old, new):
+                self.rebuild_tab(tab_name)
+
+        if query:
+            self.search_var.set(query)
+        self.schedule_scrollregion_update()
+        if self.file_watcher is not None:
+            self.file_watcher.set_paths(self.watched_paths())
+
+    # What an asset name shows: the resolved file and its (size, mtime_ns) from the last scan
+    def asset_identity(self, assets, name):
+        path = assets.resolve(name)
+        return path, assets.files.get(path)
+
+    # Reconfigure only when the data actually changed
+    def patch_text(self, widget, old_text, new_text):
+        if old_text != new_text:
+            widget.configure(text=new_text)
+
+    # Same for widgets that only exist on the Tcl side; lines are collected into one script
+    def patch_text_path(self, script, path, old_text, new_text):
+        if old_text != new_text:
+            script.append(command(path, "configure", text=new_text))
+
+    def patch_header(self, old, new):
+        self.cv_download_url = new["cv_url"]
+        self.patch_text(self.profile_name_label, old["name"], new["name"])
+        self.patch_text(self.profile_title_label, old["title"], new["title"])
+        self.patch_text(self.profile_summary_label, old["summary"], new["summary"])
+        old_photo = self.asset_identity(self.previous_assets, old["photo"])
+        if (old_photo, old["initials"]) != (self.asset_identity(self.assets, new["photo"]), new["initials"]):
+            self.load_photo(self.photo_label)
+
+        old_links, links = old["links"], new["links"]
+        for index, link in enumerate(links):
+            if index >= len(self.link_buttons):
+                self.add_link_button(link)
+                continue
+            if index < len(old_links) and old_links[index] == link:
+                continue
+            link_button = self.link_buttons[index]
+            link_button.configure(text=link["label"], style=link.get("style", 'TButton'))
+            link_button.tooltip.text = link.get("tooltip", "")
+        for link_button in self.link_buttons[len(links):]:
+            link_button.destroy()
+        del self.link_buttons[len(links):]
+
+    def patch_experience_tab(self, frame, old, new):
+        old_experience, experience = old["experience"], new["experience"]
+        self.patch_text(frame.heading_label, old_experience["heading"], experience["heading"])
+        old_images, images = old_experience["images"], experience["images"]
+        # Compared by resolved file, not name: profiles in other directories reuse names like 1.png
+        old_files = [self.asset_identity(self.previous_assets, name) for name in old_images]
+        files = [self.asset_identity(self.assets, name) for name in images]
+        if old_images == images and old_files == files:
+            return True
+
+        # The image box depends on the column count, so a count change reloads every image
+        kept = len(old_images) == len(images)
+        reload = [column for column in range(min(len(old_images), len(images)))
+                  if not kept or old_images[column] != images[column] or old_files[column] != files[column]]
+        # Surplus cards go first: the <Destroy> binding drops their entries from the image
+        # store before any surviving column takes over one of those keys
+        for column in range(len(images), len(frame.image_labels)):
+            frame.image_labels[column].master.destroy()
+            frame.images_frame.columnconfigure(column, weight=0)
+        del frame.image_labels[len(images):]
+        for file_name in set(old_images) - set(images):
+            self.image_store.forget("experience:" + file_name)
+            self.experience_labels.pop(file_name, None)
+        for column in reload:
+            self.load_experience_image(images[column], frame.image_labels[column])
+        for file_name in images[len(frame.image_labels):]:
+            self.add_experience_image_card(frame, file_name)
+        return True
+
+    def patch_projects_tab(self, frame, old, new):
+        old_projects, projects = old["projects"], new["projects"]
+        sources = [source for source in self.virtual_sources if source[1] == "project"]
+        if self.should_virtualize(projects) != bool(sources):
+            return False
+        if sources:
+            virtual_list = sources[0][0]
+            self.virtual_sources[self.virtual_sources.index(sources[0])] = (virtual_list, "project", projects)
+            virtual_list.set_items(projects)
+            return True
+
+        for index, project in enumerate(projects):
+            is_last = index == len(projects) - 1
+            if index < len(self.project_cards):
+                card_frame = self.project_cards[index]
+                if project != old_projects[index]:
+                    self.fill_project_card(card_frame, is_last=is_last, **project)
+                elif is_last != (index == len(old_projects) - 1):
+                    self.set_project_card_last(card_frame, is_last)
+            else:
+                card_frame = self.create_project_card(frame.projects_container, is_last=is_last, **project)
+                self.project_cards.append(card_frame)
+            self.search_targets[("project", index)] = ("card", card_frame)
+        for index in range(len(projects), len(self.project_cards)):
+            self.project_cards[index].destroy()
+            self.search_targets.pop(("project", index), None)
+        del self.project_cards[len(projects):]
+        return True
+
+    # Which groups exist and which of them have a label; patching needs the same shape
+    def skills_shape(self, sections):
+        return [[bool(group.get("label")) for group in section["groups"]] for section in sections]
+
+    def patch_skills_tab(self, frame, old, new):
+        old_sections, sections = old["skills"], new["skills"]
+        if self.skills_shape(old_sections) != self.skills_shape(sections):
+            return False
+        script = []
+        for s, (old_section, section) in enumerate(zip(old_sections, sections)):
+            self.patch_text_path(script, frame.section_title_paths[s], old_section["title"], section["title"])
+            for g, (old_group, group) in enumerate(zip(old_section["groups"], section["groups"])):
+                if (s, g) in frame.group_label_paths:
+                    self.patch_text_path(script, frame.group_label_paths[(s, g)], old_group["label"], group["label"])
+                self.patch_tag_flow(script, frame.tag_flows[(s, g)], old_group["tags"], group["tags"],
+                                    ("tag", s, g), self.hover_tag_spec)
+        if script:
+            self.master.tk.eval("\n".join(script))
+        return True
+
+    # --- Reuse tag labels by position: new text where it differs, build or destroy the difference ---
+    def patch_tag_flow(self, script, flow_layout, old_tags, tags, doc_prefix, tag_spec):
+        paths = list(flow_layout.paths)
+        for path, old_text, text in zip(paths, old_tags, tags):
+            if old_text != text:
+                script.append(command(path, "configure", text=text))
+                flow_layout.invalidate(path)
+        for path in paths[len(tags):]:
+            flow_layout.remove(path)
+            self.style_batcher.forget(path)
+            script.append(command("destroy", path))
+        if len(tags) > len(paths):
+            flow_layout.add(self.bulk_builder.build(flow_layout.frame_path,
+                                                    [tag_spec(text) for text in tags[len(paths):]]))
+        for index, path in enumerate(flow_layout.paths):
+            self.search_targets[doc_prefix + (index,)] = ("tag", flow_layout, path)
+        for index in range(len(tags), len(paths)):
+            self.search_targets.pop(doc_prefix + (index,), None)
+
+    def patch_education_tab(self, frame, old, new):
+        old_education, education = old["education"], new["education"]
+        sources = [source for source in self.virtual_sources if source[1] == "activity"]
+        if self.should_virtualize(education["activities"]) != bool(sources):
+            return False
+        for key in ("degree", "gpa", "school", "detail"):
+            self.patch_text(getattr(frame, key + "_label"), old_education[key], education[key])
+
+        script = []
+        self.patch_tag_flow(script, frame.course_flow, old_education["coursework"], education["coursework"],
+                            ("course",), self.course_tag_spec)
+        if sources:
+            virtual_list = sources[0][0]
+            self.virtual_sources[self.virtual_sources.index(sources[0])] = (virtual_list, "activity",
+                                                                              education["activities"])
+            virtual_list.set_items(education["activities"])
+        else:
+            self.patch_activity_rows(script, frame, old_education["activities"], education["activities"])
+        if script:
+            self.master.tk.eval("\n".join(script))
+
+        if old_education["achievements"] != education["achievements"]:
+            for child in frame.achievements_frame.winfo_children():
+                child.destroy()
+            self.fill_achievements(frame.achievements_frame, education["achievements"])
+        return True
+
+    def patch_activity_rows(self, script, frame, old_activities, activities):
+        rows = frame.activity_rows
+        kept = min(len(rows), len(activities))
+        for i in range(kept):
+            for path, key in zip(rows[i][0], self.ACTIVITY_KEYS):
+                self.patch_text_path(script, path, old_activities[i][key], activities[i][key])
+        # Surplus rows go away, and the new last row loses its separator
+        for i in range(kept, len(rows)):
+            cell_paths, separator_path = rows[i]
+            script.extend(command("destroy", path) for path in cell_paths + [separator_path] if path)
+            self.search_targets.pop(("activity", i), None)
+        del rows[kept:]
+        for i, row in enumerate(rows):
+            needs_separator = i < len(activities) - 1
+            if row[1] and not needs_separator:
+                script.append(command("destroy", row[1]))
+                row[1] = None
+            elif needs_separator and not row[1]:
+                row[1] = self.bulk_builder.build(frame.activities_frame, [self.activity_separator_spec(i)])[0]
+        if len(activities) > kept:
+            self.add_activity_rows(frame, activities, kept, len(activities))
+        else:
+            self.register_activity_targets(frame)
+
+    # --- Throw a tab away and build it again from the current data ---
+    def rebuild_tab(self, tab_name):
+        frame = self.tab_frames.pop(tab_name)
+        prefix = str(frame) + "."
+        kinds = self.TAB_DOC_KINDS[tab_name]
+        self.search_targets = {doc_id: target for doc_id, target in self.search_targets.items()
+                               if doc_id[0] not in kinds}
+        dropped_layouts = [layout for layout in self.flow_layouts if layout.frame_path.startswith(prefix)]
+        self.flow_layouts = [layout for layout in self.flow_layouts if not layout.frame_path.startswith(prefix)]
+        self.virtual_lists = [vl for vl in self.virtual_lists if not str(vl).startswith(prefix)]
+        self.virtual_sources = [source for source in self.virtual_sources if not str(source[0]).startswith(prefix)]
+        self.style_batcher.forget_prefix(prefix)
+        if tab_name == "Projects":
+            self.project_cards = []
+        elif tab_name == "Experience":
+            self.experience_labels.clear()
+        frame.destroy()
+        # After the destroy, so no binding can still call into a deleted command
+        for layout in dropped_layouts:
+            layout.dispose()
+        if tab_name == self.active_tab:
+            self.active_tab = None
+            self.show_tab(tab_name)
+
+    def profile_switch_stats(self):
+        times = self.profile_switch_times
+        return self._latency_stats(times, times[-1] if times else None)
+
+    # --- Hot Reload (--watch) ---
+    # The resume file and every image it shows are watched (see file_watcher.py).
+    # An edited resume is re-read and patched in exactly like a profile switch,
+    # so only widgets whose data changed are touched; an edited image is
+    # re-decoded for its own label only (the thumbnail and pyramid caches are
+    # keyed by mtime). The active tab and scroll position are kept. Each reload
+    # records the time from the file event to the idle pass that shows it, or
+    # to the moment the last re-decoded image is attached.
+    def start_watching(self, use_inotify=True):
+        self.file_watcher = FileWatcher(self.watched_paths(), use_inotify=use_inotify)
+        self.file_watcher.start()
+        self.watch_id = self.master.after(self.WATCH_POLL_MS, self.poll_file_changes)
+        return self.file_watcher
+
+    def stop_watching(self):
+        if self.watch_id is not None:
+            try:
+                self.master.after_cancel(self.watch_id)
+            except tk.TclError:
+                pass
+            self.watch_id = None
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+
+    def watched_paths(self):
+        # Every candidate file, so a replacement that appears later is noticed too
+        paths = [self.resume_path]
+        for name in resume_assets(self.resume):
+            paths += self.assets.candidate_paths(name)
+        return paths
+
+    def poll_file_changes(self):
+        self.watch_id = None
+        changed, detected_at = set(), None
+        for paths, at in self.file_watcher.get_changes():
+            changed |= paths
+            detected_at = at if detected_at is None else min(detected_at, at)
+        if changed:
+            self.reload_changed(changed, detected_at)
+        self.watch_id = self.master.after(self.WATCH_POLL_MS, self.poll_file_changes)
+
+    def reload_changed(self, paths, detected_at):
+        def is_changed(path):
+            return path is not None and os.path.abspath(path) in paths
+
+        def asset_changed(name):
+            return any(is_changed(path) for path in self.assets.candidate_paths(name))
+
+        active_tab = self.active_tab
+        scroll = self.canvas.yview()[0]
+        reload = {"kinds": [], "pending": 1, "failed": 0}
+
+        def settle():
+            reload["pending"] -= 1
+            if reload["pending"] == 0:
+                self.master.after_idle(lambda: self.record_reload(reload["kinds"], detected_at, reload["failed"]))
+
+        # Called once per image load, with None when it failed: the reload is still recorded
+        def done(photo):
+            if photo is None:
+                reload["failed"] += 1
+            settle()
+
+        if is_changed(self.resume_path):
+            try:
+                new = load_resume(self.resume_path)
+            except (ValueError, OSError) as e:
+                # Half-saved or invalid file: keep showing the last good version
+                print("Reload skipped: %s" % e, file=sys.stderr)
+            else:
+                self.profiles[self.resume_path] = new
+                self.apply_resume(new, self.resume_path)
+                reload["kinds"].append("resume")
+        # Files may have appeared or disappeared: re-resolve from a fresh scan
+        self.assets.scan()
+        if asset_changed(self.resume["profile"]["photo"]):
+            reload["pending"] += 1
+            reload["kinds"].append("photo")
+            self.load_photo(self.photo_label, on_ready=done)
+        for file_name, label in list(self.experience_labels.items()):
+            if label.winfo_exists() and asset_changed(file_name):
+                reload["pending"] += 1
+                reload["kinds"].append("image")
+                # Keeps the old image on screen until the new decode is attached
+                self.load_experience_image(file_name, label, *self.experience_box, on_ready=done)
+
+        if active_tab is not None and self.active_tab != active_tab:
+            self.show_tab(active_tab)
+        # After the scrollregion refresh queued by the patch
+        self.master.after_idle(lambda: self.canvas.yview_moveto(scroll))
+        if self.file_watcher is not None:
+            self.file_watcher.set_paths(self.watched_paths())
+        settle()
+
+    def record_reload(self, kinds, detected_at, failed=0):
+        if not kinds:
+            return
+        latency_ms = (time.time() - detected_at) * 1000
+        self.reload_times.append((tuple(kinds), latency_ms, failed))
+        print("Reloaded %s in %.1f ms%s" % (", ".join(sorted(set(kinds))), latency_ms,
+                                            " (%d images failed)" % failed if failed else ""), file=sys.stderr)
+
+    def reload_stats(self):
+        stats = self._latency_stats([ms for _, ms, _ in self.reload_times],
+                                    self.reload_times[-1][1] if self.reload_times else None)
+        if stats["count"]:
+            stats["backend"] = self.file_watcher.backend if self.file_watcher is not None else None
+            stats["failed_images"] = sum(failed for _, _, failed in self.reload_times)
+        return stats
+
+    # --- Search (each keystroke is an index lookup plus updates to the widgets that changed) ---
+    def on_search_changed(self, *args):
+        if self.search_id is None:
+            self.search_id = self.master.after_idle(self.run_search)
+
+    def run_search(self):
+        self.search_id = None
+        start = time.perf_counter()
+        previous, self.search_matches = self.search_matches, self.search_index.search(self.search_var.get())
+        if previous is None and self.search_matches is None:
+            return
+        if previous is None or self.search_matches is None:
+            changed = set(self.search_targets)
+        else:
+            changed = previous ^ self.search_matches
+        self.apply_search(changed, {kind for _, kind, _ in self.virtual_sources})
+
+        if self.search_matches is None:
+            self.search_status_label.configure(text="")
+        else:
+            count = len(self.search_matches)
+            self.search_status_label.configure(text="%d match%s" % (count, "" if count == 1 else "es")
+                                               if count else "No matches")
+        self.search_times.append((time.perf_counter() - start) * 1000)
+
+    # None while no query is active, otherwise whether the document matches
+    def search_state(self, doc_id):
+        return None if self.search_matches is None else doc_id in self.search_matches
+
+    def apply_search(self, doc_ids, virtual_kinds=()):
+        script = []
+        cards_changed = False
+        for doc_id in doc_ids:
+            target = self.search_targets.get(doc_id)
+            if target is None:
+                continue
+            state = self.search_state(doc_id)
+            kind = target[0]
+            if kind == "tag":
+                _, flow_layout, path = target
+                flow_layout.set_hidden(path, state is False)
+                if state:
+                    self.matched_tags.add(path)
+                else:
+                    self.matched_tags.discard(path)
+                self.style_batcher.set_style(path, self.tag_rest_style(path))
+            elif kind == "card":
+                cards_changed = True
+                self.highlight_project_card(target[1], state)
+            elif kind == "row":
+                _, cell_paths, separator_path = target
+                background = theme.MATCH_BG_COLOR if state else '{}'
+                for path in cell_paths:
+                    script.append("grid %s %s" % ("remove" if state is False else "configure", path))
+                    script.append("%s configure -background %s" % (path, background))
+                if separator_path:
+                    script.append("grid %s %s" % ("remove" if state is False else "configure", separator_path))
+            elif kind == "summary":
+                target[1].configure(background=theme.MATCH_BG_COLOR if state else 'white')
+        if script:
+            self.master.tk.eval("\n".join(script))
+        if cards_changed:
+            self.repack_project_cards()
+        for virtual_list, kind, items in self.virtual_sources:
+            if kind in virtual_kinds:
+                virtual_list.set_items([item for index, item in enumerate(items)
+                                        if self.search_state((kind, index)) is not False])
+        self.schedule_scrollregion_update()
+
+    def highlight_project_card(self, card_frame, matched):
+        card_frame.title_label.configure(background=theme.MATCH_BG_COLOR if matched else '')
+
+    # Re-pack the matching cards in their original order; the last one drops its separator
+    def repack_project_cards(self):
+        visible = [card for index, card in enumerate(self.project_cards)
+                   if self.search_state(("project", index)) is not False]
+        for card_frame in self.project_cards:
+            card_frame.pack_forget()
+        for index, card_frame in enumerate(visible):
+            self.set_project_card_last(card_frame, index == len(visible) - 1)
+            card_frame.pack(fill='x', expand=True, pady=0)
+
+    def search_stats(self):
+        stats = self._latency_stats(self.search_times, self.search_times[-1] if self.search_times else None)
+        if stats["count"]:
+            stats["index"] = self.search_index.stats()
+        return stats
 
     # --- Project Card Creation Helper ---
     def create_project_card(self, parent_frame, title, description, tech_used, repo_link, is_last=False):
-        # Determine the style based on whether it is the last card
-        style_name = 'LastProject.TFrame' if is_last else 'Project.TFrame'
-        
-        # Card frame for the whole project entry
-        card_frame = ttk.Frame(parent_frame, style=style_name)
+        card_frame = self.build_project_card(parent_frame)
+        self.fill_project_card(card_frame, title, description, tech_used, repo_link, is_last)
         card_frame.pack(fill='x', expand=True, pady=0) 
+        return card_frame
+
+    # Builds an empty card; fill_project_card sets its content (cards are recycled when virtualized)
+    def build_project_card(self, parent_frame):
+        # Card frame for the whole project entry
+        card_frame = ttk.Frame(parent_frame, style='Project.TFrame')
 
         # Content Frame to hold all the text and button, and apply inner left/right padding
         content_frame = ttk.Frame(card_frame, style='WhiteBackground.TFrame') 
@@ -469,70 +1170,93 @@ class ResumeApp:
         content_frame.columnconfigure(0, weight=1) 
         
         # Row 0: Title 
-        ttk.Label(content_frame, text=title, font=('Arial', 11, 'bold'), style='Project.TLabel').grid(row=0, column=0, sticky='w', pady=(0, 2))
+        card_frame.title_label = ttk.Label(content_frame, font=('Arial', 11, 'bold'), style='Project.TLabel')
+        card_frame.title_label.grid(row=0, column=0, sticky='w', pady=(0, 2))
         # Row 1: Tech Used
-        ttk.Label(content_frame, text=tech_used, style='TechUsed.TLabel').grid(row=1, column=0, sticky='w', pady=(0, 8))
+        card_frame.tech_label = ttk.Label(content_frame, style='TechUsed.TLabel')
+        card_frame.tech_label.grid(row=1, column=0, sticky='w', pady=(0, 8))
         
         # Row 2: Description 
-        ttk.Label(content_frame, text=description, wraplength=550, style='Body.TLabel', background='white', justify='left').grid(row=2, column=0, sticky='w', pady=(0, 10))
+        card_frame.description_label = ttk.Label(content_frame, wraplength=550, style='Body.TLabel', background='white', justify='left')
+        card_frame.description_label.grid(row=2, column=0, sticky='w', pady=(0, 10))
 
         # Row 3: Button (Centered button text)
+        card_frame.repo_link = None
         ttk.Button(content_frame, text="<> View Repository", style='Project.TButton', 
-                   command=lambda: self.open_link(repo_link)).grid(row=3, column=0, sticky='w') # kept left aligned for consistency with text
+                   command=lambda: self.open_link(card_frame.repo_link)).grid(row=3, column=0, sticky='w') # kept left aligned for consistency with text
         
-        # If not the last card, apply a separator widget
-        if not is_last:
-            separator = ttk.Separator(card_frame, orient='horizontal')
-            # Place it at the very bottom of the card, filling the width
-            separator.pack(fill='x', side='bottom', pady=(15, 0), padx=20) # Apply horizontal padding to separator
-
+        # Separator at the very bottom of the card (packed for every card but the last)
+        card_frame.separator = ttk.Separator(card_frame, orient='horizontal')
         return card_frame
 
+    def fill_project_card(self, card_frame, title, description, tech_used, repo_link, is_last=False):
+        card_frame.title_label.configure(text=title)
+        card_frame.tech_label.configure(text=tech_used)
+        card_frame.description_label.configure(text=description)
+        card_frame.repo_link = repo_link
+        self.set_project_card_last(card_frame, is_last)
+
+    def set_project_card_last(self, card_frame, is_last):
+        # Determine the style based on whether it is the last card
+        card_frame.configure(style='LastProject.TFrame' if is_last else 'Project.TFrame')
+        if is_last:
+            card_frame.separator.pack_forget()
+        else:
+            # Apply horizontal padding to separator, filling the width
+            card_frame.separator.pack(fill='x', side='bottom', pady=(15, 0), padx=20)
+
+    # --- Activity row for the virtualized activities table ---
+    def build_activity_row(self, parent_frame):
+        row_frame = ttk.Frame(parent_frame, style='WhiteBackground.TFrame')
+        row_frame.columnconfigure(0, minsize=110)
+        row_frame.columnconfigure(1, weight=1, uniform='activity')
+        row_frame.columnconfigure(2, weight=1, uniform='activity')
+        row_frame.cells = []
+        for column in range(3):
+            cell = ttk.Label(row_frame, style='ActivityBody.TLabel', anchor='w')
+            cell.grid(row=0, column=column, padx=5, pady=8, sticky='w')
+            row_frame.cells.append(cell)
+        ttk.Separator(row_frame, orient='horizontal').grid(row=1, column=0, columnspan=3, sticky='ew')
+        return row_frame
+
+    def fill_activity_row(self, row_frame, activity, index):
+        # Alternating row colours, same as the fully built table
+        style_name = 'ActivityBody.TLabel' if index % 2 == 0 else 'ActivityAltBody.TLabel'
+        # While searching, every row still in the list is a match
+        background = theme.MATCH_BG_COLOR if self.search_matches is not None else ''
+        for cell, key in zip(row_frame.cells, ("dates", "organization", "position")):
+            cell.configure(text=activity[key], style=style_name, background=background)
+
     # --- Experience Tab Content ---
     def create_experience_tab(self, parent_frame):
         frame = ttk.Frame(parent_frame, style='WhiteBackground.TFrame')
         
-        ttk.Label(frame, text="Project Visuals", style='Subtitle.TLabel', foreground=self.primary_color, background='white').pack(anchor='w', pady=(10, 5))
-        
-        # Container for the three image cards 
-        all_images_wrapper_frame = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        all_images_wrapper_frame.pack(fill='x', pady=(0, 10))
-        
-        all_images_wrapper_frame.columnconfigure(0, weight=1)
-        all_images_wrapper_frame.columnconfigure(1, weight=1)
-        all_images_wrapper_frame.columnconfigure(2, weight=1)
-        
+        experience = self.resume["experience"]
+        frame.heading_label = ttk.Label(frame, text=experience["heading"], style='Subtitle.TLabel', foreground=self.primary_color, background='white')
+        frame.heading_label.pack(anchor='w', pady=(10, 5))
         
-        # 1. E-commerce Image Card (Column 0)
-        ecommerce_card_frame = ttk.Frame(all_images_wrapper_frame, style='ExperienceImage.TFrame')
-        ecommerce_card_frame.grid(row=0, column=0, padx=5, pady=5, sticky='nsew')
+        # Container for the image cards (one column per image)
+        frame.images_frame = ttk.Frame(frame, style='WhiteBackground.TFrame')
+        frame.images_frame.pack(fill='x', pady=(0, 10))
+        frame.image_labels = []
         
-        # Using placeholder image 'image_6eb32c.png' for the first card
-        ecommerce_img = self.load_experience_image("ecommerce_project.png") 
-        if ecommerce_img:
-            ttk.Label(ecommerce_card_frame, image=ecommerce_img, style='ExperienceImage.TLabel').pack()
+        for file_name in experience["images"]:
+            self.add_experience_image_card(frame, file_name)
 
+        return frame
 
-        # 2. Flutter Image Card (Column 1)
-        flutter_card_frame = ttk.Frame(all_images_wrapper_frame, style='ExperienceImage.TFrame')
-        flutter_card_frame.grid(row=0, column=1, padx=5, pady=5, sticky='nsew')
-        
-        # Using placeholder image 'image_6eba6e.png' for the second card
-        flutter_img = self.load_experience_image("flutter_project.png") 
-        if flutter_img:
-            ttk.Label(flutter_card_frame, image=flutter_img, style='ExperienceImage.TLabel').pack()
-
+    def add_experience_image_card(self, frame, file_name):
+        column = len(frame.image_labels)
+        frame.images_frame.columnconfigure(column, weight=1)
 
-        # 3. Blender Image Card (Column 2)
-        blender_card_frame = ttk.Frame(all_images_wrapper_frame, style='ExperienceImage.TFrame')
-        blender_card_frame.grid(row=0, column=2, padx=5, pady=5, sticky='nsew')
+        image_card_frame = ttk.Frame(frame.images_frame, style='ExperienceImage.TFrame')
+        image_card_frame.grid(row=0, column=column, padx=5, pady=5, sticky='nsew')
         
-        # Fallback/Default image for the third card
-        blender_img = self.load_experience_image("blender_project.png") 
-        if blender_img:
-            ttk.Label(blender_card_frame, image=blender_img, style='ExperienceImage.TLabel').pack()
-
-        return frame
+        image_label = ttk.Label(image_card_frame, style='ExperienceImage.TLabel')
+        image_label.pack()
+        frame.image_labels.append(image_label)
+        with self.profiler.phase("load_experience_image:" + file_name):
+            self.load_experience_image(file_name, image_label)
 
     # --- Projects Tab Content ---
     def create_projects_tab(self, parent_frame):
@@ -545,129 +1269,112 @@ class ResumeApp:
         # --- Projects Container Frame (Fixed: No hard border, just a clean wrapper) ---
         projects_container = ttk.Frame(frame, style='ProjectContainer.TFrame')
         projects_container.pack(fill='x', pady=0) 
-        
-        # E-Commerce Platform
-        self.create_project_card(
-            projects_container,
-            title="E-Commerce Platform (Mobile & Web)",
-            description="A fully functional mobile-first e-commerce application demonstrating robust front-end architecture, product catalog viewing, and dynamic cart management. Focus was placed on clean, reusable UI components and accessibility. This project was a key capstone experience.",
-            tech_used="HTML, Tailwind CSS, JavaScript, Firebase (Hosting & Firestore)",
-            repo_link="https://github.com/misuuwu/Ecommerce-API"
-        )
-        
-        # Expense-Tracker
-        self.create_project_card(
-            projects_container,
-            title="Expense-Tracker",
-            description="A modern personal finance tool built to help users monitor and categorize daily expenditures. Features include real-time data visualization, local storage integration for persistence, and robust input validation using TypeScript.",
-            tech_used="React, TypeScript, Modern Hooks, Chart.js",
-            repo_link="https://github.com/Pragmatyst/Expense-Tracker"
-        )
-        
-        # Flashwise V1 (LAST CARD)
-        self.create_project_card(
-            projects_container,
-            title="Flashwise V1 (Study Companion)",
-            description="An interactive study application designed to gamify the learning process using flashcards and spaced repetition logic. The desktop application aims to increase knowledge retention and engagement for various subjects.",
-            tech_used="Python, HTML, Tailwind CSS, JScript, Data Persistence (JSON)",
-            repo_link="https://github.com/misuuwu/Flashwise_V1",
-            is_last=True 
-        )
+        frame.projects_container = projects_container
+        
+        projects = self.resume["projects"]
+        if self.should_virtualize(projects):
+            # Large profiles: only the cards near the visible part of the canvas exist
+            def update_card(card_frame, project, index):
+                # The card's parent is the virtual list, whose items may be a search-filtered subset
+                self.fill_project_card(card_frame, is_last=(index == len(card_frame.master.items) - 1), **project)
+                self.highlight_project_card(card_frame, self.search_matches is not None)
+
+            virtual_list = self.add_virtual_list(projects_container, projects, self.build_project_card, update_card,
+                                                 estimated_height=190)
+            virtual_list.pack(fill='x')
+            self.virtual_sources.append((virtual_list, "project", projects))
+            return frame
+
+        for index, project in enumerate(projects):
+            card_frame = self.create_project_card(
+                projects_container,
+                title=project["title"],
+                description=project["description"],
+                tech_used=project["tech_used"],
+                repo_link=project["repo_link"],
+                is_last=(index == len(projects) - 1)
+            )
+            self.project_cards.append(card_frame)
+            self.search_targets[("project", index)] = ("card", card_frame)
         
         return frame
 
 
-    # --- Skills Tab Content (FINAL REFINED with Multi-Color Hover) ---
-    def create_skills_tab(self, parent_frame):
-        frame = ttk.Frame(parent_frame, style='WhiteBackground.TFrame')
-        
-        # --- Dynamic Hover Functions ---
-        def on_enter(event):
-            # Select a random pastel color
-            random_color = random.choice(self.pastel_colors)
-            # Apply the generic hover style and set the specific background color
-            event.widget.configure(style='TagHover.TLabel', background=random_color)
-        
-        def on_leave(event):
-            # Revert to the default tag style
-            event.widget.configure(style='Tag.TLabel')
-
-        # Helper to create a skill tag and bind hover events
-        def create_hover_tag(parent, text):
-            tag_label = ttk.Label(parent, text=text, style='Tag.TLabel')
-            tag_label.pack(side='left', padx=(0, 5))
-            tag_label.bind("<Enter>", on_enter)
-            tag_label.bind("<Leave>", on_leave)
-            return tag_label
+    # --- Skill tag with hover events (created through the bulk builder) ---
+    def hover_tag_spec(self, text):
+        return (WidgetSpec('ttk::label', text=text, style='Tag.TLabel')
+                .bind("<Enter>", self.on_tag_enter)
+                .bind("<Leave>", self.on_tag_leave))
 
+    # --- Wrap the tags of a built flow container spec ---
+    def add_flow_layout(self, flow_spec):
+        flow_layout = FlowLayout(self.master, flow_spec.path, [tag.path for tag in flow_spec.children])
+        flow_spec.flow_layout = flow_layout
+        self.flow_layouts.append(flow_layout)
+        return flow_layout
 
-        # --- Technical Skills Section ---
-        ttk.Label(frame, text="<> Technical Skills", style='Title.TLabel', background='white').pack(anchor='w', pady=(0,5))
-        
-        # Languages Group 
-        ttk.Label(frame, text="Languages:", style='Subtitle.TLabel', background='white', foreground=self.light_text_color).pack(anchor='w', pady=(5, 5))
-
-        # Skill Tags Frame 1 (Languages)
-        skill_tag_frame_1 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        skill_tag_frame_1.pack(fill='x', anchor='w', pady=(0, 10))
-        
-        create_hover_tag(skill_tag_frame_1, "Python (Advanced)")
-        create_hover_tag(skill_tag_frame_1, "JavaScript (ES6+)")
-        create_hover_tag(skill_tag_frame_1, "Java")
-        create_hover_tag(skill_tag_frame_1, "C++")
-        create_hover_tag(skill_tag_frame_1, "SQL / MySQL")
-        
-        skill_tag_frame_1_b = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        skill_tag_frame_1_b.pack(fill='x', anchor='w', pady=(0, 10))
-
-        create_hover_tag(skill_tag_frame_1_b, "HTML5")
-        create_hover_tag(skill_tag_frame_1_b, "CSS3")
-    
-
-
-        # Frameworks/Tools Group 
-        ttk.Label(frame, text="Frameworks & Tools:", style='Subtitle.TLabel', background='white', foreground=self.light_text_color).pack(anchor='w', pady=(5, 5))
-
-        # Frontend Tags Frame 2
-        frontend_tag_frame_1 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        frontend_tag_frame_1.pack(fill='x', anchor='w', pady=(0, 10))
-        
-        create_hover_tag(frontend_tag_frame_1, "React")
-        create_hover_tag(frontend_tag_frame_1, "Node.js")
-        create_hover_tag(frontend_tag_frame_1, "Tailwind CSS")
-        create_hover_tag(frontend_tag_frame_1, "MongoDB")
-        
-        frontend_tag_frame_2 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        frontend_tag_frame_2.pack(fill='x', anchor='w', pady=(0, 15))
-        
-        create_hover_tag(frontend_tag_frame_2, "Git/GitHub")
-        create_hover_tag(frontend_tag_frame_2, "REST APIs")
-        create_hover_tag(frontend_tag_frame_2, "TypeScript")
-        create_hover_tag(frontend_tag_frame_2, "C# (Advanced)")
-        create_hover_tag(frontend_tag_frame_2, "Web Development (Intermediate)")
-
-        
-        # --- Separator for Soft Skills ---
-        ttk.Separator(frame, orient='horizontal').pack(fill='x', pady=10)
+    # Tag n of the flow container becomes search document doc_prefix + (n,)
+    def register_tag_targets(self, doc_prefix, flow_spec):
+        for index, tag in enumerate(flow_spec.children):
+            self.search_targets[doc_prefix + (index,)] = ("tag", flow_spec.flow_layout, tag.path)
 
+    # --- Dynamic Hover Functions (receive the tag's Tcl path name) ---
+    def on_tag_enter(self, path):
+        # Select a random pastel color (each has its own precomputed hover style)
+        import random
+        self.style_batcher.set_style(path, random.choice(theme.HOVER_STYLES))
 
-        # --- Soft Skills Section (UPDATED with Hover) ---
-        ttk.Label(frame, text="🤝 Soft Skills", style='Title.TLabel', background='white').pack(anchor='w', pady=(10, 5))
+    def on_tag_leave(self, path):
+        # Revert to the resting style (default, or highlighted while it matches a search)
+        self.style_batcher.set_style(path, self.tag_rest_style(path))
 
-        # Soft Skills Tags Frame
-        soft_skill_tag_frame = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        soft_skill_tag_frame.pack(fill='x', anchor='w', pady=(0, 10))
-        
-        create_hover_tag(soft_skill_tag_frame, "Team Collaboration")
-        create_hover_tag(soft_skill_tag_frame, "Problem Solving")
-        create_hover_tag(soft_skill_tag_frame, "Adaptability")
-        create_hover_tag(soft_skill_tag_frame, "Time Management")
+    def tag_rest_style(self, path):
+        return 'TagMatch.TLabel' if path in self.matched_tags else 'Tag.TLabel'
 
-        soft_skill_tag_frame_2 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        soft_skill_tag_frame_2.pack(fill='x', anchor='w', pady=(0, 10))
+    # --- Skills Tab Content (FINAL REFINED with Multi-Color Hover) ---
+    def create_skills_tab(self, parent_frame):
+        frame = ttk.Frame(parent_frame, style='WhiteBackground.TFrame')
         
-        create_hover_tag(soft_skill_tag_frame_2, "Communication")
-        create_hover_tag(soft_skill_tag_frame_2, "Organized")
+        # --- Skill Sections (Technical Skills, Soft Skills, ...) ---
+        # The whole tab body is described first and created by one Tcl script
+        specs = []
+        title_specs = []
+        label_specs = {}
+        flow_specs = []
+        flow_doc_prefixes = []
+        for section_index, section in enumerate(self.resume["skills"]):
+            if section_index > 0:
+                # --- Separator between sections ---
+                specs.append(WidgetSpec('ttk::separator', orient='horizontal').pack(fill='x', pady=10))
+            title_specs.append(WidgetSpec('ttk::label', text=section["title"], style='Title.TLabel', background='white')
+                               .pack(anchor='w', pady=(0 if section_index == 0 else 10, 5)))
+            specs.append(title_specs[-1])
+
+            for group_index, group in enumerate(section["groups"]):
+                if group.get("label"):
+                    label_specs[(section_index, group_index)] = (
+                        WidgetSpec('ttk::label', text=group["label"], style='Subtitle.TLabel', background='white',
+                                   foreground=self.light_text_color).pack(anchor='w', pady=(5, 5)))
+                    specs.append(label_specs[(section_index, group_index)])
+
+                # One flow container per group; its tags wrap to the available width
+                flow_specs.append(WidgetSpec('ttk::frame', style='WhiteBackground.TFrame', height=1)
+                                  .pack(fill='x', anchor='w', pady=(0, 10))
+                                  .add(*[self.hover_tag_spec(tag_text) for tag_text in group["tags"]]))
+                specs.append(flow_specs[-1])
+                flow_doc_prefixes.append(("tag", section_index, group_index))
+
+        self.bulk_builder.build(frame, specs)
+        for flow_spec in flow_specs:
+            self.add_flow_layout(flow_spec)
+        for flow_spec, doc_prefix in zip(flow_specs, flow_doc_prefixes):
+            self.register_tag_targets(doc_prefix, flow_spec)
+
+        # Tcl paths kept for in-place patching when the profile changes
+        frame.section_title_paths = [spec.path for spec in title_specs]
+        frame.group_label_paths = {key: spec.path for key, spec in label_specs.items()}
+        frame.tag_flows = {doc_prefix[1:]: flow_spec.flow_layout
+                           for flow_spec, doc_prefix in zip(flow_specs, flow_doc_prefixes)}
         
         return frame
 
@@ -683,48 +1390,45 @@ class ResumeApp:
         degree_frame.columnconfigure(0, weight=1) 
         degree_frame.columnconfigure(1, weight=0) 
         
+        education = self.resume["education"]
+
         # Course Title
-        ttk.Label(
+        frame.degree_label = ttk.Label(
             degree_frame, 
-            text="Technical Vocation Major in Computer Harwdare Servicing", 
+            text=education["degree"], 
             style='Title.TLabel', 
             background='white'
-        ).grid(row=0, column=0, sticky='w')
+        )
+        frame.degree_label.grid(row=0, column=0, sticky='w')
         
         # GPA box 
-        tk.Label(
+        frame.gpa_label = tk.Label(
             degree_frame, 
-            text="1.5 GPA", 
+            text=education["gpa"], 
             font=("Arial", 9, "bold"), 
             background=self.primary_color, 
             foreground="white",
             padx=5, 
             pady=3
-        ).grid(row=0, column=1, sticky='e') 
+        )
+        frame.gpa_label.grid(row=0, column=1, sticky='e') 
 
         # School
-        ttk.Label(frame, text="Technological University of the Philippines", style='Body.TLabel', background='white').pack(anchor='w')
-        ttk.Label(frame, text="Major in Software Development | Expected May 2028", style='LightBody.TLabel', background='white').pack(anchor='w', pady=(0,15))
+        frame.school_label = ttk.Label(frame, text=education["school"], style='Body.TLabel', background='white')
+        frame.school_label.pack(anchor='w')
+        frame.detail_label = ttk.Label(frame, text=education["detail"], style='LightBody.TLabel', background='white')
+        frame.detail_label.pack(anchor='w', pady=(0,15))
 
         # Key Coursework
         ttk.Label(frame, text="Key Coursework:", style='Title.TLabel', background='white').pack(anchor='w', pady=(0,5))
         
-        # Coursework Tags (Use Tag.TLabel style)
-        course_tag_frame_1 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        course_tag_frame_1.pack(fill='x', anchor='w', pady=(0, 5))
-        
-        ttk.Label(course_tag_frame_1, text="Data Structures", style='Tag.TLabel').pack(side='left', padx=(0, 5))
-        ttk.Label(course_tag_frame_1, text="Algorithms & Analysis", style='Tag.TLabel').pack(side='left', padx=(0, 5))
-        
-        course_tag_frame_2 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        course_tag_frame_2.pack(fill='x', anchor='w', pady=(0, 5))
-        
-        ttk.Label(course_tag_frame_2, text="Operating Systems", style='Tag.TLabel').pack(side='left', padx=(0, 5))
-        ttk.Label(course_tag_frame_2, text="Database Systems", style='Tag.TLabel').pack(side='left', padx=(0, 5))
-        
-        course_tag_frame_3 = ttk.Frame(frame, style='WhiteBackground.TFrame')
-        course_tag_frame_3.pack(fill='x', anchor='w', pady=(0, 15))
-        ttk.Label(course_tag_frame_3, text="Full-Stack Web Dev", style='Tag.TLabel').pack(side='left', padx=(0, 5))
+        # Coursework Tags (Use Tag.TLabel style, wrapped by a flow layout)
+        course_flow_spec = (WidgetSpec('ttk::frame', style='WhiteBackground.TFrame', height=1)
+                            .pack(fill='x', anchor='w', pady=(0, 15))
+                            .add(*[self.course_tag_spec(course) for course in education["coursework"]]))
+        self.bulk_builder.build(frame, [course_flow_spec])
+        frame.course_flow = self.add_flow_layout(course_flow_spec)
+        self.register_tag_targets(("course",), course_flow_spec)
         
         
         # --- Separator before Activities ---
@@ -737,6 +1441,8 @@ class ResumeApp:
         # Container for the activities table structure
         activities_frame = ttk.Frame(frame, style='WhiteBackground.TFrame')
         activities_frame.pack(fill='x', padx=5, pady=(0, 20)) 
+        frame.activities_frame = activities_frame
+        frame.activity_rows = []    # [cell paths, separator path or None] per fully built row
         
         activities_frame.columnconfigure(0, weight=0) # Dates column
         activities_frame.columnconfigure(1, weight=1) # Organization column
@@ -751,28 +1457,19 @@ class ResumeApp:
         ttk.Separator(activities_frame, orient='horizontal').grid(row=1, column=0, columnspan=3, sticky='ew')
         
         # --- Activities Data ---
-        activities = [
-            ("2023 - 2024", "Alliance of Arts and Design Club", "Seargent of Arms"),
-            ("2023 - 2024", "SeaUniversity", "Game Developer"),
-            ("2022 - 2023", "Technological University", "Research Assistant")
-        ]
-
-        current_row = 2 
-        for i, (dates, org, pos) in enumerate(activities):
-            # NEW: Determine the style for alternating rows
-            # Note the use of ActivityAltBody.TLabel which uses self.alt_bg_color
-            style_name = 'ActivityBody.TLabel' if i % 2 == 0 else 'ActivityAltBody.TLabel'
-            
-            # --- Activity Row (Row i) ---
-            ttk.Label(activities_frame, text=dates, style=style_name, anchor='w').grid(row=current_row, column=0, padx=5, pady=8, sticky='w')
-            ttk.Label(activities_frame, text=org, style=style_name, anchor='w').grid(row=current_row, column=1, padx=5, pady=8, sticky='w')
-            ttk.Label(activities_frame, text=pos, style=style_name, anchor='w').grid(row=current_row, column=2, padx=5, pady=8, sticky='w')
-
-            # Separator Line (Row i+1)
-            if i < len(activities) - 1:
-                 ttk.Separator(activities_frame, orient='horizontal').grid(row=current_row + 1, column=0, columnspan=3, sticky='ew')
-            
-            current_row += 2 
+        activities = education["activities"]
+
+        if self.should_virtualize(activities):
+            # Fixed column widths so the recycled row frames line up with the headers
+            activities_frame.columnconfigure(0, minsize=110)
+            activities_frame.columnconfigure(1, uniform='activity')
+            activities_frame.columnconfigure(2, uniform='activity')
+            virtual_list = self.add_virtual_list(activities_frame, activities, self.build_activity_row,
+                                                 self.fill_activity_row, estimated_height=34)
+            virtual_list.grid(row=2, column=0, columnspan=3, sticky='ew')
+            self.virtual_sources.append((virtual_list, "activity", activities))
+        else:
+            self.add_activity_rows(frame, activities, 0, len(activities))
 
         
         # --- Separator before Academic Achievements ---
@@ -782,18 +1479,84 @@ class ResumeApp:
         # --- 3. Academic Achievements ---
         ttk.Label(frame, text="🥇 Academic Achievements", style='Title.TLabel', background='white').pack(anchor='w', pady=(0, 10))
         
-        # STI College Pasay-EDSA Section
-        ttk.Label(frame, text="STI College Pasay-EDSA:", style='Subtitle.TLabel', background='white', foreground=self.light_text_color).pack(anchor='w')
-        ttk.Label(frame, text="• With Honor (2022 - 2024)", style='Body.TLabel', justify='left', background='white').pack(anchor='w', padx=10)
-        
-        # Pasay City East High School Section
-        ttk.Label(frame, text="Pasay City East High School:", style='Subtitle.TLabel', background='white', foreground=self.light_text_color).pack(anchor='w', pady=(10, 0))
-        ttk.Label(frame, text="• With High Honors (2018 - 2022)", style='Body.TLabel', justify='left', background='white').pack(anchor='w', padx=10, pady=(0, 10))
+        # Own container, so a profile switch can refill just this block
+        frame.achievements_frame = ttk.Frame(frame, style='WhiteBackground.TFrame')
+        frame.achievements_frame.pack(fill='x')
+        self.fill_achievements(frame.achievements_frame, education["achievements"])
 
         return frame
 
+    def fill_achievements(self, parent_frame, achievements):
+        for index, achievement in enumerate(achievements):
+            ttk.Label(parent_frame, text=achievement["school"], style='Subtitle.TLabel', background='white', foreground=self.light_text_color).pack(anchor='w', pady=((10, 0) if index > 0 else 0))
+            for item_index, item in enumerate(achievement["items"]):
+                is_last_line = index == len(achievements) - 1 and item_index == len(achievement["items"]) - 1
+                ttk.Label(parent_frame, text="• " + item, style='Body.TLabel', justify='left', background='white').pack(anchor='w', padx=10, pady=((0, 10) if is_last_line else 0))
+
+    def course_tag_spec(self, text):
+        return WidgetSpec('ttk::label', text=text, style='Tag.TLabel')
+
+    # --- Fully built activity rows [first, end) of `activities`, in one bulk script ---
+    # Row i sits in grid row 2 + 2i; its separator (every row but the last) in the row below.
+    def add_activity_rows(self, frame, activities, first, end):
+        row_specs = []
+        new_rows = []
+        for i in range(first, end):
+            activity = activities[i]
+            # NEW: Determine the style for alternating rows
+            # Note the use of ActivityAltBody.TLabel which uses self.alt_bg_color
+            style_name = 'ActivityBody.TLabel' if i % 2 == 0 else 'ActivityAltBody.TLabel'
+            
+            # --- Activity Row (Row i) ---
+            cell_specs = [WidgetSpec('ttk::label', text=activity[key], style=style_name, anchor='w')
+                          .grid(row=2 + 2 * i, column=column, padx=5, pady=8, sticky='w')
+                          for column, key in enumerate(self.ACTIVITY_KEYS)]
+            row_specs.extend(cell_specs)
+
+            # Separator Line (Row i+1)
+            separator_spec = None
+            if i < len(activities) - 1:
+                 separator_spec = self.activity_separator_spec(i)
+                 row_specs.append(separator_spec)
+            new_rows.append((cell_specs, separator_spec))
+        self.bulk_builder.build(frame.activities_frame, row_specs)
+        for cell_specs, separator_spec in new_rows:
+            frame.activity_rows.append([[spec.path for spec in cell_specs],
+                                        separator_spec.path if separator_spec else None])
+        self.register_activity_targets(frame)
+
+    def activity_separator_spec(self, index):
+        return (WidgetSpec('ttk::separator', orient='horizontal')
+                .grid(row=3 + 2 * index, column=0, columnspan=3, sticky='ew'))
+
+    def register_activity_targets(self, frame):
+        for i, (cell_paths, separator_path) in enumerate(frame.activity_rows):
+            self.search_targets[("activity", i)] = ("row", cell_paths, separator_path)
+
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = ResumeApp(root)
-    root.mainloop()
\ No newline at end of file
+    # Any non-option arguments are resume files; with several, a selector switches between them
+    profile_paths = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    # Opt-in startup profile: CV_RESUME_PROFILE=<path> or --profile-startup[=<path>]
+    profiler = StartupProfiler.from_environment(sys.argv[1:])
+    profiler.imports_done()
+    with profiler.phase("tk_init"):
+        root = tk.Tk()
+    with profiler.phase("app_init"):
+        app = ResumeApp(root, profiler=profiler, resume_path=profile_paths[0] if profile_paths else None,
+                        profile_paths=profile_paths)
+    # Opt-in stall log: CV_RESUME_STALLS=<path> or --stall-monitor[=<path>], --stall-overlay for the HUD
+    stall_monitor = StallMonitor.from_environment(root, sys.argv[1:])
+    # Opt-in hot reload of the resume file and its images: CV_RESUME_WATCH=1 (or =poll) or --watch
+    mode = watch_mode(sys.argv[1:])
+    if mode is not None:
+        app.start_watching(use_inotify=mode != "polling")
+    root.mainloop()
+    app.stop_watching()
+    if stall_monitor is not None:
+        stall_monitor.stop()
+        stall_monitor.export()
+    # Closed before the window settled: keep whatever was measured
+    profiler.write()
+    app.image_loader.shutdown()
+    app.thumbnail_cache.record_stats()
\ No newline at end of file
@@ -0,0 +1,82 @@
+import time
+
+
+# --- Resize Dispatcher ---
+# <Configure> arrives many times per frame while a window is dragged. The
+# dispatcher keeps only the newest event per bound widget and delivers it at
+# most once per frame. Handlers registered with trailing=True only run once
+# the events have stopped for `settle_ms` (the "resize finished" update), and
+# every pending frame handler is flushed again at that point too.
+class ResizeDispatcher:
+    def __init__(self, master, frame_ms=16, settle_ms=150):
+        self.master = master
+        self.frame_ms = frame_ms
+        self.settle_ms = settle_ms
+        self.handlers = []          # (widget, handler, trailing)
+        self.pending = {}           # handler index -> latest event
+        self.trailing_pending = {}
+        self.frame_id = None
+        self.settle_id = None
+        self.last_flush = 0.0
+        self.events = 0
+        self.deliveries = 0
+        self.flushes = 0
+
+    def bind(self, widget, handler, trailing=False):
+        index = len(self.handlers)
+        self.handlers.append((widget, handler, trailing))
+        widget.bind("<Configure>", lambda e, i=index: self._on_configure(i, e), add="+")
+        return index
+
+    def _on_configure(self, index, event):
+        self.events += 1
+        if self.handlers[index][2]:
+            self.trailing_pending[index] = event
+        else:
+            self.pending[index] = event
+            if self.frame_id is None:
+                wait = self.frame_ms - (time.perf_counter() - self.last_flush) * 1000
+                self.frame_id = self.master.after(max(0, int(wait)), self._flush_frame)
+        # Restart the quiet-period timer on every event
+        if self.settle_id is not None:
+            self.master.after_cancel(self.settle_id)
+        self.settle_id = self.master.after(self.settle_ms, self._flush_trailing)
+
+    def _deliver(self, pending):
+        events = list(pending.items())
+        pending.clear()
+        for index, event in events:
+            widget, handler, _ = self.handlers[index]
+            if widget.winfo_exists():
+                self.deliveries += 1
+                handler(event)
+
+    def _flush_frame(self):
+        self.frame_id = None
+        self.last_flush = time.perf_counter()
+        self.flushes += 1
+        self._deliver(self.pending)
+
+    def _flush_trailing(self):
+        self.settle_id = None
+        if self.frame_id is not None:
+            self.master.after_cancel(self.frame_id)
+            self._flush_frame()
+        self._deliver(self.trailing_pending)
+
+    # Drop all scheduled work (e.g. before the window is destroyed)
+    def cancel(self):
+        for after_id in (self.frame_id, self.settle_id):
+            if after_id is not None:
+                self.master.after_cancel(after_id)
+        self.frame_id = self.settle_id = None
+        self.pending.clear()
+        self.trailing_pending.clear()
+
+    def stats(self):
+        return {
+            "events": self.events,
+            "delivered": self.deliveries,
+            "coalesced": self.events - self.deliveries - len(self.pending) - len(self.trailing_pending),
+            "flushes": self.flushes,
+        }
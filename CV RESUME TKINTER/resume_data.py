@@ -0,0 +1,210 @@
+import hashlib
+import json
+import marshal
+import os
+import sys
+
+from thumbnail_cache import cache_root
+
+SCHEMA_VERSION = 2
+DEFAULT_RESUME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume.json")
+
+
+class ResumeDataError(ValueError):
+    pass
+
+
+# --- Schema ---
+# A dict maps required keys to their spec, a one-item list means "list of",
+# a type is checked with isinstance, and Optional(...) marks a key that may be left out.
+class Optional:
+    def __init__(self, spec):
+        self.spec = spec
+
+
+SCHEMA = {
+    "schema_version": int,
+    "profile": {
+        "name": str,
+        "initials": str,
+        "title": str,
+        "photo": str,
+        "summary": str,
+        "cv_url": str,
+        "links": [{
+            "label": str,
+            "url": str,
+            "style": Optional(str),
+            "tooltip": Optional(str),
+        }],
+    },
+    "experience": {
+        "heading": str,
+        "images": [str],
+    },
+    "projects": [{
+        "title": str,
+        "description": str,
+        "tech_used": str,
+        "repo_link": str,
+    }],
+    "skills": [{
+        "title": str,
+        "groups": [{
+            "label": Optional(str),
+            "tags": [str],
+        }],
+    }],
+    "education": {
+        "degree": str,
+        "gpa": str,
+        "school": str,
+        "detail": str,
+        "coursework": [str],
+        "activities": [{
+            "dates": str,
+            "organization": str,
+            "position": str,
+        }],
+        "achievements": [{
+            "school": str,
+            "items": [str],
+        }],
+    },
+}
+
+
+def _validate(value, spec, path):
+    if isinstance(spec, dict):
+        if not isinstance(value, dict):
+            raise ResumeDataError("%s: expected an object" % path)
+        for key, item_spec in spec.items():
+            if key not in value:
+                if isinstance(item_spec, Optional):
+                    continue
+                raise ResumeDataError("%s: missing required key '%s'" % (path, key))
+            if isinstance(item_spec, Optional):
+                item_spec = item_spec.spec
+            _validate(value[key], item_spec, "%s.%s" % (path, key))
+        unknown = set(value) - set(spec)
+        if unknown:
+            raise ResumeDataError("%s: unknown key(s) %s" % (path, ", ".join(sorted(unknown))))
+    elif isinstance(spec, list):
+        if not isinstance(value, list):
+            raise ResumeDataError("%s: expected a list" % path)
+        for index, item in enumerate(value):
+            _validate(item, spec[0], "%s[%d]" % (path, index))
+    elif not isinstance(value, spec) or (spec is int and isinstance(value, bool)):
+        raise ResumeDataError("%s: expected %s" % (path, spec.__name__))
+
+
+# --- Older files are upgraded in memory before validation ---
+def upgrade_resume(data):
+    if isinstance(data, dict) and data.get("schema_version") == 1:
+        # Version 1 split tags into hand-made rows; the flow layout wraps them now
+        for section in data.get("skills", []):
+            for group in section.get("groups", []):
+                group["tags"] = [tag for row in group.pop("rows", []) for tag in row]
+        education = data.get("education", {})
+        education["coursework"] = [course for row in education.get("coursework", []) for course in row]
+        data["schema_version"] = 2
+    return data
+
+
+def validate_resume(data):
+    data = upgrade_resume(data)
+    _validate(data, SCHEMA, "resume")
+    if data["schema_version"] != SCHEMA_VERSION:
+        raise ResumeDataError("resume.schema_version: expected %d, got %d"
+                              % (SCHEMA_VERSION, data["schema_version"]))
+    return data
+
+
+def parse_resume(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise ResumeDataError("%s: invalid JSON (%s)" % (path, e))
+    return validate_resume(data)
+
+
+# --- Compiled Snapshot ---
+# The parsed, validated model is marshalled into the cache directory together
+# with the source's mtime and size; any edit to the source invalidates it.
+SNAPSHOT_MAGIC = b"CVRS"
+
+
+def snapshot_path(source_path):
+    digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_root(), "snapshots", digest + ".snap")
+
+
+def _snapshot_stamp(st):
+    return (SCHEMA_VERSION, st.st_mtime_ns, st.st_size)
+
+
+def read_snapshot(source_path, st=None):
+    st = st or os.stat(source_path)
+    try:
+        with open(snapshot_path(source_path), "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                return None
+            stamp, data = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if tuple(stamp) != _snapshot_stamp(st):
+        return None
+    return data
+
+
+def write_snapshot(source_path, data, st=None):
+    st = st or os.stat(source_path)
+    path = snapshot_path(source_path)
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(marshal.dumps((_snapshot_stamp(st), data)))
+        os.replace(tmp_path, path)
+    except OSError:
+        # A missing snapshot only costs the slow path next time
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# --- Entry point used by the app: snapshot when fresh, parse + validate otherwise ---
+def load_resume(path=None, use_snapshot=True):
+    path = path or DEFAULT_RESUME_PATH
+    st = os.stat(path)
+    if use_snapshot:
+        data = read_snapshot(path, st)
+        if data is not None:
+            return data
+    data = parse_resume(path)
+    if use_snapshot:
+        write_snapshot(path, data, st)
+    return data
+
+
+# --- Command-line check: python resume_data.py [resume.json] ---
+if __name__ == "__main__":
+    import time
+
+    source = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_RESUME_PATH
+    try:
+        start = time.perf_counter()
+        model = parse_resume(source)
+        parse_ms = (time.perf_counter() - start) * 1000
+    except ResumeDataError as e:
+        print("Invalid resume data: %s" % e)
+        sys.exit(1)
+    write_snapshot(source, model)
+    start = time.perf_counter()
+    read_snapshot(source)
+    snapshot_ms = (time.perf_counter() - start) * 1000
+    print("%s is valid." % source)
+    print("Parse + validate: %.3f ms, snapshot load: %.3f ms" % (parse_ms, snapshot_ms))
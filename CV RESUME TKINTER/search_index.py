@@ -0,0 +1,133 @@
+import bisect
+import re
+from collections import OrderedDict
+
+TOKEN_RE = re.compile(r"[0-9a-z]+[+#]*")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+# Levenshtein distance, giving up as soon as it exceeds `limit`
+def bounded_distance(a, b, limit):
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+# --- Inverted Index with prefix and fuzzy lookups ---
+# Built once per resume. Every term maps to the set of document ids containing
+# it; a sorted term list answers prefix queries with bisect, and a one-deletion
+# neighbourhood (every term with one character removed) finds terms within one
+# typo without comparing the query against the whole vocabulary.
+#
+# A query matches a document when every query token matches one of its terms:
+# exactly, as a prefix (the user is still typing) or, for tokens of
+# FUZZY_MIN_LENGTH characters or more, within one edit.
+class SearchIndex:
+    FUZZY_MIN_LENGTH = 4
+    CACHE_SIZE = 256
+
+    def __init__(self):
+        self.postings = {}          # term -> set of doc ids
+        self.terms = []             # sorted vocabulary
+        self.deletes = {}           # term with one char removed -> set of terms
+        self.documents = {}         # doc id -> original text
+        self.token_cache = OrderedDict()
+        self.lookups = 0
+
+    def add(self, doc_id, *texts):
+        text = " ".join(texts)
+        self.documents[doc_id] = text
+        for term in set(tokenize(text)):
+            self.postings.setdefault(term, set()).add(doc_id)
+
+    # Call once after the last add()
+    def finish(self):
+        self.terms = sorted(self.postings)
+        self.deletes = {}
+        for term in self.terms:
+            if len(term) >= self.FUZZY_MIN_LENGTH:
+                for deleted in _deletes(term):
+                    self.deletes.setdefault(deleted, set()).add(term)
+        self.token_cache.clear()
+        return self
+
+    @classmethod
+    def from_resume(cls, resume):
+        index = cls()
+        index.add(("summary",), resume["profile"]["summary"])
+        for i, project in enumerate(resume["projects"]):
+            index.add(("project", i), project["title"], project["description"], project["tech_used"])
+        for s, section in enumerate(resume["skills"]):
+            for g, group in enumerate(section["groups"]):
+                for t, tag in enumerate(group["tags"]):
+                    index.add(("tag", s, g, t), tag)
+        education = resume["education"]
+        for i, course in enumerate(education["coursework"]):
+            index.add(("course", i), course)
+        for i, activity in enumerate(education["activities"]):
+            index.add(("activity", i), activity["dates"], activity["organization"], activity["position"])
+        return index.finish()
+
+    def prefix_terms(self, token):
+        start = bisect.bisect_left(self.terms, token)
+        end = bisect.bisect_left(self.terms, token + "\uffff")
+        return self.terms[start:end]
+
+    def fuzzy_terms(self, token):
+        if len(token) < self.FUZZY_MIN_LENGTH:
+            return []
+        candidates = set(self.deletes.get(token, ()))
+        for deleted in _deletes(token) | {token}:
+            candidates.update(self.deletes.get(deleted, ()))
+            if deleted in self.postings:
+                candidates.add(deleted)
+        return [term for term in candidates if bounded_distance(token, term, 1) <= 1]
+
+    # Doc ids matching one token (cached: typing only ever extends the last token)
+    def lookup(self, token):
+        docs = self.token_cache.get(token)
+        if docs is not None:
+            self.token_cache.move_to_end(token)
+            return docs
+        self.lookups += 1
+        docs = set()
+        for term in self.prefix_terms(token):
+            docs |= self.postings[term]
+        for term in self.fuzzy_terms(token):
+            docs |= self.postings[term]
+        docs = frozenset(docs)
+        self.token_cache[token] = docs
+        if len(self.token_cache) > self.CACHE_SIZE:
+            self.token_cache.popitem(last=False)
+        return docs
+
+    # None for an empty query (nothing filtered), otherwise the matching doc ids
+    def search(self, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        result = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            docs = self.lookup(token)
+            result = docs if result is None else result & docs
+            if not result:
+                break
+        return frozenset(result)
+
+    def stats(self):
+        return {"documents": len(self.documents), "terms": len(self.terms), "lookups": self.lookups}
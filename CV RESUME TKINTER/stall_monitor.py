@@ -0,0 +1,174 @@
+import json
+import sys
+import threading
+import time
+import traceback
+
+from cli_flags import parse_output_flag
+
+ENV_VAR = "CV_RESUME_STALLS"
+FLAG = "--stall-monitor"
+OVERLAY_FLAG = "--stall-overlay"
+DEFAULT_OUTPUT = "stalls.json"
+
+
+# --- Event-loop Stall Monitor ---
+# A heartbeat re-arms itself with `after` every interval_ms; how late each beat
+# fires is the scheduling lag. A watchdog thread notices when the heartbeat has
+# been silent for longer than stall_ms and samples the main thread's Python
+# stack while the stall is still happening (afterwards it would be gone). When
+# the late beat finally runs, the stall is recorded with those stacks.
+class StallMonitor:
+    OVERLAY_EVERY = 10          # overlay refresh, in beats
+    MAX_STALLS = 500
+    MAX_SAMPLES_PER_STALL = 5
+
+    def __init__(self, master, interval_ms=50, stall_ms=100, overlay=False, output_path=None):
+        self.master = master
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.output_path = output_path
+        self.main_thread_id = threading.get_ident()
+        self.lock = threading.Lock()
+        self.after_id = None
+        self.running = False
+        self.expected = None
+        self.last_beat = None
+        self.samples = []           # stacks taken by the watchdog during the current stall
+        self.stalls = []
+        self.beats = 0
+        self.lag_total_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.last_frame_ms = 0.0
+        self.stall_count = 0
+        self.started_at = None
+        self.watchdog = None
+        self.overlay = None
+        if overlay:
+            self._create_overlay()
+
+    # Enabled by CV_RESUME_STALLS=<path> or --stall-monitor[=<path>] (see cli_flags.py);
+    # --stall-overlay adds the HUD
+    @classmethod
+    def from_environment(cls, master, argv=None, **options):
+        argv = sys.argv[1:] if argv is None else argv
+        output_path = parse_output_flag(ENV_VAR, FLAG, DEFAULT_OUTPUT, argv)
+        overlay = OVERLAY_FLAG in argv
+        if output_path is None and not overlay:
+            return None
+        monitor = cls(master, overlay=overlay, output_path=output_path, **options)
+        monitor.start()
+        return monitor
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.started_at = time.perf_counter()
+        self.last_beat = self.started_at
+        self._arm()
+        self.watchdog = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self.watchdog.start()
+
+    def stop(self):
+        self.running = False
+        if self.after_id is not None:
+            try:
+                self.master.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+
+    def _arm(self):
+        self.expected = time.perf_counter() + self.interval_ms / 1000
+        self.after_id = self.master.after(self.interval_ms, self._beat)
+
+    # --- Main thread: measure how late this beat is ---
+    def _beat(self):
+        self.after_id = None
+        if not self.running:
+            return
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self.expected) * 1000)
+        with self.lock:
+            self.beats += 1
+            self.lag_total_ms += lag_ms
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            self.last_frame_ms = (now - self.last_beat) * 1000
+            self.last_beat = now
+            samples, self.samples = self.samples, []
+            if lag_ms >= self.stall_ms:
+                self.stall_count += 1
+                if len(self.stalls) < self.MAX_STALLS:
+                    self.stalls.append({
+                        "at_ms": round((now - self.started_at) * 1000 - lag_ms, 3),
+                        "lag_ms": round(lag_ms, 3),
+                        "stacks": samples,
+                    })
+        if self.overlay is not None and self.beats % self.OVERLAY_EVERY == 0:
+            self._update_overlay()
+        self._arm()
+
+    # --- Watchdog thread: sample the main thread's stack while it is stuck ---
+    def _watch(self):
+        period = self.stall_ms / 2000
+        while self.running:
+            time.sleep(period)
+            with self.lock:
+                silent_ms = (time.perf_counter() - self.last_beat) * 1000
+                stalled = silent_ms >= self.interval_ms + self.stall_ms
+                if not stalled or len(self.samples) >= self.MAX_SAMPLES_PER_STALL:
+                    continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = [{"file": entry.filename, "line": entry.lineno, "function": entry.name, "code": entry.line}
+                     for entry in traceback.extract_stack(frame)]
+            with self.lock:
+                self.samples.append({"silent_ms": round(silent_ms, 3), "frames": stack})
+
+    # --- Optional HUD in the window's top-right corner ---
+    def _create_overlay(self):
+        import tkinter as tk
+        self.overlay = tk.Label(self.master, font=("Courier", 8), background="#202020",
+                                foreground="#e0e0e0", padx=4, pady=1)
+        self.overlay.place(relx=1.0, rely=0.0, anchor="ne")
+
+    def _update_overlay(self):
+        if not self.overlay.winfo_exists():
+            self.overlay = None
+            return
+        stats = self.stats()
+        self.overlay.configure(
+            text="frame %.1f ms | lag %.1f ms | stalls %d | worst %.0f ms"
+                 % (self.last_frame_ms, stats["mean_lag_ms"], stats["stalls"], stats["max_lag_ms"]),
+            foreground="#ff8080" if stats["stalls"] else "#e0e0e0")
+        self.overlay.lift()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "beats": self.beats,
+                "interval_ms": self.interval_ms,
+                "stall_threshold_ms": self.stall_ms,
+                "mean_lag_ms": round(self.lag_total_ms / self.beats, 3) if self.beats else 0.0,
+                "max_lag_ms": round(self.max_lag_ms, 3),
+                "stalls": self.stall_count,
+            }
+
+    # --- JSON export for offline analysis ---
+    def export(self, path=None):
+        path = path or self.output_path
+        if not path:
+            return None
+        with self.lock:
+            stalls = list(self.stalls)
+        report = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "duration_s": round(time.perf_counter() - self.started_at, 3) if self.started_at else 0.0,
+            "summary": self.stats(),
+            "stalls": stalls,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return path
@@ -0,0 +1,145 @@
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+from cli_flags import parse_output_flag
+
+# Taken when this module is first imported; main.py imports it before
+# everything else so the "imports" phase covers tkinter, PIL and the app modules.
+PROCESS_START = (time.perf_counter(), time.process_time())
+
+ENV_VAR = "CV_RESUME_PROFILE"
+FLAG = "--profile-startup"
+DEFAULT_OUTPUT = "startup_profile.json"
+
+
+# --- Opt-in Startup Profiler ---
+# Records wall and CPU time per named phase plus a few milestones measured from
+# PROCESS_START (first paint, interactive, images ready) and writes them as one
+# JSON report. When disabled every phase() is a shared no-op context.
+class StartupProfiler:
+    READY_POLL_MS = 15
+    READY_TIMEOUT_MS = 10000
+
+    def __init__(self, output_path=None):
+        self.output_path = output_path
+        self.enabled = output_path is not None
+        self.phases = []
+        self.milestones = {}
+        self.depth = 0
+        self.written = False
+        self.master = None
+        self.ready = None
+        self._noop = nullcontext()
+
+    # Enabled by CV_RESUME_PROFILE=<path> or --profile-startup[=<path>] (see cli_flags.py)
+    @classmethod
+    def from_environment(cls, argv=None):
+        return cls(parse_output_flag(ENV_VAR, FLAG, DEFAULT_OUTPUT, argv))
+
+    def _since_start_ms(self, now=None):
+        return ((now or time.perf_counter()) - PROCESS_START[0]) * 1000
+
+    def record(self, name, wall_start, cpu_start, depth=0):
+        self.phases.append({
+            "name": name,
+            "start_ms": round(self._since_start_ms(wall_start), 3),
+            "wall_ms": round((time.perf_counter() - wall_start) * 1000, 3),
+            "cpu_ms": round((time.process_time() - cpu_start) * 1000, 3),
+            "depth": depth,
+        })
+
+    def phase(self, name):
+        if not self.enabled:
+            return self._noop
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        depth = self.depth
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            self.record(name, wall_start, cpu_start, depth)
+
+    # Everything imported between PROCESS_START and this call
+    def imports_done(self):
+        if self.enabled:
+            self.record("imports", *PROCESS_START)
+
+    def milestone(self, name):
+        if self.enabled and name not in self.milestones:
+            self.milestones[name] = {
+                "wall_ms": round(self._since_start_ms(), 3),
+                "cpu_ms": round((time.process_time() - PROCESS_START[1]) * 1000, 3),
+            }
+
+    # --- First paint / interactive / images ready ---
+    # First paint is the first Expose anywhere in the window; interactive is the
+    # first idle pass after it (the loop is free to take input); images ready is
+    # when ready() first returns true. The report is written at that point.
+    def watch(self, master, ready=None):
+        if not self.enabled:
+            return
+        self.master = master
+        self.ready = ready
+        master.bind("<Expose>", self._on_expose, add="+")
+
+    def _on_expose(self, event):
+        if "first_paint" in self.milestones:
+            return
+        self.milestone("first_paint")
+        self.master.after_idle(self._on_interactive)
+
+    def _on_interactive(self):
+        self.milestone("interactive")
+        self.ready_deadline = time.perf_counter() + self.READY_TIMEOUT_MS / 1000
+        self._poll_ready()
+
+    def _poll_ready(self):
+        if self.ready is None or self.ready():
+            self.milestone("images_ready")
+        elif time.perf_counter() < self.ready_deadline:
+            self.master.after(self.READY_POLL_MS, self._poll_ready)
+            return
+        self.write()
+
+    def report(self):
+        import platform # Only needed when the report is written, not while starting up
+        return {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "tk_version": self._tk_version(),
+            "phases": sorted(self.phases, key=lambda phase: phase["start_ms"]),
+            "milestones": self.milestones,
+        }
+
+    def _tk_version(self):
+        return self.master.tk.call("info", "patchlevel") if self.master is not None else None
+
+    def write(self):
+        if not self.enabled or self.written:
+            return None
+        self.written = True
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return self.output_path
+
+
+# --- Command-line summary: python startup_profiler.py startup_profile.json [...] ---
+if __name__ == "__main__":
+    for path in sys.argv[1:] or [DEFAULT_OUTPUT]:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        print("%s (%s, Python %s, Tk %s)" % (path, data["platform"], data["python"], data["tk_version"]))
+        for phase in data["phases"]:
+            print("  %-40s %9.3f ms wall %9.3f ms cpu  @%9.3f ms"
+                  % ("  " * phase["depth"] + phase["name"], phase["wall_ms"], phase["cpu_ms"], phase["start_ms"]))
+        for name, values in data["milestones"].items():
+            print("  %-40s %9.3f ms wall %9.3f ms cpu" % (name, values["wall_ms"], values["cpu_ms"]))
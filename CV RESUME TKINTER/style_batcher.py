@@ -0,0 +1,45 @@
+# --- Style Batcher ---
+# Collects "give this widget that style" requests and applies the newest one
+# per widget at most once per frame, as a single Tcl script. Sweeping the
+# mouse across a tag cloud produces many <Enter>/<Leave> pairs per frame; only
+# the last style requested for each tag in that frame reaches Tk.
+class StyleBatcher:
+    def __init__(self, master, frame_ms=16):
+        self.master = master
+        self.frame_ms = frame_ms
+        self.pending = {}       # path -> style
+        self.applied = {}       # path -> style currently shown
+        self.flush_id = None
+        self.requests = 0
+        self.updates = 0
+
+    def set_style(self, path, style):
+        self.requests += 1
+        self.pending[str(path)] = style
+        if self.flush_id is None:
+            self.flush_id = self.master.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        self.flush_id = None
+        pending, self.pending = self.pending, {}
+        script = []
+        for path, style in pending.items():
+            if self.applied.get(path) != style:
+                self.applied[path] = style
+                script.append("if {[winfo exists %s]} {%s configure -style %s}" % (path, path, style))
+        if script:
+            self.updates += len(script)
+            self.master.tk.eval("\n".join(script))
+
+    def forget(self, path):
+        self.pending.pop(str(path), None)
+        self.applied.pop(str(path), None)
+
+    # Every widget under a destroyed frame (prefix ends with "."), whose paths Tk may hand out again
+    def forget_prefix(self, prefix):
+        for table in (self.pending, self.applied):
+            for path in [path for path in table if path.startswith(prefix)]:
+                del table[path]
+
+    def stats(self):
+        return {"requests": self.requests, "updates": self.updates}
@@ -0,0 +1,108 @@
+import itertools
+import time
+
+from tcl_script import command
+
+
+# --- Declarative widget description ---
+# WidgetSpec("ttk::label", text=..., style=...) describes one widget; .pack(),
+# .grid() and .place() record how it is managed, .bind() attaches a Python
+# callback that receives the widget's Tcl path name.
+class WidgetSpec:
+    def __init__(self, widget_class, **options):
+        self.widget_class = widget_class
+        self.options = options
+        self.manager = None
+        self.path = None        # Tcl path name, set when the spec is built
+        self.manager_options = {}
+        self.bindings = []
+        self.children = []
+
+    def pack(self, **options):
+        self.manager, self.manager_options = "pack", options
+        return self
+
+    def grid(self, **options):
+        self.manager, self.manager_options = "grid", options
+        return self
+
+    def place(self, **options):
+        self.manager, self.manager_options = "place", options
+        return self
+
+    def bind(self, sequence, callback):
+        self.bindings.append((sequence, callback))
+        return self
+
+    def add(self, *children):
+        self.children.extend(children)
+        return self
+
+
+# --- Bulk Builder ---
+# Turns a list of WidgetSpecs into one Tcl script and evaluates it in a single
+# call, instead of one Python-to-Tcl round trip per constructor, pack/grid and
+# bind. Python callbacks are registered as Tcl commands once and reused by
+# every widget that binds them.
+class BulkBuilder:
+    def __init__(self, master):
+        self.master = master
+        self.callback_commands = {}
+        self.names = itertools.count(1)
+        self.widgets_built = 0
+        self.scripts_run = 0
+        self.build_ms = 0.0
+
+    def _callback_command(self, callback):
+        name = self.callback_commands.get(callback)
+        if name is None:
+            name = self.master.register(callback)
+            self.callback_commands[callback] = name
+        return name
+
+    def _emit(self, parent_path, spec, lines, paths):
+        path = "%s.bulk%d" % ("" if parent_path == "." else parent_path, next(self.names))
+        lines.append(command(spec.widget_class, path, **spec.options))
+        if spec.manager:
+            lines.append(command(spec.manager, path, **spec.manager_options))
+        for sequence, callback in spec.bindings:
+            lines.append(command("bind", path, sequence, "%s %%W" % self._callback_command(callback)))
+        spec.path = path
+        paths.append(path)
+        self.widgets_built += 1
+        for child in spec.children:
+            self._emit(path, child, lines, [])
+        return path
+
+    def script(self, parent, specs):
+        lines, paths = [], []
+        for spec in specs:
+            self._emit(str(parent), spec, lines, paths)
+        return "\n".join(lines), paths
+
+    # Returns the Tcl path names of the top-level specs, in order
+    def build(self, parent, specs):
+        start = time.perf_counter()
+        script, paths = self.script(parent, specs)
+        if script:
+            self.master.tk.eval(script)
+            self.scripts_run += 1
+        self.build_ms += (time.perf_counter() - start) * 1000
+        return paths
+
+    # --- Small helpers for widgets that only exist on the Tcl side ---
+    def configure(self, path, **options):
+        args = []
+        for name, value in options.items():
+            args.extend(("-" + name, value))
+        self.master.tk.call(path, "configure", *args)
+
+    def cget(self, path, option):
+        return self.master.tk.call(path, "cget", "-" + option)
+
+    def stats(self):
+        return {
+            "scripts": self.scripts_run,
+            "widgets": self.widgets_built,
+            "build_ms": round(self.build_ms, 3),
+        }
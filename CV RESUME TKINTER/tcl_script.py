@@ -0,0 +1,48 @@
+import re
+
+# Words made only of these characters need no quoting in a Tcl script
+_BARE_WORD = re.compile(r"^[A-Za-z0-9_.,:#%+\-/@=<>!?*]+$")
+
+
+# --- Quote a Python value as one Tcl word ---
+# Tuples/lists become Tcl lists; everything else is stringified. Plain words
+# are left bare, other strings are wrapped in double quotes with every
+# character Tcl treats specially backslash-escaped, so the result is safe
+# whatever the text contains (braces, brackets, $, quotes, newlines).
+def quote(value):
+    if isinstance(value, (tuple, list)):
+        return "{" + " ".join(quote(item) for item in value) + "}" if value else "{}"
+    text = str(value)
+    if _BARE_WORD.match(text):
+        return text
+    escaped = (text.replace("\\", "\\\\")
+                   .replace('"', '\\"')
+                   .replace("$", "\\$")
+                   .replace("[", "\\[")
+                   .replace("]", "\\]")
+                   .replace("{", "\\{")
+                   .replace("}", "\\}")
+                   .replace("\n", "\\n")
+                   .replace(";", "\\;"))
+    return '"' + escaped + '"'
+
+
+# --- "-name value" option pairs ---
+def options(values):
+    parts = []
+    for name, value in values.items():
+        parts.append("-" + name.rstrip("_"))
+        parts.append(quote(value))
+    return " ".join(parts)
+
+
+def command(*words, **kwargs):
+    line = " ".join(str(word) if isinstance(word, Raw) else quote(word) for word in words)
+    if kwargs:
+        line += " " + options(kwargs)
+    return line
+
+
+# Marks a word that is already valid Tcl (e.g. a nested script or a $variable)
+class Raw(str):
+    pass
@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from cli_flags import parse_output_flag  # noqa: E402
+
+ENV_VAR = "CV_RESUME_TEST_OUTPUT"
+
+
+class ParseOutputFlagTest(unittest.TestCase):
+    def parse(self, argv, env=None):
+        environ = {} if env is None else {ENV_VAR: env}
+        with mock.patch.dict(os.environ, environ, clear=False):
+            if env is None:
+                os.environ.pop(ENV_VAR, None)
+            return parse_output_flag(ENV_VAR, "--out", "default.json", argv)
+
+    def test_off_by_default(self):
+        self.assertIsNone(self.parse([]))
+
+    def test_disabling_values_keep_it_off(self):
+        for value in ("", "0", "false", "False"):
+            self.assertIsNone(self.parse([], value), value)
+        self.assertIsNone(self.parse(["--out=0"]))
+
+    def test_enabling_values_use_the_default_output(self):
+        self.assertEqual(self.parse([], "1"), "default.json")
+        self.assertEqual(self.parse(["--out"]), "default.json")
+        self.assertEqual(self.parse(["--out="]), "default.json")
+
+    def test_paths(self):
+        self.assertEqual(self.parse([], "env.json"), "env.json")
+        self.assertEqual(self.parse(["--out"], "env.json"), "env.json")
+        self.assertEqual(self.parse(["--out=cli.json"], "env.json"), "cli.json")
+        # The command line wins over a disabling environment
+        self.assertEqual(self.parse(["--out"], "0"), "default.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
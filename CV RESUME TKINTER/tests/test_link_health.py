@@ -0,0 +1,119 @@
+# python -m pytest tests   (or: python -m unittest discover tests)
+import http.server
+import os
+import sys
+import threading
+import time
+import unittest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from link_health import LinkHealthChecker  # noqa: E402
+
+
+# --- Stub server: keep-alive HTTP/1.1 with a few fixed routes, counting requests ---
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def respond(self, status, location=None, body=b""):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        StubHandler.hits.append((self.command, self.path))
+        if self.path == "/ok":
+            self.respond(200)
+        elif self.path == "/redirect":
+            self.respond(301, "/ok")
+        elif self.path == "/loop":
+            self.respond(302, "/loop")
+        elif self.path == "/head-not-allowed":
+            self.respond(405)
+        else:
+            self.respond(404)
+
+    def do_GET(self):
+        if self.path == "/head-not-allowed":
+            StubHandler.hits.append((self.command, self.path))
+            self.respond(200, body=b"ok")
+        else:
+            self.do_HEAD()
+
+    def log_message(self, *args):
+        pass
+
+
+class LinkHealthCheckerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = "http://127.0.0.1:%d" % cls.server.server_port
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits = []
+        self.checker = LinkHealthChecker(max_workers=1, ttl=60, timeout=2)
+
+    def tearDown(self):
+        self.checker.close()
+
+    def check(self, path, **options):
+        url = self.base + path
+        return self.checker.check([url], **options)[url]
+
+    def test_follows_redirects(self):
+        result = self.check("/redirect")
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["status"], 200)
+        self.assertEqual(result["final_url"], self.base + "/ok")
+
+    def test_falls_back_to_get_when_head_is_rejected(self):
+        result = self.check("/head-not-allowed")
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["status"], 200)
+        self.assertIn(("GET", "/head-not-allowed"), StubHandler.hits)
+
+    def test_detects_redirect_loops(self):
+        result = self.check("/loop")
+        self.assertFalse(result["ok"])
+        self.assertIn("too many redirects", result["error"])
+
+    def test_reports_not_found(self):
+        result = self.check("/missing")
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["status"], 404)
+        self.assertIsNone(result["error"])
+
+    def test_cache_expires_after_ttl(self):
+        self.checker.ttl = 0.2
+        self.assertFalse(self.check("/ok")["cached"])
+        self.assertTrue(self.check("/ok")["cached"])
+        self.assertEqual(len(StubHandler.hits), 1)
+        time.sleep(0.3)
+        self.assertFalse(self.check("/ok")["cached"])
+        self.assertEqual(len(StubHandler.hits), 2)
+
+    def test_reuses_connections(self):
+        urls = [self.base + path for path in ("/ok", "/redirect", "/missing", "/head-not-allowed")]
+        results = self.checker.check(urls)
+        self.assertEqual([results[url]["status"] for url in urls], [200, 200, 404, 200])
+        stats = self.checker.stats()
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertGreaterEqual(stats["connections_reused"], len(urls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import threading
+import time
+import unittest
+import webbrowser
+from unittest import mock
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from link_opener import LinkOpener  # noqa: E402
+
+
+# Stands in for a webbrowser controller; records which thread opened what
+class FakeBrowser:
+    def __init__(self):
+        self.opened = []
+        self.done = threading.Event()
+
+    def open_new(self, url):
+        self.opened.append((url, threading.current_thread().name))
+        self.done.set()
+        return True
+
+
+class LinkOpenerTest(unittest.TestCase):
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_opens_off_the_calling_thread_and_resolves_once(self):
+        browser = FakeBrowser()
+        with mock.patch.object(webbrowser, "get", return_value=browser) as get:
+            opener = LinkOpener()
+            opener.warm()
+            opener.open("https://example.com/a")
+            opener.open("https://example.com/b")
+            self.assertTrue(self.wait_for(lambda: len(browser.opened) == 2))
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual([url for url, _ in browser.opened], ["https://example.com/a", "https://example.com/b"])
+        self.assertTrue(all(thread == "link-opener" for _, thread in browser.opened))
+        self.assertEqual(opener.stats()["opened"], 2)
+
+    def test_falls_back_to_module_default_without_a_controller(self):
+        with mock.patch.object(webbrowser, "get", side_effect=webbrowser.Error), \
+                mock.patch.object(webbrowser, "open_new", return_value=False) as open_new:
+            opener = LinkOpener()
+            opener.open("https://example.com/")
+            self.assertTrue(self.wait_for(lambda: opener.stats()["failed"] == 1))
+        open_new.assert_called_once_with("https://example.com/")
+
+    def test_ignores_empty_urls(self):
+        opener = LinkOpener()
+        opener.open("")
+        self.assertIsNone(opener.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
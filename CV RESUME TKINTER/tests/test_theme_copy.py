@@ -0,0 +1,21 @@
+import os
+import unittest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COPY_DIR = os.path.join(os.path.dirname(APP_DIR), "Resume")
+
+
+# The second app ships its own copy of the theme modules; they must not drift apart
+class ThemeCopyTest(unittest.TestCase):
+    def test_copies_match(self):
+        for name in ("theme.py", "tcl_script.py"):
+            with open(os.path.join(APP_DIR, name), encoding="utf-8") as f:
+                original = f.read()
+            with open(os.path.join(COPY_DIR, name), encoding="utf-8") as f:
+                header, copy = f.read().split("\n", 1)
+            self.assertTrue(header.startswith("# Copy of"), name)
+            self.assertEqual(copy, original, "%s: Resume/ copy is out of sync" % name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import time
+
+from tcl_script import Raw, command
+
+THEME_NAME = "deep_teal"
+PARENT_THEME = "clam"
+
+# --- Deep Teal palette ---
+BG_COLOR = "#f8f9fa"
+PRIMARY_COLOR = "#008080"       # DEEP TEAL
+TEXT_COLOR = "#000000"          # BLACK
+LIGHT_TEXT_COLOR = "#444444"
+BORDER_COLOR = "#dddddd"
+TAG_BG_LIGHT = "#e9ecef"
+BUTTON_BG_LIGHT = "#e0ffff"
+BUTTON_FG_DARK = "#004040"
+ALT_BG_COLOR = "#f5f5f5"        # Light gray for subtle alternating rows
+IMAGE_BG_COLOR = "#f0f0f0"
+MATCH_BG_COLOR = "#fff3b0"      # Pale yellow behind search matches
+
+# --- List of Pastel Colors for Hover Effect ---
+PASTEL_COLORS = [
+    "#FFC0CB",  # Pastel Pink
+    "#FFA07A",  # Light Salmon/Pastel Orange
+    "#F08080",  # Light Coral/Pastel Red
+    "#FFFACD",  # LemonChiffon/Pastel Yellow
+    "#90EE90",  # Light Green/Pastel Green
+    "#ADD8E6",  # Light Blue/Pastel Blue
+    "#DDA0DD",  # Plum/Pastel Purple
+]
+
+# --- Style Table: (style, configure options, map options) ---
+STYLES = [
+    ('TFrame', {'background': BG_COLOR}, None),
+    ('TLabel', {'background': BG_COLOR, 'foreground': TEXT_COLOR}, None),
+
+    # Custom Font Styles
+    ('Title.TLabel', {'font': ('Arial', 14, 'bold'), 'foreground': TEXT_COLOR}, None),
+    ('Header.TLabel', {'font': ('Arial', 15, 'bold'), 'foreground': TEXT_COLOR}, None),
+    ('Subtitle.TLabel', {'font': ('Arial', 10), 'foreground': PRIMARY_COLOR}, None),
+    ('Body.TLabel', {'font': ('Arial', 9), 'foreground': TEXT_COLOR}, None),
+    ('LightBody.TLabel', {'font': ('Arial', 9), 'foreground': LIGHT_TEXT_COLOR}, None),
+
+    ('WhiteBackground.TFrame', {'background': 'white', 'relief': 'flat', 'borderwidth': 0}, None),
+    ('WhiteBackground.TLabel', {'background': 'white', 'foreground': TEXT_COLOR}, None),
+
+    # Card Style for the Profile Header (Subtle border for an elevated look)
+    ('Card.TFrame', {'background': 'white', 'relief': 'solid', 'borderwidth': 1,
+                     'bordercolor': BORDER_COLOR}, None),
+
+    # Project Card Styling (CLEAN LOOK)
+    ('ProjectContainer.TFrame', {'background': 'white', 'borderwidth': 0, 'relief': 'flat', 'padding': 0}, None),
+    ('Project.TFrame', {'background': 'white', 'borderwidth': 0, 'relief': 'flat', 'padding': (0, 15)}, None),
+    ('LastProject.TFrame', {'background': 'white', 'borderwidth': 0, 'relief': 'flat', 'padding': (0, 15)}, None),
+    ('Project.TLabel', {'background': 'white', 'foreground': TEXT_COLOR}, None),
+    ('TechUsed.TLabel', {'font': ('Arial', 9, 'italic'), 'foreground': PRIMARY_COLOR, 'background': 'white'}, None),
+
+    # Skills Tag Styling (Default)
+    ('Tag.TLabel', {'background': TAG_BG_LIGHT, 'foreground': TEXT_COLOR, 'font': ('Arial', 9),
+                    'padding': (8, 4), 'relief': 'solid', 'borderwidth': 1, 'bordercolor': BORDER_COLOR}, None),
+    # Skills Tag Styling (Generic Hover Style for consistent border)
+    ('TagHover.TLabel', {'foreground': TEXT_COLOR, 'font': ('Arial', 9), 'padding': (8, 4),
+                         'relief': 'solid', 'borderwidth': 1, 'bordercolor': PRIMARY_COLOR}, None),
+
+    # Style for Experience Image Container
+    ('ExperienceImage.TFrame', {'background': IMAGE_BG_COLOR, 'borderwidth': 1, 'relief': 'solid', 'padding': 10}, None),
+    ('ExperienceImage.TLabel', {'background': IMAGE_BG_COLOR}, None),
+
+    # Table/Grid Styling for Activities (ALTERNATING ROW STYLES)
+    ('ActivityHeader.TLabel', {'font': ('Arial', 9, 'bold'), 'foreground': 'black', 'background': 'white'}, None),
+    ('ActivityBody.TLabel', {'font': ('Arial', 9), 'foreground': 'black', 'background': 'white'}, None),
+    ('ActivityAltBody.TLabel', {'font': ('Arial', 9), 'foreground': 'black', 'background': ALT_BG_COLOR}, None),
+
+    # Main Button Styling (IMPROVED RESPONSIVENESS)
+    ('TButton', {'font': ('Arial', 10, 'bold'), 'foreground': 'white', 'background': PRIMARY_COLOR,
+                 'padding': 10, 'relief': 'flat', 'borderwidth': 0},
+     {'background': [('active', '#006666'), ('pressed', '#004040')],
+      'foreground': [('pressed', 'white')]}),
+
+    # Secondary button (GitHub)
+    ('Secondary.TButton', {'font': ('Arial', 10), 'foreground': PRIMARY_COLOR, 'background': TAG_BG_LIGHT,
+                           'padding': 10, 'relief': 'flat', 'borderwidth': 0},
+     {'background': [('active', BORDER_COLOR), ('pressed', '#c0c0c0')],
+      'foreground': [('pressed', PRIMARY_COLOR)]}),
+
+    # Project button style
+    ('Project.TButton', {'font': ('Arial', 9), 'foreground': BUTTON_FG_DARK, 'background': BUTTON_BG_LIGHT,
+                         'relief': 'flat', 'borderwidth': 0, 'padding': (5, 5)},
+     {'background': [('active', '#c0fafa'), ('pressed', '#a0e8e8')]}),
+
+    # Tab button styling (Ensuring consistency)
+    ('Tab.TButton', {'background': 'white', 'foreground': TEXT_COLOR, 'font': ('Arial', 10),
+                     'relief': 'flat', 'padding': (10, 5)},
+     {'background': [('pressed', PRIMARY_COLOR), ('active', BORDER_COLOR)],
+      'foreground': [('pressed', 'white'), ('active', PRIMARY_COLOR)],
+      'font': [('pressed', ('Arial', 10, 'bold')), ('active', ('Arial', 10, 'bold'))]}),
+
+    # Active Tab Style for a stronger indicator
+    ('ActiveTab.TButton', {'background': PRIMARY_COLOR, 'foreground': 'white', 'font': ('Arial', 10, 'bold'),
+                           'relief': 'flat', 'padding': (10, 5)}, None),
+]
+
+# --- Preallocated hover styles, one per pastel colour ---
+# Font, padding, relief and border width match Tag.TLabel exactly, so swapping
+# a tag between these styles never changes its requested size (no relayout).
+TAG_METRICS = {'font': ('Arial', 9), 'padding': (8, 4), 'relief': 'solid', 'borderwidth': 1}
+HOVER_STYLES = ['TagHover%d.TLabel' % index for index in range(len(PASTEL_COLORS))]
+STYLES.extend(
+    (style, dict(TAG_METRICS, background=color, foreground=TEXT_COLOR, bordercolor=PRIMARY_COLOR), None)
+    for style, color in zip(HOVER_STYLES, PASTEL_COLORS)
+)
+
+# Search matches: same metrics as Tag.TLabel, so highlighting never reflows the tags
+STYLES.append(('TagMatch.TLabel', dict(TAG_METRICS, background=MATCH_BG_COLOR, foreground=TEXT_COLOR,
+                                       bordercolor=PRIMARY_COLOR), None))
+
+# Card.TFrame needs an explicit border element so the solid border is drawn
+LAYOUTS = [
+    ('Card.TFrame', "TFrame.border -sticky nswe -children "
+                    "{TFrame.padding -sticky nswe -children {TFrame.label -sticky nswe}}"),
+]
+
+
+# A derived theme inherits the parent's elements and layouts but not its style
+# settings, so the parent's settings for the base styles we use are copied first.
+INHERITED_STYLES = ['.', 'TButton', 'TLabel', 'TFrame', 'TScrollbar', 'TSeparator', 'TEntry', 'TCombobox']
+
+INHERIT_SCRIPT = """apply {{parent styles} {
+    foreach style $styles {
+        set config [ttk::style theme settings $parent [list ttk::style configure $style]]
+        if {[llength $config]} {ttk::style configure $style {*}$config}
+        set state_map [ttk::style theme settings $parent [list ttk::style map $style]]
+        if {[llength $state_map]} {ttk::style map $style {*}$state_map}
+    }
+}}"""
+
+
+# --- Build the whole theme as one Tcl script ---
+def theme_script():
+    lines = [command(Raw(INHERIT_SCRIPT), PARENT_THEME, INHERITED_STYLES)]
+    for style, config, state_map in STYLES:
+        lines.append(command("ttk::style", "configure", style, **config))
+        if state_map:
+            # Each state map is a flat {state value state value ...} list
+            flat = {name: [item for pair in specs for item in pair] for name, specs in state_map.items()}
+            lines.append(command("ttk::style", "map", style, **flat))
+    for style, layout in LAYOUTS:
+        lines.append(command("ttk::style", "layout", style, Raw("{" + layout + "}")))
+    settings = "\n".join(lines)
+    return command("ttk::style", "theme", "create", THEME_NAME, "-parent", PARENT_THEME,
+                   "-settings", Raw("{\n" + settings + "\n}"))
+
+
+_script_cache = []
+setup_times_ms = []
+
+
+# --- Register (once per Tcl interpreter) and activate the theme ---
+# Every window sharing an interpreter reuses the registered theme; only a new
+# Tk() root pays for the single bulk evaluation.
+def apply_theme(master):
+    start = time.perf_counter()
+    tk = master.tk
+    if THEME_NAME not in tk.splitlist(tk.call("ttk::style", "theme", "names")):
+        if not _script_cache:
+            _script_cache.append(theme_script())
+        tk.eval(_script_cache[0])
+    # ttk::setTheme (what Style.theme_use calls) also sends <<ThemeChanged>>
+    tk.call("ttk::setTheme", THEME_NAME)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    setup_times_ms.append(elapsed_ms)
+    return elapsed_ms
+
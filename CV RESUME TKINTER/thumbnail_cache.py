@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+
+
+# --- Default Cache Location (per user, shared by every app instance) ---
+def cache_root():
+    override = os.environ.get("CV_RESUME_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "cv_resume")
+
+
+def default_cache_dir():
+    return os.path.join(cache_root(), "thumbnails")
+
+
+# --- Persistent Thumbnail Cache ---
+# Resized images are stored as raw pixel data, keyed by a hash of the source
+# path, its mtime and size, the target box, the resample filter and a variant
+# tag (e.g. the letterbox colour), so a warm start never decodes or resamples.
+class ThumbnailCache:
+    FILE_SUFFIX = ".thumb"
+    STATS_FILE = "stats.json"
+
+    def __init__(self, cache_dir=None, max_bytes=64 * 1024 * 1024):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        # Loader workers share one cache: the counters only change under the lock
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError:
+            # Read-only home directory: behave as an always-missing cache
+            self.cache_dir = None
+
+    # --- Key Construction (raises FileNotFoundError for missing sources) ---
+    def make_key(self, source_path, box, resample, variant=""):
+        st = os.stat(source_path)
+        ident = "|".join([
+            os.path.abspath(source_path),
+            str(st.st_mtime_ns),
+            str(st.st_size),
+            "%dx%d" % tuple(box),
+            str(int(resample)),
+            variant,
+        ])
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def _count(self, **deltas):
+        with self.lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + self.FILE_SUFFIX)
+
+    # --- Lookup ---
+    def get(self, key):
+        if self.cache_dir is None:
+            self._count(misses=1)
+            return None
+        from PIL import Image
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = f.readline().decode("ascii").split()
+                mode, width, height = header[0], int(header[1]), int(header[2])
+                image = Image.frombytes(mode, (width, height), f.read())
+        except FileNotFoundError:
+            self._count(misses=1)
+            return None
+        except (OSError, ValueError, IndexError):
+            # Truncated or foreign file: drop it and rebuild
+            self._count(errors=1, misses=1)
+            self._remove(path)
+            return None
+        # Touch so eviction follows least-recently-used order
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(hits=1)
+        return image
+
+    # --- Store (atomic write, then enforce the size budget) ---
+    def put(self, key, image):
+        if self.cache_dir is None:
+            return
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGBA")
+        path = self._path(key)
+        tmp_path = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(("%s %d %d\n" % (image.mode, image.width, image.height)).encode("ascii"))
+                f.write(image.tobytes())
+            os.replace(tmp_path, path)
+        except OSError:
+            self._count(errors=1)
+            self._remove(tmp_path)
+            return
+        self.evict()
+
+    def get_or_create(self, key, builder):
+        image = self.get(key)
+        if image is None:
+            image = builder()
+            self.put(key, image)
+        return image
+
+    # --- Size-Bounded Eviction (oldest access first) ---
+    def evict(self):
+        if self.cache_dir is None:
+            return
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(self.FILE_SUFFIX):
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError:
+            return
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                self._count(evictions=1)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self):
+        if self.cache_dir is None:
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.FILE_SUFFIX):
+                self._remove(os.path.join(self.cache_dir, name))
+
+    # --- Hit/Miss Counters ---
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
+
+    # Fold this process's counters into the cumulative totals on disk
+    def record_stats(self):
+        if self.cache_dir is None:
+            return None
+        # Take and reset the counters in one step so concurrent updates land in the next record
+        with self.lock:
+            counters = {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "errors": self.errors}
+            self.hits = self.misses = self.evictions = self.errors = 0
+        path = os.path.join(self.cache_dir, self.STATS_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                totals = json.load(f)
+        except (OSError, ValueError):
+            totals = {}
+        for name, value in counters.items():
+            totals[name] = totals.get(name, 0) + value
+        totals["launches"] = totals.get("launches", 0) + 1
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(totals, f, indent=2)
+        except OSError:
+            pass
+        return totals
+
+
+# --- Command-line report: python thumbnail_cache.py [--clear] ---
+if __name__ == "__main__":
+    cache = ThumbnailCache()
+    if cache.cache_dir is None:
+        print("Thumbnail cache directory is not writable.")
+        sys.exit(1)
+    if "--clear" in sys.argv[1:]:
+        cache.clear()
+    files = [n for n in os.listdir(cache.cache_dir) if n.endswith(ThumbnailCache.FILE_SUFFIX)]
+    used = sum(os.path.getsize(os.path.join(cache.cache_dir, n)) for n in files)
+    print("Cache directory: %s" % cache.cache_dir)
+    print("Entries: %d (%.1f KB of %.1f KB)" % (len(files), used / 1024, cache.max_bytes / 1024))
+    try:
+        with open(os.path.join(cache.cache_dir, ThumbnailCache.STATS_FILE), encoding="utf-8") as f:
+            print("Cumulative counters: %s" % json.dumps(json.load(f)))
+    except (OSError, ValueError):
+        print("Cumulative counters: none recorded yet")
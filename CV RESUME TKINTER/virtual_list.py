@@ -0,0 +1,138 @@
+from tkinter import ttk
+
+
+# --- Virtualized List ---
+# A frame whose requested height is the sum of all row heights (estimated until
+# a row has been measured once), but which only materializes the rows that are
+# inside, or within `overscan` pixels of, the host canvas's visible yview window.
+# Rows are placed at absolute offsets and recycled through a pool as they scroll
+# out of view, so widget count stays flat no matter how long `items` is.
+#
+#   create_row(parent) -> widget       builds an empty row widget
+#   update_row(widget, item, index)    fills a (possibly recycled) row with data
+class VirtualList(ttk.Frame):
+    def __init__(self, parent, canvas, items, create_row, update_row,
+                 estimated_height=100, overscan=300, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.canvas = canvas
+        self.create_row = create_row
+        self.update_row = update_row
+        self.estimated_height = estimated_height
+        self.overscan = overscan
+        self.items = []
+        self.heights = []
+        self.offsets = [0]
+        self.visible = {}   # index -> row widget
+        self.pool = []
+        self.refresh_id = None
+        self.unmeasured = {}    # index -> row filled since the last measure pass
+        self.measure_id = None
+        self.rows_created = 0
+        self.bind("<Map>", lambda e: self.schedule_refresh(), add="+")
+        self.set_items(items)
+
+    # --- Data ---
+    def set_items(self, items):
+        self.items = list(items)
+        self.heights = [None] * len(self.items)
+        self.unmeasured = {}
+        for index in list(self.visible):
+            self._release(index)
+        self._recompute_offsets()
+        self.schedule_refresh()
+
+    def _row_height(self, index):
+        height = self.heights[index]
+        return self.estimated_height if height is None else height
+
+    def _recompute_offsets(self):
+        offsets = [0]
+        for index in range(len(self.items)):
+            offsets.append(offsets[-1] + self._row_height(index))
+        self.offsets = offsets
+        # The frame reserves the full list height so the canvas scrollregion is right
+        self.configure(height=max(1, offsets[-1]))
+
+    def _index_at(self, y):
+        # Binary search over the prefix sums
+        lo, hi = 0, len(self.items)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.offsets[mid + 1] <= y:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # --- Visible window (in this frame's own coordinates) ---
+    def visible_range(self):
+        top = self.canvas.winfo_rooty() - self.winfo_rooty() - self.overscan
+        bottom = top + self.canvas.winfo_height() + 2 * self.overscan
+        first = self._index_at(max(0, top))
+        last = min(len(self.items), self._index_at(max(0, bottom)) + 1)
+        return first, last
+
+    def schedule_refresh(self):
+        # Many scroll/resize notifications per frame collapse into one refresh
+        if self.refresh_id is None:
+            self.refresh_id = self.after_idle(self.refresh)
+
+    def refresh(self):
+        self.refresh_id = None
+        if not self.winfo_ismapped() or not self.items:
+            return
+        first, last = self.visible_range()
+        for index in [i for i in self.visible if i < first or i >= last]:
+            self._release(index)
+
+        for index in range(first, last):
+            if index not in self.visible:
+                row = self.pool.pop() if self.pool else self._new_row()
+                self.update_row(row, self.items[index], index)
+                self.visible[index] = row
+                self.unmeasured[index] = row
+        self._place_rows()
+        # Freshly filled rows are measured on the next idle pass, after their geometry
+        # managers have computed the requested size
+        if self.unmeasured and self.measure_id is None:
+            self.measure_id = self.after_idle(self.measure)
+
+    def _place_rows(self):
+        for index, row in self.visible.items():
+            row.place(x=0, y=self.offsets[index], relwidth=1, height=self._row_height(index))
+
+    # A changed height shifts everything below it
+    def measure(self):
+        self.measure_id = None
+        rows, self.unmeasured = self.unmeasured, {}
+        changed = False
+        for index, row in rows.items():
+            if self.visible.get(index) is not row:
+                continue
+            height = row.winfo_reqheight()
+            if height != self.heights[index]:
+                self.heights[index] = height
+                changed = True
+        if changed:
+            self._recompute_offsets()
+            self._place_rows()
+            # Rows may have moved into (or out of) the window
+            self.schedule_refresh()
+
+    def _new_row(self):
+        self.rows_created += 1
+        return self.create_row(self)
+
+    def _release(self, index):
+        row = self.visible.pop(index)
+        row.place_forget()
+        self.pool.append(row)
+
+    def stats(self):
+        return {
+            "items": len(self.items),
+            "materialized": len(self.visible),
+            "pooled": len(self.pool),
+            "rows_created": self.rows_created,
+            "measured": sum(1 for h in self.heights if h is not None),
+        }
@@ -5,6 +5,9 @@ from PIL import Image, ImageTk
 import os 
 import random 
 
+# Deep Teal theme (a copy of the main app's theme.py, next to this file)
+import theme
+
 # --- New Tooltip Class for Hover Effects ---
 class Tooltip:
     def __init__(self, widget, text):
@@ -67,117 +70,24 @@ class ResumeApp:
         self.experience_images = {} 
 
         # --- Styling & Colors (Deep Teal Theme) ---
-        s = ttk.Style()
-        s.theme_use('clam') 
+        # Same Deep Teal theme as the main app (theme.py here is a checked copy of it)
+        theme.apply_theme(master)
         
         # General colors
-        self.bg_color = "#f8f9fa"       
-        self.primary_color = "#008080"  # DEEP TEAL
-        self.text_color = "#000000"     # BLACK
-        self.light_text_color = "#444444" 
-        self.border_color = "#dddddd"   
-        self.tag_bg_light = "#e9ecef"   
-        self.button_bg_light = "#e0ffff" 
-        self.button_fg_dark = "#004040"  
+        self.bg_color = theme.BG_COLOR
+        self.primary_color = theme.PRIMARY_COLOR
+        self.text_color = theme.TEXT_COLOR
+        self.light_text_color = theme.LIGHT_TEXT_COLOR
+        self.border_color = theme.BORDER_COLOR
+        self.tag_bg_light = theme.TAG_BG_LIGHT
+        self.button_bg_light = theme.BUTTON_BG_LIGHT
+        self.button_fg_dark = theme.BUTTON_FG_DARK
 
         # --- List of Pastel Colors for Hover Effect ---
-        self.pastel_colors = [
-            "#FFC0CB",  # Pastel Pink
-            "#FFA07A",  # Light Salmon/Pastel Orange
-            "#F08080",  # Light Coral/Pastel Red
-            "#FFFACD",  # LemonChiffon/Pastel Yellow
-            "#90EE90",  # Light Green/Pastel Green
-            "#ADD8E6",  # Light Blue/Pastel Blue
-            "#DDA0DD",  # Plum/Pastel Purple
-        ]
+        self.pastel_colors = theme.PASTEL_COLORS
 
         master.configure(bg=self.bg_color)
-        s.configure('TFrame', background=self.bg_color)
-        s.configure('TLabel', background=self.bg_color, foreground=self.text_color)
-        
-        # --- Custom Font Styles ---
-        s.configure('Title.TLabel', font=('Arial', 14, 'bold'), foreground=self.text_color)
-        s.configure('Header.TLabel', font=('Arial', 15, 'bold'), foreground=self.text_color) 
-        s.configure('Subtitle.TLabel', font=('Arial', 10), foreground=self.primary_color)
-        s.configure('Body.TLabel', font=('Arial', 9), foreground=self.text_color)
-        s.configure('LightBody.TLabel', font=('Arial', 9), foreground=self.light_text_color)
-
-
-        s.configure('WhiteBackground.TFrame', background='white', relief='flat', borderwidth=0)
-        s.configure('WhiteBackground.TLabel', background='white', foreground=self.text_color)
-        
-        # --- Project Card Styling (CLEAN LOOK) ---
-        s.configure('ProjectContainer.TFrame', background='white', borderwidth=0, relief='flat', padding=0) 
-        s.configure('Project.TFrame', background='white', borderwidth=0, relief='flat', padding=(0, 15)) 
-        s.configure('LastProject.TFrame', background='white', borderwidth=0, relief='flat', padding=(0, 15)) 
-
-        s.configure('Project.TLabel', background='white', foreground=self.text_color)
-        s.configure('TechUsed.TLabel', font=('Arial', 9, 'italic'), foreground=self.primary_color, background='white')
-        
-        # --- Skills Tag Styling (Default) ---
-        s.configure('Tag.TLabel', 
-                    background=self.tag_bg_light, 
-                    foreground=self.text_color, 
-                    font=('Arial', 9), 
-                    padding=(8, 4), 
-                    relief='solid', 
-                    borderwidth=1, 
-                    bordercolor=self.border_color 
-                   )
-        
-        # --- Skills Tag Styling (Generic Hover Style for consistent border) ---
-        s.configure('TagHover.TLabel', 
-                    foreground=self.text_color, 
-                    font=('Arial', 9), 
-                    padding=(8, 4), 
-                    relief='solid', 
-                    borderwidth=1, 
-                    bordercolor=self.primary_color 
-                   )
-
-        # Style for Experience Image Container 
-        s.configure('ExperienceImage.TFrame', background='#f0f0f0', borderwidth=1, relief='solid', padding=10) 
-        s.configure('ExperienceImage.TLabel', background='#f0f0f0') 
-        
-        # --- Table/Grid Styling for Activities ---
-        s.configure('ActivityHeader.TLabel', font=('Arial', 9, 'bold'), foreground='black', background='white')
-        s.configure('ActivityBody.TLabel', font=('Arial', 9), foreground='black', background='white')
-
-
-        # --- Main Button Styling (IMPROVED RESPONSIVENESS) ---
-        s.configure('TButton', font=('Arial', 10, 'bold'), foreground='white', background=self.primary_color,
-                    padding=10, relief='flat', borderwidth=0)
-        s.map('TButton', 
-              background=[('active', '#006666'), ('pressed', '#004040')], 
-              foreground=[('pressed', 'white')]
-             ) 
-
-        # Secondary button (GitHub) 
-        s.configure('Secondary.TButton', font=('Arial', 10), foreground=self.primary_color, background=self.tag_bg_light,
-                    padding=10, relief='flat', borderwidth=0)
-        s.map('Secondary.TButton', 
-              background=[('active', self.border_color), ('pressed', '#c0c0c0')], 
-              foreground=[('pressed', self.primary_color)]
-             )
-
-
-        # Project button style
-        s.configure('Project.TButton', font=('Arial', 9), foreground=self.button_fg_dark, background=self.button_bg_light,
-                    relief='flat', borderwidth=0, padding=(5, 5))
-        s.map('Project.TButton', 
-              background=[('active', '#c0fafa'), ('pressed', '#a0e8e8')]
-             )
-
-
-        # --- Tab button styling (Ensuring consistency) ---
-        s.configure('Tab.TButton', background='white', foreground=self.text_color, font=('Arial', 10),
-                    relief='flat', padding=(10, 5))
-        s.map('Tab.TButton',
-              background=[('pressed', self.primary_color), ('active', self.border_color)],
-              foreground=[('pressed', 'white'), ('active', self.primary_color)], 
-              font=[('pressed', ('Arial', 10, 'bold')), ('active', ('Arial', 10, 'bold'))]
-             )
-        
+
         self.create_widgets()
 
 